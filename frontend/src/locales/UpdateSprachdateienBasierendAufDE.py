@@ -1,52 +1,58 @@
 import json
 import os
-import argparse
-from argparse import RawTextHelpFormatter
-import subprocess
 import sys
 import re
+import time
 from typing import Dict, Any, Set
 
-# Optionaler Import nur bei Bedarf
-# (vermeidet harten Import-Fehler, wenn nur DeepL genutzt wird)
-try:
-    from openai import OpenAI  # type: ignore
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore
-
-BASE_LANG = "de"
-TARGET_LANGS = ["en", "nl", "es", "fr", "it", "fi", "hr", "ru"]
-# Standard-Basispfad: Verzeichnis dieser Datei, damit Aufruf von überall funktioniert
-BASE_PATH = os.path.dirname(os.path.abspath(__file__))
-# Verzeichnis für Hash-Manifeste
-HASH_DIR = os.path.join(BASE_PATH, ".i18n_hash")
-
+# Schwere Module (Provider-SDKs, urllib, subprocess, argparse) werden erst dort
+# importiert, wo sie gebraucht werden - ein reiner DeepL-Lauf lädt kein openai, und
+# sync_i18n_hashes.py/Tests importieren nur den leichten Kern (siehe i18n_core.py).
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_json  # noqa: E402
+import i18n_core  # noqa: E402
+from i18n_budget import SCHEDULER, TIER_NAMES, QuotaExceeded, load_checkpoint, load_unused_keys  # noqa: E402
+from i18n_cassette import CASSETTE  # noqa: E402
+from i18n_events import EVENTS  # noqa: E402
+from i18n_metrics import METRICS  # noqa: E402
+from i18n_profile import PROFILE, cprofile_summary  # noqa: E402
+from i18n_plural import PLURAL_KEY_RE, build_unit, expand_families, parse_unit, plural_families, target_categories  # noqa: E402
+from i18n_shard import SHARD, parse_shard_spec  # noqa: E402
+from i18n_source_sync import SOURCES, sync_sources  # noqa: E402
+from i18n_status import record_failures  # noqa: E402
+from i18n_terms import TERMS, load_term_list  # noqa: E402
+from i18n_validate import VALIDATION, extract_tokens, length_ratio_failure, structural_failure  # noqa: E402
+from i18n_json import WRITE_STATS  # noqa: E402,F401  (Abschluss-Zusammenfassung, Tests)
+from i18n_core import (  # noqa: E402,F401  (bewusst als Modul-Attribute re-exportiert)
+    BASE_LANG,
+    TARGET_LANGS,
+    BASE_PATH,
+    load_json,
+    save_json,
+    matches_globs,
+    split_globs,
+    _collect_leaf_paths,
+    _flatten_dict,
+    _sha256,
+)
 
-def load_json(file: str) -> Dict[str, Any]:
-    """Lade eine JSON-Datei."""
-    try:
-        with open(file, encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"⚠️ Datei nicht gefunden: {file}")
-        return {}
-    except json.JSONDecodeError:
-        print(f"⚠️ Ungültiges JSON in: {file}")
-        return {}
+# Verzeichnis für Hash-Manifeste
+HASH_DIR = i18n_core.DEFAULT_HASH_DIR
 
 
-def save_json(file: str, data: Dict[str, Any]) -> None:
-    """Speichere eine JSON-Datei."""
+def _openai_client_class():
+    """Importiert das openai-SDK erst beim ersten OpenAI-Aufruf (allein der Import kostet
+    spürbar Startzeit und wird bei DeepL-Läufen nie gebraucht). None, wenn nicht installiert."""
     try:
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"💾 Datei gespeichert: {file}")
-    except Exception as e:
-        print(f"❌ Fehler beim Speichern von {file}: {e}")
+        from openai import OpenAI  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return OpenAI
 
 
 def translate_text_openai(text: str, target_lang: str, api_key: str) -> str | None:
     """Übersetze via OpenAI Chat Completions."""
+    OpenAI = _openai_client_class()
     if not OpenAI:
         raise RuntimeError(
             "openai-Paket ist nicht installiert. Bitte 'pip install openai' ausführen oder Provider 'deepl' verwenden."
@@ -78,7 +84,6 @@ def translate_text_deepl(text: str, target_lang: str, api_key: str, api_url: str
     Bei Fehlern wird eine Exception geworfen, damit die aktuelle Sprache abgebrochen werden kann.
     Bei 429 (Rate Limit) wird mit Backoff automatisch erneut versucht, statt sofort abzubrechen.
     """
-    import time
     import urllib.request
     import urllib.error
 
@@ -106,7 +111,8 @@ def translate_text_deepl(text: str, target_lang: str, api_key: str, api_url: str
 
     max_retries = 5
     backoff = 2.0
-    time.sleep(0.25)  # kleine, proaktive Drosselung, um 429s von vornherein seltener zu machen
+    with PROFILE.phase("throttle"):
+        time.sleep(0.25)  # kleine, proaktive Drosselung, um 429s von vornherein seltener zu machen
     for attempt in range(max_retries):
         req = urllib.request.Request(url, data=data, method="POST")
         req.add_header("Content-Type", "application/json")
@@ -119,10 +125,15 @@ def translate_text_deepl(text: str, target_lang: str, api_key: str, api_url: str
                     return (trans_list[0].get("text") or text).strip()
                 raise RuntimeError("DeepL: leere Antwort erhalten")
         except urllib.error.HTTPError as e:
+            if e.code == 456:
+                raise QuotaExceeded("DeepL: 456 Quota exceeded - Zeichen-Kontingent erschöpft")
             if e.code == 429:
                 if attempt < max_retries - 1:
-                    print(f"INFO: DeepL 429 (Rate Limit) - warte {backoff:.0f}s und versuche erneut ({attempt + 1}/{max_retries})")
-                    time.sleep(backoff)
+                    EVENTS.emit("retried", provider="deepl", target=target_lang, status=429, attempt=attempt + 1, wait_s=backoff)
+                    METRICS.retry("deepl", target_lang.lower(), status=429)
+                    EVENTS.note("rateLimitRetry", f"INFO: DeepL 429 (Rate Limit) - warte {backoff:.0f}s und versuche erneut ({attempt + 1}/{max_retries})")
+                    with PROFILE.phase("backoff"):
+                        time.sleep(backoff)
                     backoff *= 2
                     continue
                 raise RuntimeError("DeepL: 429 Too Many Requests (Rate Limit) - auch nach mehreren Versuchen. Abbruch der aktuellen Sprache.")
@@ -139,6 +150,40 @@ def translate_text(
     provider: str,
     openai_key: str | None,
     deepl_key: str | None,
+) -> str | None:
+    # Kassette (--cassette): Treffer kosten weder Provider-Aufruf noch Zeichen-Kontingent
+    # und zaehlen deshalb als cache_hits, nicht als requests.
+    cached = CASSETTE.lookup(provider, target_lang, text)
+    if cached is not None:
+        METRICS.add(provider, target_lang, "cache_hits")
+        EVENTS.emit("cached", provider=provider, target=target_lang, chars=len(text), source="cassette")
+        return cached
+    started = time.perf_counter()
+    result = None
+    try:
+        with PROFILE.phase("provider"):
+            result = _translate_text_via(text, target_lang, provider, openai_key, deepl_key)
+        if result is not None:
+            SCHEDULER.charge(len(text))
+            CASSETTE.store(provider, target_lang, text, result)
+        return result
+    except QuotaExceeded as e:
+        # Sauberer Halt statt "Abbruch für Sprache": alle weiteren Keys werden
+        # zurückgestellt und im Checkpoint vermerkt (siehe i18n_budget.py).
+        if SCHEDULER.stop_reason is None:
+            EVENTS.say(f"⏸️ {e} - weitere Keys werden zurückgestellt.")
+        SCHEDULER.stop("quota")
+        return None
+    finally:
+        METRICS.request(provider, target_lang, len(text), time.perf_counter() - started, ok=result is not None)
+
+
+def _translate_text_via(
+    text: str,
+    target_lang: str,
+    provider: str,
+    openai_key: str | None,
+    deepl_key: str | None,
 ) -> str | None:
     if provider == "openai":
         if not openai_key:
@@ -175,7 +220,8 @@ def is_original_key(path: str) -> bool:
 
 def _handle_skip_original(path: str, counters: Dict[str, int] | None = None) -> None:
     # Log and increment skipped counter; raise and catch for UI-compat string
-    print(f"Überspringe Übersetzung für Original-Key: {path}")
+    EVENTS.emit("skipped", path=path, reason="original")
+    EVENTS.note("skipOriginal", f"Überspringe Übersetzung für Original-Key: {path}")
     if counters is not None:
         counters['skippedOriginalKeysCount'] = counters.get('skippedOriginalKeysCount', 0) + 1
     try:
@@ -216,7 +262,7 @@ def _preserve_special_chars(
     """
     if not isinstance(source, str):
         return translated
-    specials = _extract_special_chars(source)
+    specials = SOURCE_ANALYSIS.specials(source)
     if not specials:
         return translated
     translated_str = translated if isinstance(translated, str) else str(translated)
@@ -226,7 +272,8 @@ def _preserve_special_chars(
             counters['preservedSpecialCharKeys'] = counters.get('preservedSpecialCharKeys', 0) + 1
         if failed_paths is not None:
             failed_paths.add(path)
-        print(f"INFO: Bewahre Sonderzeichen für {path}: {''.join(missing)} → Originaltext übernommen")
+        EVENTS.emit("failed", path=path, reason="special_chars", missing="".join(missing))
+        EVENTS.note("preservedSpecialChars", f"INFO: Bewahre Sonderzeichen für {path}: {''.join(missing)} → Originaltext übernommen")
         return source
     return translated_str
 
@@ -256,13 +303,230 @@ def _looks_like_untranslated_echo(source: Any, translated: str) -> bool:
     """
     if not isinstance(source, str) or not isinstance(translated, str):
         return False
-    src = source.strip()
-    tgt = translated.strip()
-    if src != tgt:
-        return False
-    if len(src) < ECHO_MIN_LEN or " " not in src:
-        return False
-    return True
+    src = SOURCE_ANALYSIS.echo_source(source)
+    return src is not None and translated.strip() == src
+
+
+class SourceAnalysisCache:
+    """Lauf-bezogener Cache der quelltextseitigen Analyse, Schlüssel ist der Quelltext.
+
+    In Phase B durchläuft derselbe EN-Pivot-Text jedes geänderten Keys sonst 7-mal (einmal
+    je Zielsprache) dieselbe Analyse: Sonderzeichen-Regex, Echo-Schwelle und - für jeden
+    Leaf-Key jedes Namespaces - _sha256 für Drift-Erkennung und Manifest. Nichts davon
+    hängt von der Zielsprache ab. Mit dem Cache wächst der CPU-Aufwand mit der Zahl
+    EINDEUTIGER Quelltexte statt mit Texten × Sprachen.
+
+    Wird in _run() zu Beginn jedes Laufs geleert (wie i18n_json.DOCUMENTS), außer in den
+    Folgeläufen von --watch.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self._digests: Dict[str, str] = {}
+        self._specials: Dict[str, tuple[str, ...]] = {}
+        self._echo: Dict[str, str | None] = {}
+        self._masks: Dict[tuple[str, bool], tuple[str, dict[str, str]]] = {}
+        self._tokens: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, text: str) -> str:
+        """_sha256(text) für Hash-Manifeste."""
+        d = self._digests.get(text)
+        if d is None:
+            self.misses += 1
+            d = self._digests[text] = _sha256(text)
+        else:
+            self.hits += 1
+        return d
+
+    def specials(self, text: str) -> tuple[str, ...]:
+        """Sonderzeichen (siehe _extract_special_chars) in Reihenfolge des ersten Auftretens."""
+        found = self._specials.get(text)
+        if found is None:
+            self.misses += 1
+            found = self._specials[text] = tuple(dict.fromkeys(SPECIAL_CHAR_RE.findall(text)))
+        else:
+            self.hits += 1
+        return found
+
+    def echo_source(self, text: str) -> str | None:
+        """Getrimmter Quelltext, falls er für die Echo-Erkennung lang genug ist, sonst None."""
+        try:
+            src = self._echo[text]
+        except KeyError:
+            self.misses += 1
+            stripped = text.strip()
+            src = self._echo[text] = stripped if len(stripped) >= ECHO_MIN_LEN and " " in stripped else None
+        else:
+            self.hits += 1
+        return src
+
+    def mask(self, text: str, target_lang: str) -> tuple[str, dict[str, str]]:
+        """mask_source_text(text, target_lang); die Maskierung hängt nur von Phase A/B ab.
+        Das Platzhalter-Dict wird geteilt und darf nicht verändert werden."""
+        key = (text, target_lang == "en")
+        masked = self._masks.get(key)
+        if masked is None:
+            self.misses += 1
+            masked = self._masks[key] = mask_source_text(text, target_lang)
+        else:
+            self.hits += 1
+        return masked
+
+    def tokens(self, text: str) -> Dict[str, Any]:
+        """i18next-Struktur des Quelltexts (siehe i18n_validate.extract_tokens)."""
+        found = self._tokens.get(text)
+        if found is None:
+            self.misses += 1
+            found = self._tokens[text] = extract_tokens(text)
+        else:
+            self.hits += 1
+        return found
+
+    def summary(self) -> str:
+        n = len(self._digests) + len(self._specials) + len(self._echo) + len(self._masks) + len(self._tokens)
+        return f"{n} Analysen, {self.hits} Wiederverwendungen"
+
+
+SOURCE_ANALYSIS = SourceAnalysisCache()
+
+
+def _lost_placeholders(translated_raw: str, placeholders: dict[str, str]) -> tuple[str, str] | None:
+    """("keep_placeholder", Detail), falls der Provider maskierte Begriffe verschluckt hat."""
+    if not placeholders:
+        return None
+    returned = {f"__KEEP_EN_TERM_{n}__" for n in KEEP_EN_PLACEHOLDER_RE.findall(translated_raw)}
+    lost = [p for p in placeholders if p not in returned]
+    if not lost:
+        return None
+    return "keep_placeholder", " ".join(f"-{placeholders[p]}" for p in lost)
+
+
+def _translate_plural_family(
+    sources: Dict[str, str],
+    stem_path: str,
+    lang: str,
+    provider: str,
+    openai_key: str | None,
+    deepl_key: str | None,
+    counters: Dict[str, int] | None,
+    failed_paths: Set[str] | None,
+) -> Dict[str, str] | None:
+    """Übersetzt eine Pluralfamilie ({kategorie: quelltext}) als EINEN Provider-Aufruf und
+    liefert alle Formen, die lang braucht (siehe i18n_plural.py), oder None, wenn der
+    Aufruf scheitert. Scheitert eine Form, gilt die ganze Familie als nicht erledigt."""
+    unit = build_unit(sources, lang)
+    if unit is None:
+        # Mehrzeilige Quellform - plural_families liefert solche Familien nicht, die
+        # Mitglieder laufen als Einzel-Blätter. Kein Provider-Aufruf ohne zuordenbare Antwort.
+        return None
+    member_paths = [f"{stem_path}_{cat}" for cat, _, _ in unit]
+    protected, placeholders = SOURCE_ANALYSIS.mask("\n".join(line for _, line, _ in unit if line is not None), lang)
+    translated_raw = translate_text(protected, lang, provider, openai_key, deepl_key)
+    if translated_raw is None:
+        if failed_paths is not None:
+            failed_paths.update(member_paths)
+        EVENTS.emit("failed", path=stem_path, reason="provider")
+        return None
+
+    failure = _lost_placeholders(translated_raw, placeholders)
+    forms = parse_unit(unit, restore_parenthesized_english(translated_raw, placeholders), sources) if failure is None else None
+    if isinstance(forms, str):
+        failure = ("plural", forms)
+    if failure is not None:
+        check, detail = failure
+        VALIDATION.record(check)
+        if failed_paths is not None:
+            failed_paths.update(member_paths)
+        EVENTS.emit("failed", path=stem_path, reason=check, detail=detail)
+        EVENTS.note("validationFailed", f"INFO: Validierung '{check}' für Pluralfamilie {stem_path} fehlgeschlagen ({detail}) → nicht übernommen")
+        return None
+
+    family_failed: Set[str] = set()
+    result: Dict[str, str] = {}
+    for cat, line, _ in unit:
+        if line is not None:
+            result[cat] = _validate_translation(sources.get(cat, sources["other"]), forms[cat], {}, f"{stem_path}_{cat}", counters, family_failed)
+    for cat, line, _ in unit:
+        if line is None:
+            result[cat] = result["other"]
+    if family_failed:
+        if failed_paths is not None:
+            failed_paths.update(member_paths)
+    else:
+        for path in member_paths:
+            if path not in VALIDATION.suspicious:
+                EVENTS.emit("translated", path=path, chars=len(protected))
+    return result
+
+
+def _validate_translation(
+    source: Any,
+    translated_raw: str,
+    placeholders: dict[str, str],
+    path: str,
+    counters: Dict[str, int] | None,
+    failed_paths: Set[str],
+) -> str:
+    """Validierungs-Stufe für ein Provider-Ergebnis: setzt Platzhalter zurück und führt
+    alle Prüfungen aus i18n_validate.CHECKS in einem Durchgang aus. Gibt den zu
+    schreibenden Text zurück.
+
+    - keep_placeholder/interpolation/tags/nesting: die Übersetzung ist strukturell kaputt
+      (i18next würde zur Laufzeit rohe Platzhalter zeigen) → Quelltext übernehmen, wie
+      beim Sonderzeichen-Fallback.
+    - special_chars: siehe _preserve_special_chars.
+    - echo: Übersetzung bleibt stehen, ist aber verdächtig.
+    Jeder dieser Fehler landet mit Reason-Code in failed_paths (kein Manifest-Eintrag,
+    nächster Lauf versucht es erneut), im failed-Ereignis und in VALIDATION.
+    - length_ratio: Übersetzung bleibt stehen und gilt als erledigt (Manifest-Eintrag -
+    derselbe Quelltext liefert beim nächsten Versuch dieselbe Antwort); gemeldet über das
+    failed-Ereignis, VALIDATION und VALIDATION.flag (→ failed.json).
+    """
+    translated = restore_parenthesized_english(translated_raw, placeholders)
+    if not isinstance(source, str):
+        VALIDATION.record(None)
+        return translated
+
+    failure = _lost_placeholders(translated_raw, placeholders)
+    if failure is None:
+        failure = structural_failure(SOURCE_ANALYSIS.tokens(source), translated)
+    if failure is not None:
+        check, detail = failure
+        VALIDATION.record(check)
+        failed_paths.add(path)
+        EVENTS.emit("failed", path=path, reason=check, detail=detail)
+        EVENTS.note("validationFailed", f"INFO: Validierung '{check}' für {path} fehlgeschlagen ({detail}) → Originaltext übernommen")
+        return source
+
+    already_failed = path in failed_paths
+    translated = _preserve_special_chars(source, translated, path, counters, failed_paths)
+    if path in failed_paths and not already_failed:
+        VALIDATION.record("special_chars")
+        return translated
+
+    if _looks_like_untranslated_echo(source, translated):
+        if counters is not None:
+            counters['untranslatedEchoKeys'] = counters.get('untranslatedEchoKeys', 0) + 1
+        failed_paths.add(path)
+        VALIDATION.record("echo")
+        EVENTS.emit("failed", path=path, reason="echo")
+        EVENTS.note("untranslatedEcho", f"INFO: Unübersetztes Echo für {path}: DeepL-Antwort identisch zum Quelltext → nicht als erledigt markiert")
+        return translated
+
+    ratio = length_ratio_failure(source, translated)
+    if ratio is not None:
+        VALIDATION.flag(path)
+        VALIDATION.record("length_ratio")
+        EVENTS.emit("failed", path=path, reason="length_ratio", detail=ratio)
+        EVENTS.note("lengthRatio", f"INFO: Auffälliges Längenverhältnis {ratio} für {path} → übernommen, in failed.json vermerkt")
+        return translated
+
+    VALIDATION.record(None)
+    return translated
 
 
 # -------- Klammer-Begriffe vor Übersetzung schützen --------
@@ -354,14 +618,22 @@ def protect_parenthesized_english(text: str) -> tuple[str, dict[str, str]]:
     return KEEP_EN_RE.sub(_repl, text), placeholders
 
 
+# Platzhalter, wie sie vom Provider zurückkommen: DeepL/OpenAI fügen gelegentlich
+# Leerzeichen an den Unterstrich-Rändern ein ("__ KEEP_EN_TERM_2__").
+KEEP_EN_PLACEHOLDER_RE = re.compile(r"__\s*KEEP_EN_TERM_(\d+)\s*__")
+
+
 def restore_parenthesized_english(text: str, mapping: dict[str, str]) -> str:
-    """Setzt zuvor maskierte Klammer-Begriffe wieder zurück (Platzhalter → Original)."""
+    """Setzt zuvor maskierte Klammer- und Glossar-Begriffe wieder zurück (Platzhalter →
+    Original). Ein einziger Durchlauf: ein wiederhergestellter Begriff wird nie erneut
+    als Platzhalter gelesen, und "_1__" kann nicht in "_10__" hineintreffen."""
     if not mapping or not isinstance(text, str):
         return text
-    restored = text
-    for placeholder, original in mapping.items():
-        restored = restored.replace(placeholder, original)
-    return restored
+
+    def _repl(match: re.Match[str]) -> str:
+        return mapping.get(f"__KEEP_EN_TERM_{match.group(1)}__", match.group(0))
+
+    return KEEP_EN_PLACEHOLDER_RE.sub(_repl, text)
 
 
 def protect_parenthesized_english_for_target(text: str, target_lang: str) -> tuple[str, dict[str, str]]:
@@ -380,34 +652,16 @@ def protect_parenthesized_english_for_target(text: str, target_lang: str) -> tup
     return protect_parenthesized_english(text)
 
 
-# -------- Hash-basierte Änderungs-Erkennung --------
+def mask_source_text(text: str, target_lang: str) -> tuple[str, dict[str, str]]:
+    """Provider-Eingabe für text: Klammer-Begriffe (nur Phase A, siehe oben) und danach
+    Glossar-Begriffe aus TERMS (beide Phasen - "Stellar"/"XLM" bleiben in jeder Sprache
+    gleich) maskiert. Platzhalter beider Sorten teilen sich eine Nummerierung."""
+    masked, placeholders = protect_parenthesized_english_for_target(text, target_lang)
+    return TERMS.mask(masked, placeholders), placeholders
 
-def _collect_leaf_paths(d: Dict[str, Any], prefix: str = "") -> Set[str]:
-    paths: Set[str] = set()
-    for k, v in d.items():
-        p = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            paths |= _collect_leaf_paths(v, p)
-        else:
-            paths.add(p)
-    return paths
-
-
-def _flatten_dict(d: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
-    out: Dict[str, Any] = {}
-    for k, v in d.items():
-        p = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            out.update(_flatten_dict(v, p))
-        else:
-            out[p] = v
-    return out
-
-
-def _sha256(s: str) -> str:
-    import hashlib
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
+# -------- Hash-basierte Änderungs-Erkennung --------
+# _collect_leaf_paths/_flatten_dict/_sha256 liegen in i18n_core.py (oben importiert).
 
 def check_namespace_key_collisions(de_ns_dir: str, ns_files: list[str]) -> None:
     """Warnt laut, falls zwei verschiedene Quellen denselben zusammengesetzten
@@ -446,6 +700,91 @@ def check_namespace_key_collisions(de_ns_dir: str, ns_files: list[str]) -> None:
             print(f"   {c}")
 
 
+def _changed_leaf_paths(old: Any, new: Dict[str, Any], prefix: str = "") -> Set[str]:
+    """Strukturelles Diff zweier (verschachtelter) Namespace-Dicts: liefert die
+    relativen Leaf-Pfade aus new, die in old fehlen oder dort einen anderen Wert haben.
+
+    Bewusst KEIN Vergleich über _flatten_dict: flache Keys mit Punkt im Namen (z.B.
+    quiz.json "d.fb") und ein verschachteltes {"d": {"fb": ...}} ergeben dort denselben
+    Pfad-String und können sich gegenseitig überschreiben. Hier wird Ebene für Ebene
+    über die ECHTEN Schlüssel gelaufen - die Pfade sind damit exakt die cur_path-Werte,
+    mit denen merge_keys_missing_or_changed gegen changed_paths prüft. Aus new
+    entfernte Keys tauchen nicht auf (dafür gibt es --prune-extra).
+    """
+    out: Set[str] = set()
+    old_dict = old if isinstance(old, dict) else {}
+    for k, v in new.items():
+        p = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            out |= _changed_leaf_paths(old_dict.get(k), v, p)
+        elif k not in old_dict or isinstance(old_dict[k], dict) or old_dict[k] != v:
+            out.add(p)
+    return out
+
+
+def _git_ref_exists(cwd: str, ref: str) -> bool:
+    """Prüft per lokalem git, ob ref zu einem Commit auflösbar ist (kein Netzwerk)."""
+    import subprocess
+
+    try:
+        res = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=cwd,
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return False
+    return res.returncode == 0
+
+
+def _git_show_json(cwd: str, ref: str, rel_path: str) -> Dict[str, Any] | None:
+    """Liest rel_path (relativ zu cwd) im Stand von ref per `git show`.
+    None, falls die Datei bei ref nicht existierte (neuer Namespace) oder kein
+    gültiges JSON war - beides wird vom Aufrufer wie ein leerer Stand behandelt.
+    """
+    import subprocess
+
+    try:
+        res = subprocess.run(
+            ["git", "show", f"{ref}:./{rel_path}"],
+            cwd=cwd,
+            capture_output=True,
+            check=False,
+        )
+    except OSError as e:
+        raise RuntimeError(f"git nicht ausführbar: {e}")
+    if res.returncode != 0:
+        return None
+    try:
+        data = i18n_json.loads(res.stdout)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        print(f"⚠️ Ungültiges JSON in {ref}:{rel_path} - behandle als leer")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def changed_paths_since(base_path: str, ref: str, ns_files: list[str]) -> Dict[str, Set[str]]:
+    """Arbeitsmenge für --since: pro Namespace die relativen Leaf-Pfade, die in
+    de/<ns>.json seit ref geändert oder neu hinzugekommen sind.
+
+    Hintergrund: die inkrementelle Erkennung vergleicht gegen die Hash-Manifeste, und
+    die laufen in der Praxis immer wieder gegen den Inhalt auseinander (History-bedingte
+    Manifest/Content-Drift, siehe Kommentare in main()). Der Git-Stand bei ref ist
+    dagegen eine exakte Referenz: in CI (content/update-*-Branches) ist das genau der
+    Stand, gegen den die Übersetzungen zuletzt abgeglichen wurden.
+    """
+    out: Dict[str, Set[str]] = {}
+    for ns_file in sorted(ns_files):
+        ns_name = ns_file[:-5]
+        current = load_json(os.path.join(base_path, BASE_LANG, ns_file))
+        if not isinstance(current, dict):
+            continue
+        previous = _git_show_json(base_path, ref, f"{BASE_LANG}/{ns_file}") or {}
+        out[ns_name] = _changed_leaf_paths(previous, current)
+    return out
+
+
 def _missing_rel_keys(base_flat_rel: Dict[str, Any], target_dict: Dict[str, Any]) -> Set[str]:
     """Relative Keys aus base_flat_rel, die im (noch verschachtelten) target_dict fehlen.
     Wird gebraucht, um das Hash-Manifest nur für tatsächlich neu befüllte/übersetzte
@@ -457,28 +796,31 @@ def _missing_rel_keys(base_flat_rel: Dict[str, Any], target_dict: Dict[str, Any]
 
 
 def _load_manifest(lang: str, from_pivot: str) -> Dict[str, str]:
-    path = os.path.join(HASH_DIR, f"{lang}_from_{from_pivot}.json")
-    try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                return {str(k): str(v) for k, v in data.items()}
-            return {}
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
+    # HASH_DIR wird zur Laufzeit gelesen (main() setzt es per --base-path, Tests patchen es).
+    manifest = i18n_core.load_manifest(HASH_DIR, lang, from_pivot)
+    if SHARD.active:
+        manifest.update(SHARD.load_partial(HASH_DIR, lang, from_pivot))
+    return manifest
 
 
-def _save_manifest(lang: str, from_pivot: str, data: Dict[str, str]) -> None:
-    os.makedirs(HASH_DIR, exist_ok=True)
-    path = os.path.join(HASH_DIR, f"{lang}_from_{from_pivot}.json")
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"💾 Manifest gespeichert: {path}")
-    except Exception as e:
-        print(f"❌ Fehler beim Speichern von Manifest {path}: {e}")
+def _save_manifest(lang: str, from_pivot: str, data: Dict[str, str]) -> bool:
+    # Mit --shard nie das kanonische Manifest, sondern das Teil-Manifest dieses Shards.
+    if SHARD.active:
+        return SHARD.write_partial(HASH_DIR, lang, from_pivot, data)
+    return i18n_core.save_manifest(HASH_DIR, lang, from_pivot, data)
+
+
+def _manifest_out_path(lang: str, from_pivot: str) -> str:
+    """Pfad, den _save_manifest() tatsächlich schreibt."""
+    if SHARD.active:
+        return SHARD.partial_path(HASH_DIR, lang, from_pivot)
+    return i18n_core.manifest_path(HASH_DIR, lang, from_pivot)
+
+
+def _count_written(provider: str, lang: str, path: str, written: bool) -> None:
+    """bytes_written-Metrik: nur tatsächlich geschriebene Dateien zählen."""
+    if written:
+        METRICS.add(provider, lang, "bytes_written", os.path.getsize(path))
 
 
 def _get_node_by_path(d: Dict[str, Any], path: str):
@@ -513,7 +855,7 @@ def _get_node_by_path(d: Dict[str, Any], path: str):
     return node
 
 
-def expand_forced_paths(base_dict: Dict[str, Any], forced_list: list[str], namespace: str) -> Set[str]:
+def expand_forced_paths(base_dict: Dict[str, Any], forced_list: list[str], namespace: str, warn: bool = True) -> Set[str]:
     """Löst --force-key-Pfade zu relativen Leaf-Paths innerhalb von base_dict auf.
 
     base_dict ist das namespace-eigene Dict OHNE Namespace-Wrapper (z.B. ns_base
@@ -551,7 +893,8 @@ def expand_forced_paths(base_dict: Dict[str, Any], forced_list: list[str], names
 
         node = _get_node_by_path(base_dict, rel)
         if node is None:
-            print(f"INFO: Warnung: erzwungener Schlüssel nicht gefunden: {p}")
+            if warn:
+                print(f"INFO: Warnung: erzwungener Schlüssel nicht gefunden: {p}")
             continue
         if isinstance(node, dict):
             out |= _collect_leaf_paths(node, rel)
@@ -580,8 +923,34 @@ def merge_keys_missing_or_changed(
       vorhandene Werte werden nur überschrieben, wenn der Pfad in forced_paths liegt.
     """
     out = dict(target_dict)
+    families = plural_families(base_dict)
+    family_of = {k: stem for stem, members in families.items() for k in members.values()}
     for key, value in base_dict.items():
         cur_path = f"{prefix}.{key}" if prefix else key
+        stem = family_of.pop(key, None)
+        if stem is not None:
+            # Pluralfamilie: beim ersten Mitglied als Ganzes behandeln, übrige überspringen.
+            members = families.pop(stem, None)
+            if members is None:
+                continue
+            stem_path = f"{prefix}.{stem}" if prefix else stem
+            sources = {cat: base_dict[k] for cat, k in members.items()}
+            needed = [f"{stem}_{cat}" for cat in target_categories(lang, sources)]
+            if any(k not in out for k in needed) or any((f"{prefix}.{k}" if prefix else k) in changed_paths for k in members.values()):
+                member_paths = [f"{prefix}.{k}" if prefix else k for k in members.values()]
+                if not SCHEDULER.admit(lang, stem_path, any(k not in out for k in needed), "\n".join(sources.values()), member_paths):
+                    failed_paths.update(member_paths)
+                    continue
+                forms = _translate_plural_family(sources, stem_path, lang, provider, openai_key, deepl_key, counters, failed_paths)
+                if forms is None:
+                    for k in members.values():
+                        out.setdefault(k, base_dict[k])
+                else:
+                    for cat, text in forms.items():
+                        out[f"{stem}_{cat}"] = text
+                for _ in members:
+                    EVENTS.advance(lang)
+            continue
         if isinstance(value, dict):
             # Achtung Signatur: failed_paths kommt VOR prefix. Der rekursive
             # Aufruf hatte hier lange ein Argument zu wenig - cur_path rutschte
@@ -616,21 +985,23 @@ def merge_keys_missing_or_changed(
                         counters['copiedOriginalKeysCount'] = counters.get('copiedOriginalKeysCount', 0) + 1
                 continue
             needs_update = (key not in out) or (cur_path in changed_paths)
-            if needs_update:
-                protected, placeholders = protect_parenthesized_english_for_target(value if isinstance(value, str) else "", lang)
+            if needs_update and not SCHEDULER.admit(lang, cur_path, key not in out, value if isinstance(value, str) else ""):
+                # Spätere Prioritätsstufe oder Budget erschöpft: unverändert lassen und
+                # nicht ins Manifest übernehmen (failed_paths).
+                failed_paths.add(cur_path)
+            elif needs_update:
+                protected, placeholders = SOURCE_ANALYSIS.mask(value if isinstance(value, str) else "", lang)
                 translated_raw = translate_text(protected, lang, provider, openai_key, deepl_key)
                 if translated_raw is None:
                     failed_paths.add(cur_path)
+                    EVENTS.emit("failed", path=cur_path, reason="provider")
                     out[key] = out.get(key, value)
                 else:
-                    translated = restore_parenthesized_english(translated_raw, placeholders)
-                    translated = _preserve_special_chars(value, translated, cur_path, counters, failed_paths)
-                    if _looks_like_untranslated_echo(value, translated):
-                        if counters is not None:
-                            counters['untranslatedEchoKeys'] = counters.get('untranslatedEchoKeys', 0) + 1
-                        failed_paths.add(cur_path)
-                        print(f"INFO: Unübersetztes Echo für {cur_path}: DeepL-Antwort identisch zum Quelltext → nicht als erledigt markiert")
+                    translated = _validate_translation(value, translated_raw, placeholders, cur_path, counters, failed_paths)
+                    if cur_path not in failed_paths and cur_path not in VALIDATION.suspicious:
+                        EVENTS.emit("translated", path=cur_path, chars=len(protected))
                     out[key] = translated
+                EVENTS.advance(lang)
     return out
 
 
@@ -653,9 +1024,38 @@ def translate_full(
     target_dict: Dict[str, Any] = {}
     target_existing = target_existing or {}
     forced_paths = forced_paths or set()
+    families = plural_families(base_dict)
+    family_of = {k: stem for stem, members in families.items() for k in members.values()}
     for key, value in base_dict.items():
         cur_path = f"{prefix}.{key}" if prefix else key
         existing_val = target_existing.get(key)
+        stem = family_of.pop(key, None)
+        if stem is not None:
+            # Pluralfamilie als Ganzes (siehe merge_keys_missing_or_changed).
+            members = families.pop(stem, None)
+            if members is None:
+                continue
+            stem_path = f"{prefix}.{stem}" if prefix else stem
+            sources = {cat: base_dict[k] for cat, k in members.items()}
+            needed = [f"{stem}_{cat}" for cat in target_categories(lang, sources)]
+            forms = None
+            if any(target_existing.get(k) is None for k in needed) or any((f"{prefix}.{k}" if prefix else k) in forced_paths for k in members.values()):
+                member_paths = [f"{prefix}.{k}" if prefix else k for k in members.values()]
+                if SCHEDULER.admit(lang, stem_path, any(target_existing.get(k) is None for k in needed), "\n".join(sources.values()), member_paths):
+                    forms = _translate_plural_family(sources, stem_path, lang, provider, openai_key, deepl_key, counters, failed_paths)
+                    for _ in members:
+                        EVENTS.advance(lang)
+                elif failed_paths is not None:
+                    failed_paths.update(member_paths)
+            for k in needed:
+                cat = k[len(stem) + 1:]
+                if forms is not None:
+                    target_dict[k] = forms[cat]
+                elif target_existing.get(k) is not None:
+                    target_dict[k] = target_existing[k]
+                elif k in base_dict:
+                    target_dict[k] = base_dict[k]
+            continue
         if isinstance(value, dict):
             target_dict[key] = translate_full(
                 value,
@@ -681,32 +1081,50 @@ def translate_full(
                     target_dict[key] = existing_val
             else:
                 # Bestehende Übersetzungen nur überschreiben, wenn erzwungen
-                if existing_val is None or cur_path in forced_paths:
-                    protected, placeholders = protect_parenthesized_english_for_target(value if isinstance(value, str) else "", lang)
+                needs_update = existing_val is None or cur_path in forced_paths
+                if needs_update and not SCHEDULER.admit(lang, cur_path, existing_val is None, value if isinstance(value, str) else ""):
+                    if failed_paths is not None:
+                        failed_paths.add(cur_path)
+                    if existing_val is not None:
+                        target_dict[key] = existing_val
+                elif needs_update:
+                    protected, placeholders = SOURCE_ANALYSIS.mask(value if isinstance(value, str) else "", lang)
                     translated_raw = translate_text(protected, lang, provider, openai_key, deepl_key)
                     if translated_raw is None:
                         if failed_paths is not None:
                             failed_paths.add(cur_path)
+                        EVENTS.emit("failed", path=cur_path, reason="provider")
                         target_dict[key] = existing_val if existing_val is not None else value
                     else:
-                        translated = restore_parenthesized_english(translated_raw, placeholders)
-                        translated = _preserve_special_chars(value, translated, cur_path, counters, failed_paths)
-                        if _looks_like_untranslated_echo(value, translated):
-                            if counters is not None:
-                                counters['untranslatedEchoKeys'] = counters.get('untranslatedEchoKeys', 0) + 1
-                            if failed_paths is not None:
-                                failed_paths.add(cur_path)
-                            print(f"INFO: Unübersetztes Echo für {cur_path}: DeepL-Antwort identisch zum Quelltext → nicht als erledigt markiert")
+                        key_failed: Set[str] = set()
+                        translated = _validate_translation(value, translated_raw, placeholders, cur_path, counters, key_failed)
+                        if failed_paths is not None:
+                            failed_paths |= key_failed
+                        if not key_failed and cur_path not in VALIDATION.suspicious:
+                            EVENTS.emit("translated", path=cur_path, chars=len(protected))
                         target_dict[key] = translated
+                    EVENTS.advance(lang)
                 else:
                     target_dict[key] = existing_val
     return target_dict
 
 
 def prune_extra_keys(base_dict: Dict[str, Any], target_dict: Dict[str, Any]) -> Dict[str, Any]:
-    """Entfernt Keys aus target_dict, die in base_dict nicht existieren (rekursiv)."""
+    """Entfernt Keys aus target_dict, die in base_dict nicht existieren (rekursiv).
+    Zusätzliche Pluralformen einer Familie der Basis (z.B. ru _few/_many) bleiben erhalten."""
     pruned: Dict[str, Any] = {}
+    families = plural_families(base_dict)
+    family_of = {k: stem for stem, members in families.items() for k in members.values()}
     for key, base_val in base_dict.items():
+        stem = family_of.get(key)
+        if stem is not None:
+            if stem in families:
+                del families[stem]
+                for tkey, tval in target_dict.items():
+                    m = PLURAL_KEY_RE.match(tkey)
+                    if m and m.group(1) == stem:
+                        pruned[tkey] = tval
+            continue
         if key not in target_dict:
             continue
         tgt_val = target_dict[key]
@@ -717,27 +1135,124 @@ def prune_extra_keys(base_dict: Dict[str, Any], target_dict: Dict[str, Any]) ->
     return pruned
 
 
-# -------- Learn-Namespace: fehlende Keys aus lessons.json ergänzen + Spiegel erzeugen --------
+def _changed_rel_keys(
+    flat_rel: Dict[str, Any],
+    manifest: Dict[str, str],
+    ns_name: str,
+    *,
+    do_full: bool,
+    since_paths: Set[str] | None,
+    forced_paths: Set[str],
+    any_force_key: bool,
+    synced_paths: Set[str] = frozenset(),
+) -> Set[str]:
+    """Relative Keys, die dieser Lauf für einen Namespace/eine Sprache als "geändert"
+    neu übersetzt (fehlende Keys kommen unabhängig davon immer dazu). Begründung der
+    einzelnen Zweige siehe Kommentare bei Phase A in _run(); synced_paths sind die
+    vom Quell-Sync eben angelegten Keys und gehören in jedem Modus dazu."""
+    if do_full:
+        return set(flat_rel.keys())
+    if since_paths is not None:
+        changed = set(since_paths)
+    elif forced_paths:
+        changed = set(forced_paths)
+    elif any_force_key:
+        changed = set()
+    else:
+        changed = set(
+            k for k, v in flat_rel.items()
+            if manifest.get(f"{ns_name}.{k}") != SOURCE_ANALYSIS.digest(str(v))
+        )
+    changed |= synced_paths
+    # Pluralfamilien werden als Ganzes neu übersetzt (siehe i18n_plural.py).
+    return expand_families(changed, flat_rel.keys())
 
-def deep_merge_missing(target: Dict[str, Any], source: Dict[str, Any], diffs: list[str] | None = None, prefix: str = "") -> None:
-    """Fügt nur fehlende Keys aus source in target ein. Bei unterschiedlichen vorhandenen Werten wird NICHT überschrieben,
-    sondern der Pfad in diffs vermerkt.
-    """
-    for k, v in (source or {}).items():
-        cur = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            if k not in target or not isinstance(target.get(k), dict):
-                target[k] = {}
-            deep_merge_missing(target[k], v, diffs, cur)
-        else:
-            if k not in target:
-                target[k] = v
-            else:
-                if target[k] != v and diffs is not None:
-                    diffs.append(cur)
+
+def _planned_rel_keys(base_flat_rel: Dict[str, Any], target_dict: Dict[str, Any], changed_rel: Set[str]) -> Set[str]:
+    """Keys, für die tatsächlich der Provider gefragt wird: fehlend oder geändert,
+    ohne ".original"-Keys (die werden nur kopiert)."""
+    candidates = _missing_rel_keys(base_flat_rel, target_dict) | changed_rel
+    return {k for k in candidates if k in base_flat_rel and not is_original_key(k)}
+
+
+def _report_planned(lang: str, ns_name: str, planned: Set[str], flat_rel: Dict[str, Any], estimates: Dict[tuple[str, str], int]) -> None:
+    """planned-Ereignis für (Namespace, Sprache) + Korrektur der Fortschritts-Schätzung
+    auf die jetzt exakt bekannte Arbeitsmenge."""
+    chars = sum(len(v) for k, v in flat_rel.items() if k in planned and isinstance(v, str))
+    EVENTS.emit("planned", ns=ns_name, lang=lang, count=len(planned), chars=chars)
+    EVENTS.plan(lang, len(planned) - estimates.pop((ns_name, lang), 0))
+
+
+def _try_load(path: str) -> Dict[str, Any]:
+    """Wie load_json, aber ohne Warnung für fehlende/ungültige Dateien."""
+    try:
+        data = i18n_json.load_file(path)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _text_chars(flat_rel: Dict[str, Any], keys: Set[str]) -> int:
+    return sum(len(v) for k, v in flat_rel.items() if k in keys and isinstance(v, str))
+
+
+def _plan_work(
+    base_path: str,
+    ns_files: list[str],
+    *,
+    forced_list: list[str],
+    do_full: bool,
+    since_changed: Dict[str, Set[str]] | None,
+    any_force_key: bool,
+    synced_paths: Dict[str, Set[str]],
+    langs: list[str] = TARGET_LANGS,
+) -> Dict[tuple[str, str], tuple[int, int]]:
+    """Vorab-Schätzung der Arbeitsmenge je (Namespace, Sprache) als (Keys, Zeichen) - für
+    Fortschritt/ETA und die Shard-Aufteilung (--shard).
+    Phase A ist exakt (gleiche Logik wie der eigentliche Lauf); Phase B hängt vom Ergebnis
+    von Phase A ab und wird als "in EN neu übersetzt + eigene Lücken/Drift" geschätzt
+    (Zeichen: EN-Text, für in Phase A neu zu übersetzende Keys ersatzweise der DE-Text).
+    Alle hier gelesenen Dateien landen im Dokument-Cache und werden vom Lauf nicht erneut
+    geparst."""
+    work: Dict[tuple[str, str], tuple[int, int]] = {}
+    man_en = _load_manifest("en", "de")
+    man_langs = {lang: _load_manifest(lang, "en") for lang in langs if lang != "en"}
+    for ns_file in sorted(ns_files):
+        ns_name = ns_file[:-5]
+        ns_base = _try_load(os.path.join(base_path, BASE_LANG, ns_file))
+        if not ns_base:
+            continue
+        forced_paths = expand_forced_paths(ns_base, forced_list, namespace=ns_name, warn=False) if forced_list else set()
+        de_flat_rel = _flatten_dict(ns_base)
+        en_existing = _try_load(os.path.join(base_path, "en", ns_file))
+        since_paths = None if since_changed is None else (since_changed.get(ns_name, set()) | forced_paths)
+        changed_en = _changed_rel_keys(
+            de_flat_rel, man_en, ns_name,
+            do_full=do_full, since_paths=since_paths, forced_paths=forced_paths, any_force_key=any_force_key,
+            synced_paths=synced_paths.get(ns_name, set()),
+        )
+        planned_en = _planned_rel_keys(de_flat_rel, {} if do_full else en_existing, changed_en) if "en" in langs else set()
+        if "en" in langs:
+            work[(ns_name, "en")] = (len(planned_en), _text_chars(de_flat_rel, planned_en))
+        en_flat_rel = _flatten_dict(en_existing)
+        pivot_rel = {**en_flat_rel, **{k: de_flat_rel[k] for k in planned_en}}
+        for lang, man_lang in man_langs.items():
+            existing = _try_load(os.path.join(base_path, lang, ns_file))
+            changed_lang = _changed_rel_keys(
+                en_flat_rel, man_lang, ns_name,
+                do_full=do_full, since_paths=None if since_changed is None else planned_en,
+                forced_paths=forced_paths, any_force_key=any_force_key,
+            ) | planned_en
+            planned_lang = _planned_rel_keys(de_flat_rel, {} if do_full else existing, changed_lang)
+            work[(ns_name, lang)] = (len(planned_lang), _text_chars(pivot_rel, planned_lang))
+    return work
 
 
 def main():
+    import argparse
+    import contextlib
+    from argparse import RawTextHelpFormatter
+
     # Argumente parsen
     parser = argparse.ArgumentParser(
         description=(
@@ -749,11 +1264,21 @@ def main():
             "                       Mehrfach nutzbar oder komma-separiert.\n"
             "                       Beispiele: feedback.title  |  menu.feedback  |  feedback\n"
             "  --full               Vollständiger Lauf: alle Schlüssel neu übersetzen (langsamer/teurer).\n"
+            "  --since <git-ref>    Arbeitsmenge per Git-Diff statt Hash-Manifest: nur Keys, die in\n"
+            "                       de/*.json seit <git-ref> geändert/neu sind (z.B. origin/main).\n"
+            "  --events <pfad|->    Ereignisse als JSON Lines (planned/translated/failed/retried/written ...).\n"
+            "  --quiet              Einzelmeldungen pro Key zusammenfassen.\n"
+            "  --profile            Laufzeit je Phase/Namespace messen (--profile-out <pfad>: cProfile-Dump).\n"
+            "  --metrics-json <pfad>, --metrics-prom <pfad>\n"
+            "                       Lauf-Metriken je Provider/Sprache als JSON bzw. Prometheus-Textdatei.\n"
+            "  --cassette <pfad>    Provider-Antworten aufzeichnen/wiederverwenden (--cassette-mode record|replay|strict).\n"
+            "  --shard i/N          Nur Teil i von N (CI-Parallelisierung); danach: python3 i18n_shard.py merge\n"
             "\n"
             "Beispiele:\n"
             "  python3 UpdateSprachdateienBasierendAufDE.py --provider deepl\n"
             "  python3 UpdateSprachdateienBasierendAufDE.py --provider deepl --force-key feedback.title --force-key menu.feedback\n"
             "  python3 UpdateSprachdateienBasierendAufDE.py --provider deepl --full\n"
+            "  python3 UpdateSprachdateienBasierendAufDE.py --provider deepl --since origin/main\n"
         ),
         formatter_class=RawTextHelpFormatter,
     )
@@ -780,11 +1305,114 @@ def main():
         action="append",
         help="Erzwingt Neuübersetzung für bestimmte Schlüssel (dot-Pfade, mehrfach nutzbar oder komma-separiert)",
     )
+    parser.add_argument(
+        "--since",
+        metavar="GIT_REF",
+        help="Nur Keys übersetzen, die in de/*.json seit GIT_REF geändert/neu sind (lokales git show, ignoriert Hash-Drift)",
+    )
     parser.add_argument(
         "--prune-extra",
         action="store_true",
         help="Entfernt Keys in Zielsprachen, die in der Basis nicht mehr existieren (rekursiv).",
     )
+    parser.add_argument(
+        "--events",
+        metavar="PFAD",
+        help="Strukturierte Ereignisse (JSON Lines) in PFAD schreiben; '-' = stdout (menschenlesbare Ausgabe geht dann nach stderr)",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Keine Einzelmeldungen pro Key/Datei; stattdessen eine zusammengefasste Zeile je Meldungsart am Ende",
+    )
+    parser.add_argument(
+        "--progress",
+        choices=["auto", "on", "off"],
+        default="auto",
+        help="Live-Fortschritt (Keys erledigt/geplant, Req/s, ETA je Sprache) auf stderr; auto = nur im Terminal",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Wand-/CPU-Zeit je Phase (source-sync, collision-check, plan, phase-a, phase-b:<lang>, save, manifest) und Namespace messen; Rangliste am Ende",
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="PFAD",
+        help="Zusätzlich cProfile-Statistik nach PFAD schreiben (pstats-Format, impliziert --profile) und die teuersten Skript-Funktionen ausgeben",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        metavar="PFAD",
+        help="Lauf-Metriken je Provider/Sprache (Requests, Zeichen, Retries, 429, Cache-Treffer, Latenz-Histogramm, geschriebene Bytes) als JSON nach PFAD",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        metavar="PFAD",
+        help="Dieselben Metriken im Prometheus-Textformat (node_exporter textfile collector) nach PFAD",
+    )
+    parser.add_argument(
+        "--cassette",
+        metavar="PFAD",
+        help="Kassette für Provider-Aufrufe (Schlüssel: Provider, Quell-/Zielsprache, normalisierter Text)",
+    )
+    parser.add_argument(
+        "--cassette-mode",
+        choices=["record", "replay", "strict"],
+        default="replay",
+        help="record = immer Provider fragen und speichern; replay = Treffer aus der Kassette, sonst Provider (Default); strict = Fehlschlag bricht die Sprache ab, kein Netzwerk/API-Key nötig",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="i/N",
+        type=parse_shard_spec,
+        help="Nur Teil i von N bearbeiten (deterministisch, nach Zeichen balanciert); Manifeste und gescheiterte Keys als Teil-Dateien, zusammenführen mit: python3 i18n_shard.py merge",
+    )
+    parser.add_argument(
+        "--namespace",
+        dest="namespaces",
+        metavar="GLOB",
+        action="append",
+        help="Nur passende Namespaces bearbeiten (fnmatch, z.B. 'quiz*'; mehrfach nutzbar oder komma-separiert). Andere werden weder gelesen noch geschrieben",
+    )
+    parser.add_argument(
+        "--lang",
+        dest="langs",
+        metavar="GLOB",
+        action="append",
+        help="Nur passende Zielsprachen bearbeiten (z.B. 'fi' oder 'f*'). Ohne 'en' bleibt Phase A aus und der vorhandene EN-Pivot wird verwendet",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Nach dem Lauf weiterlaufen und bei Änderungen an de/*.json oder den Lern-Daten nur die betroffenen Namespaces inkrementell nachziehen (Strg+C beendet)",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        metavar="SEKUNDEN",
+        type=float,
+        default=0.5,
+        help="Abfrage-Intervall für --watch (Standard: 0.5)",
+    )
+    parser.add_argument(
+        "--watch-debounce",
+        metavar="SEKUNDEN",
+        type=float,
+        default=1.0,
+        help="Mit --watch erst übersetzen, wenn so lange keine weitere Änderung kam (Standard: 1.0)",
+    )
+    parser.add_argument(
+        "--max-chars",
+        metavar="N",
+        type=int,
+        help="Höchstens N Zeichen an den Provider schicken; Reihenfolge nach Priorität (fehlend vor geändert, im Code genutzt zuerst), Rest landet im Checkpoint",
+    )
+    parser.add_argument(
+        "--max-duration",
+        metavar="SEKUNDEN",
+        type=float,
+        help="Nach SEKUNDEN keine neuen Übersetzungen mehr beginnen (gleiche Priorität und Checkpoint wie --max-chars)",
+    )
     parser.add_argument(
         "--namespaced-only",
         action="store_true",
@@ -798,6 +1426,110 @@ def main():
 
     args = parser.parse_args()
 
+    # Ereignis-Strom/Fortschritt für diesen Lauf. Mit "--events -" gehört stdout allein
+    # dem JSONL-Strom; alle menschenlesbaren Ausgaben weichen nach stderr aus.
+    events_to_stdout = args.events == "-"
+    events_file = open(args.events, "w", encoding="utf-8", buffering=1) if args.events and not events_to_stdout else None
+    EVENTS.configure(
+        stream=sys.stdout if events_to_stdout else events_file,
+        quiet=bool(args.quiet),
+        progress=args.progress == "on" or (args.progress == "auto" and sys.stderr.isatty()),
+    )
+    PROFILE.configure(bool(args.profile or args.profile_out))
+    METRICS.configure()
+    SHARD.configure(args.shard)
+    if args.watch and args.shard:
+        print("❌ --watch und --shard schließen sich aus. Abbruch.")
+        return
+    try:
+        CASSETTE.configure(args.cassette, args.cassette_mode)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    profiler = None
+    if args.profile_out:
+        import cProfile
+        profiler = cProfile.Profile()
+    try:
+        with (contextlib.redirect_stdout(sys.stderr) if events_to_stdout else contextlib.nullcontext()):
+            if profiler is not None:
+                profiler.enable()
+            try:
+                _run(args)
+                if args.watch:
+                    _watch(args)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+            if PROFILE.enabled:
+                print("\n" + PROFILE.summary())
+            if profiler is not None:
+                profiler.dump_stats(args.profile_out)
+                print(f"\n🔬 cProfile-Statistik gespeichert: {args.profile_out} (z.B. python3 -m pstats {args.profile_out})")
+                print(cprofile_summary(args.profile_out, os.path.dirname(os.path.abspath(__file__))))
+            if args.metrics_json:
+                i18n_json.write_bytes_if_changed(args.metrics_json, i18n_json.dumps(METRICS.to_dict()))
+                print(f"📈 Metriken (JSON) gespeichert: {args.metrics_json}")
+            if args.metrics_prom:
+                i18n_json.write_bytes_if_changed(args.metrics_prom, METRICS.to_prometheus().encode("utf-8"))
+                print(f"📈 Metriken (Prometheus) gespeichert: {args.metrics_prom}")
+    finally:
+        # Auch nach einem Abbruch: bereits bezahlte Antworten nicht verwerfen.
+        if CASSETTE.enabled:
+            with (contextlib.redirect_stdout(sys.stderr) if events_to_stdout else contextlib.nullcontext()):
+                if CASSETTE.save():
+                    print(f"📼 Kassette gespeichert: {CASSETTE.path}")
+                print(f"Zusammenfassung Kassette ({CASSETTE.summary()})")
+        EVENTS.close()
+        if events_file is not None:
+            events_file.close()
+
+
+def _watch(args) -> None:
+    """--watch: beobachtet die DE-Quellen und zieht je Änderungsschub nur die betroffenen
+    Namespaces inkrementell nach (siehe i18n_watch.py). Folgeläufe sind nie --full,
+    --since oder --force-key - die gelten nur für den ersten Lauf."""
+    import copy
+    from i18n_watch import PollWatcher, watched_files
+
+    base_path = args.base_path
+    de_ns_dir = os.path.join(base_path, BASE_LANG)
+    ns_globs = split_globs(args.namespaces)
+    source_namespaces = {spec.namespace for spec in SOURCES}
+
+    def current_files() -> Dict[str, str]:
+        return {p: ns for p, ns in watched_files(base_path, de_ns_dir, SOURCES).items() if matches_globs(ns, ns_globs)}
+
+    known = current_files()
+    watcher = PollWatcher(lambda: current_files().keys(), interval=args.watch_interval, debounce=args.watch_debounce)
+    cycle = copy.copy(args)
+    cycle.full = False
+    cycle.since = None
+    cycle.force_keys = None
+    print(f"\n👀 Watch-Modus: {len(known)} Datei(en) beobachtet. Beenden mit Strg+C.")
+    try:
+        while True:
+            changed = watcher.wait()
+            known.update(current_files())
+            namespaces = sorted({
+                known[p] for p in changed
+                if p in known and (known[p] in source_namespaces or os.path.exists(os.path.join(de_ns_dir, f"{known[p]}.json")))
+            })
+            if not namespaces:
+                continue
+            print(f"\n🔁 Geändert: {', '.join(os.path.relpath(p, base_path) for p in sorted(changed))} → {', '.join(namespaces)}")
+            cycle.namespaces = namespaces
+            _run(cycle, keep_caches=True)
+            # Eigene Schreibvorgänge (Quell-Sync → de/learn.json) nicht als Änderung melden.
+            watcher.rebase()
+    except KeyboardInterrupt:
+        print("\n👋 Watch-Modus beendet.")
+
+
+def _run(args, keep_caches: bool = False) -> None:
+    """Eigentlicher Lauf nach dem Parsen der Argumente (siehe main()). keep_caches:
+    Dokument-Cache und Quelltext-Analyse des vorigen Laufs weiterverwenden (--watch;
+    beide erkennen veraltete Einträge selbst)."""
     base_path = args.base_path
     # HASH_DIR war bisher fest an das Skriptverzeichnis gebunden und ignorierte
     # --base-path - ein --base-path-Lauf (z.B. Tests, alternativer Checkout) hat
@@ -805,65 +1537,99 @@ def main():
     # jetzt konsistent dem gewählten base_path (Default unverändert = Skriptverzeichnis).
     global HASH_DIR
     HASH_DIR = os.path.join(base_path, ".i18n_hash")
+    WRITE_STATS.update(written=0, unchanged=0)
+    # Dokument-Cache ist lauf-bezogen (siehe i18n_json.DocumentCache); nur --watch
+    # behält ihn über Folgeläufe.
+    if not keep_caches:
+        i18n_json.DOCUMENTS.clear()
+        SOURCE_ANALYSIS.clear()
+    VALIDATION.clear()
     provider = args.provider
     # --full schaltet bewusst in den Voll-Lauf; ohne Flag wird inkrementell (nur neue/geänderte Keys laut Hash) gearbeitet.
     do_full = bool(args.full)
     force_keys_raw = args.force_keys or []
     do_prune = bool(args.prune_extra)
+    since_ref = args.since
+    if since_ref and do_full:
+        print("INFO: --since wird bei --full ignoriert (Voll-Lauf übersetzt ohnehin alles).")
+        since_ref = None
 
     # API-Keys aus Umgebungsvariablen lesen
     openai_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_KEY")
     deepl_key = os.getenv("DEEPL_API_KEY") or os.getenv("DEEPL_AUTH_KEY")
 
-    # Frühzeitige Validierung + Debug-Hinweis (ohne Secrets)
-    if provider == "openai" and not openai_key:
+    # Frühzeitige Validierung + Debug-Hinweis (ohne Secrets). Eine strict-Kassette
+    # beantwortet alles selbst - dann braucht es weder Key noch Endpoint.
+    if CASSETTE.offline:
+        print(f"INFO: Kassette {CASSETTE.path} (strict): keine Provider-Aufrufe.")
+    elif provider == "openai" and not openai_key:
         print("❌ OPENAI_API_KEY nicht gesetzt. Abbruch.")
         return
-    if provider == "deepl":
+    elif provider == "deepl":
         if not deepl_key:
             print("❌ DEEPL_API_KEY/DEEPL_AUTH_KEY nicht gesetzt. Abbruch.")
             return
         print(f"INFO: DeepL endpoint: {(os.getenv('DEEPL_API_URL') or 'https://api-free.deepl.com/v2/translate')}")
 
+    # Glossar-Begriffsschutz (i18n_terms.json + glossary.json, siehe i18n_terms.py)
+    try:
+        TERMS.configure(load_term_list(base_path))
+    except ValueError as e:
+        print(f"❌ Begriffsliste ungültig: {e}. Abbruch.")
+        return
+    if TERMS.terms:
+        print(f"INFO: Begriffsschutz aktiv: {len(TERMS.terms)} Begriff(e)")
+
+    # Budget/Priorität (siehe i18n_budget.py). Zurückgestellte Keys des letzten
+    # abgebrochenen Laufs kommen in jedem Modus wieder in die Arbeitsmenge.
+    budget = args.max_chars is not None or args.max_duration is not None
+    if (args.max_chars is not None and args.max_chars <= 0) or (args.max_duration is not None and args.max_duration <= 0):
+        print("❌ --max-chars/--max-duration müssen positiv sein. Abbruch.")
+        return
+    unused_keys = load_unused_keys(base_path) if budget else None
+    SCHEDULER.configure(args.max_chars, args.max_duration, unused_keys)
+    if budget:
+        limits = [f"{args.max_chars} Zeichen"] if args.max_chars is not None else []
+        if args.max_duration is not None:
+            limits.append(f"{args.max_duration:g}s")
+        usage = "laut i18n_usage_report.json" if unused_keys is not None else "unbekannt (kein i18n_usage_report.json)"
+        print(f"INFO: Budget aktiv ({', '.join(limits)}); Nutzung der Keys {usage}")
+    carried = load_checkpoint(HASH_DIR)
+    if carried:
+        n = sum(len(keys) for by_ns in carried.values() for keys in by_ns.values())
+        print(f"INFO: Checkpoint: {n} zurückgestellte Key(s) aus dem letzten Lauf werden wieder aufgenommen")
+
     # Standard: Namespaces verarbeiten (de/<ns>.json → en/<ns>.json → andere/<ns>.json)
     de_ns_dir = os.path.join(base_path, BASE_LANG)
     if not os.path.isdir(de_ns_dir):
         print(f"❌ Namespace-Verzeichnis fehlt: {de_ns_dir}")
         return
 
-    # Learn-Sync: lessons.json → de/learn.json (nur fehlende Keys ergänzen)
-    try:
-        lessons_path = os.path.normpath(os.path.join(base_path, "..", "data", "learn", "lessons.json"))
-        lessons_raw = load_json(lessons_path)
-        if isinstance(lessons_raw, list):
-            learn_from_lessons: Dict[str, Any] = {}
-            for l in lessons_raw:
-                if not isinstance(l, dict):
-                    continue
-                lid = l.get("id")
-                if not isinstance(lid, str) or not lid:
-                    continue
-                learn_from_lessons[lid] = {
-                    "title": l.get("title", ""),
-                    "goal": l.get("goal", ""),
-                    "task": l.get("task", ""),
-                    "learningOutcome": l.get("learningOutcome", ""),
-                    "reward": l.get("reward", ""),
-                }
-            de_learn_file = os.path.join(de_ns_dir, "learn.json")
-            existing_learn = load_json(de_learn_file)
-            next_learn = json.loads(json.dumps(existing_learn)) if existing_learn else {}
-            diffs_ns_de: list[str] = []
-            deep_merge_missing(next_learn, learn_from_lessons, diffs_ns_de)
-            if json.dumps(existing_learn, ensure_ascii=False, sort_keys=True) != json.dumps(next_learn, ensure_ascii=False, sort_keys=True):
-                os.makedirs(os.path.dirname(de_learn_file), exist_ok=True)
-                save_json(de_learn_file, next_learn)
-            if diffs_ns_de:
-                print(f"INFO: de/learn.json ergänzt. Abweichende bestehende Werte nicht überschrieben: {len(diffs_ns_de)}")
-        else:
-            print("INFO: Keine gültige lessons.json-Liste gefunden; Überspringe Learn-Sync.")
-    except Exception as e:
-        print(f"INFO: Learn-Sync (de/learn.json) übersprungen: {e}")
+    # --namespace/--lang: nicht ausgewählte Namespaces/Sprachen werden weder geparst
+    # noch gehasht noch geschrieben; ihre Manifest-Einträge bleiben unverändert.
+    ns_globs = split_globs(args.namespaces)
+    lang_globs = split_globs(args.langs)
+    langs = [lang for lang in TARGET_LANGS if matches_globs(lang, lang_globs)]
+    if not langs:
+        print(f"❌ --lang {','.join(lang_globs)} passt auf keine Zielsprache ({', '.join(TARGET_LANGS)}). Abbruch.")
+        return
+
+    # Quell-Sync: data/learn (lessons, quiz, scam-scenarios) → de/<ns>.json, nur bei
+    # geändertem Fingerabdruck (siehe i18n_source_sync.py). Neu übernommene Keys gehen
+    # direkt in die Arbeitsmenge.
+    with PROFILE.phase("source-sync"):
+        sync_report = sync_sources(de_ns_dir, HASH_DIR, save_json, include=lambda ns: matches_globs(ns, ns_globs))
+    synced_paths = sync_report.added
+    for ns_name, added in sorted(synced_paths.items()):
+        print(f"INFO: de/{ns_name}.json aus Lern-Daten ergänzt: {len(added)} Key(s)")
+    for ns_name, keys in carried.get("en", {}).items():
+        synced_paths[ns_name] = synced_paths.get(ns_name, set()) | keys
+    for source, diffs in sync_report.diffs.items():
+        print(f"INFO: Quell-Sync '{source}': abweichende bestehende Werte nicht überschrieben: {len(diffs)}")
+    for source, dangling in sync_report.dangling.items():
+        print(f"⚠️ Quell-Sync '{source}': {len(dangling)} referenzierte Key(s) ohne DE-Text: {', '.join(dangling[:5])}{' …' if len(dangling) > 5 else ''}")
+    for source, err in sync_report.errors.items():
+        print(f"INFO: Quell-Sync '{source}' übersprungen: {err}")
 
     # API-Keys aus Umgebungsvariablen lesen (bereits oben geprüft, hier nur Variablen verwenden)
     openai_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_KEY")
@@ -885,186 +1651,317 @@ def main():
     if not ns_files:
         print(f"INFO: Keine Namespaces in {de_ns_dir} gefunden. Nichts zu tun.")
         return
+    if ns_globs or lang_globs:
+        all_ns = len(ns_files)
+        ns_files = [f for f in ns_files if matches_globs(f[:-5], ns_globs)]
+        if not ns_files:
+            print(f"❌ --namespace {','.join(ns_globs)} passt auf keinen Namespace in {de_ns_dir}. Abbruch.")
+            return
+        print(f"INFO: Auswahl: {len(ns_files)}/{all_ns} Namespace(s), Sprachen: {', '.join(langs)}")
 
-    check_namespace_key_collisions(de_ns_dir, ns_files)
+    with PROFILE.phase("collision-check"):
+        check_namespace_key_collisions(de_ns_dir, ns_files)
 
-    for ns_file in sorted(ns_files):
+    # --since: Arbeitsmenge exakt aus dem Git-Diff der DE-Quellen statt aus den Manifesten.
+    since_changed: Dict[str, Set[str]] = {}
+    if since_ref:
+        if not _git_ref_exists(base_path, since_ref):
+            print(f"❌ Git-Ref nicht gefunden: {since_ref}. Abbruch.")
+            return
+        with PROFILE.phase("plan"):
+            since_changed = changed_paths_since(base_path, since_ref, ns_files)
+        total = sum(len(v) for v in since_changed.values())
+        print(f"INFO: --since {since_ref}: {total} geänderte/neue Key(s) in {sum(1 for v in since_changed.values() if v)} Namespace(s)")
+
+    estimates: Dict[tuple[str, str], int] = {}
+    if EVENTS.progress or SHARD.active:
+        with PROFILE.phase("plan"):
+            work = _plan_work(
+                base_path, ns_files,
+                forced_list=forced_list, do_full=do_full,
+                since_changed=since_changed if since_ref else None, any_force_key=any_force_key,
+                synced_paths=synced_paths,
+                langs=langs,
+            )
+        if SHARD.active:
+            # Namespaces mit offener Phase-A-Arbeit bleiben als Ganzes in einem Shard
+            # (Phase B braucht den neuen EN-Pivot, siehe i18n_shard.py).
+            try:
+                SHARD.assign(
+                    {job: chars for job, (_, chars) in work.items()},
+                    {ns for (ns, lang), (count, _) in work.items() if lang == "en" and count},
+                    HASH_DIR,
+                )
+            except ValueError as e:
+                print(f"❌ Shard-Plan: {e}. Abbruch.")
+                return
+            print(
+                f"INFO: Shard {SHARD.index}/{SHARD.count} (Plan {SHARD.plan_id}{', übernommen' if SHARD.reused else ''}): "
+                f"{len(SHARD.jobs)} Job(s), ~{SHARD.chars} von {SHARD.total_chars} Zeichen"
+            )
+        if EVENTS.progress:
+            estimates = {job: count for job, (count, _) in work.items() if SHARD.owns(*job)}
+            for (_, lang), n in estimates.items():
+                EVENTS.plan(lang, n)
+
+    # Gescheiterte Keys je bearbeitetem Job (ohne vom Budget übersprungene) für
+    # .i18n_hash/failed.json (i18n_status.py).
+    failures: Dict[tuple[str, str], Set[str]] = {}
+
+    # Mit Budget läuft die ganze Namespace-Schleife einmal je Prioritätsstufe (siehe
+    # i18n_budget.py); ohne Budget genau einmal wie bisher.
+    for tier, ns_file in ((t, f) for t in SCHEDULER.passes() for f in sorted(ns_files)):
         ns_name = ns_file[:-5]
+        if not SHARD.owns_namespace(ns_name):
+            continue
+        if tier != SCHEDULER.tier:
+            SCHEDULER.begin_pass(tier)
+            EVENTS.say(f"\n▶️ Durchgang {tier + 1}/{len(TIER_NAMES)}: {TIER_NAMES[tier]}")
+        SCHEDULER.set_namespace(ns_name)
         ns_base_path = os.path.join(de_ns_dir, ns_file)
-        ns_base = load_json(ns_base_path)
+        with PROFILE.phase("plan", ns_name):
+            ns_base = load_json(ns_base_path)
         if not isinstance(ns_base, dict):
             print(f"INFO: Überspringe ungültigen Namespace {ns_name} ({ns_file})")
             continue
 
-        print(f"\n🧩 Namespace '{ns_name}':")
+        EVENTS.say(f"\n🧩 Namespace '{ns_name}':")
 
         # Force-Keys für diesen Namespace
         forced_paths = expand_forced_paths(ns_base, forced_list, namespace=ns_name) if forced_list else set()
 
         # Phase A: de -> en (hash-basiert)
-        try:
-            en_dir = os.path.join(base_path, "en")
-            os.makedirs(en_dir, exist_ok=True)
-            en_out = os.path.join(en_dir, f"{ns_name}.json")
-            en_existing = load_json(en_out)
-            failed_paths_en: Set[str] = set()
-
-            # Flatten DE-NS (relativ) und bilde Präfix für Manifest
-            de_flat_rel = _flatten_dict(ns_base, prefix="")
-            de_flat_pref = {f"{ns_name}.{k}": v for k, v in de_flat_rel.items()}
-            man_en = _load_manifest("en", "de")
-
-            # Inkrementell: nur Keys mit geändertem Hash übersetzen; Full-Lauf übersetzt alles.
-            # Ein gezielter --force-key-Lauf (ohne --full) rührt NUR die erzwungenen Pfade an -
-            # keine generelle Hash-Drift-Erkennung über den ganzen Namespace, damit unabhängige,
-            # längst übersetzte Keys nicht durch einen zufällig abweichenden Hash (z.B. History-
-            # bedingte Manifest/Content-Drift) erneut angefasst werden.
-            #
-            # Bug (reproduziert u.a. an trading.json während eines --force-key
-            # common.accountMode-Laufs): war forced_paths für DIESEN Namespace leer (der
-            # Force-Key gehörte zu einem ANDEREN Namespace), fiel der Code in den
-            # generischen Hash-Drift-Zweig - und jede vorbestehende, unabhängige
-            # Manifest/Content-Drift (typischerweise von Hand-Edits an Sprachdateien vorbei
-            # am Skript) wurde bei diesem völlig unbeteiligten Lauf "gratis" mitübersetzt.
-            # any_force_key unterscheidet jetzt "kein --force-key angegeben" (normaler
-            # inkrementeller Lauf, Hash-Drift-Erkennung soll greifen) von "--force-key
-            # angegeben, aber nicht für DIESEN Namespace" (dieser Namespace bleibt komplett
-            # unangetastet - nur echte Lücken werden weiterhin gefüllt, siehe
-            # merge_keys_missing_or_changed: "key not in out" ist unabhängig von changed_rel).
-            if do_full:
-                changed_rel = set(de_flat_rel.keys())
-            elif forced_paths:
-                changed_rel = set(forced_paths)
-            elif any_force_key:
-                changed_rel = set()
-            else:
-                changed_rel = set(
-                    k for k, v in de_flat_rel.items()
-                    if man_en.get(f"{ns_name}.{k}") != _sha256(str(v))
-                )
-
-            if do_full:
-                en_translated = translate_full(
-                    ns_base,
-                    "en",
-                    provider,
-                    openai_key,
-                    deepl_key,
-                    target_existing={},
-                    forced_paths=forced_paths,
-                    counters=counters,
-                    failed_paths=failed_paths_en,
-                )
-            else:
-                en_translated = merge_keys_missing_or_changed(
-                    ns_base,
-                    en_existing,
-                    "en",
-                    provider,
-                    openai_key,
-                    deepl_key,
-                    changed_paths=changed_rel,
-                    forced_paths=forced_paths,
-                    counters=counters,
-                    failed_paths=failed_paths_en,
+        # Mit --shard nur, wenn (ns, en) diesem Shard gehört; sonst hat Phase A für diesen
+        # Namespace keine offene Arbeit (siehe i18n_shard.py) und der EN-Pivot ist aktuell.
+        # Mit --lang ohne "en" ebenso; bei --since gelten dann die Git-Diff-Pfade für Phase B
+        # (der EN-Pivot wurde für sie vorher gesondert nachgezogen).
+        en_out = os.path.join(base_path, "en", f"{ns_name}.json")
+        changed_rel: Set[str] = set()
+        failed_paths_en: Set[str] = set()
+        run_phase_a = "en" in langs and SHARD.owns(ns_name, "en")
+        if "en" not in langs and since_ref:
+            changed_rel = since_changed.get(ns_name, set()) | forced_paths
+        if run_phase_a:
+            try:
+                os.makedirs(os.path.dirname(en_out), exist_ok=True)
+                with PROFILE.phase("plan", ns_name):
+                    en_existing = load_json(en_out)
+
+                    # Flatten DE-NS (relativ) und bilde Präfix für Manifest
+                    de_flat_rel = _flatten_dict(ns_base, prefix="")
+                    de_flat_pref = {f"{ns_name}.{k}": v for k, v in de_flat_rel.items()}
+                    man_en = _load_manifest("en", "de")
+
+                    # Inkrementell: nur Keys mit geändertem Hash übersetzen; Full-Lauf übersetzt alles.
+                    # Ein gezielter --force-key-Lauf (ohne --full) rührt NUR die erzwungenen Pfade an -
+                    # keine generelle Hash-Drift-Erkennung über den ganzen Namespace, damit unabhängige,
+                    # längst übersetzte Keys nicht durch einen zufällig abweichenden Hash (z.B. History-
+                    # bedingte Manifest/Content-Drift) erneut angefasst werden.
+                    #
+                    # Bug (reproduziert u.a. an trading.json während eines --force-key
+                    # common.accountMode-Laufs): war forced_paths für DIESEN Namespace leer (der
+                    # Force-Key gehörte zu einem ANDEREN Namespace), fiel der Code in den
+                    # generischen Hash-Drift-Zweig - und jede vorbestehende, unabhängige
+                    # Manifest/Content-Drift (typischerweise von Hand-Edits an Sprachdateien vorbei
+                    # am Skript) wurde bei diesem völlig unbeteiligten Lauf "gratis" mitübersetzt.
+                    # any_force_key unterscheidet jetzt "kein --force-key angegeben" (normaler
+                    # inkrementeller Lauf, Hash-Drift-Erkennung soll greifen) von "--force-key
+                    # angegeben, aber nicht für DIESEN Namespace" (dieser Namespace bleibt komplett
+                    # unangetastet - nur echte Lücken werden weiterhin gefüllt, siehe
+                    # merge_keys_missing_or_changed: "key not in out" ist unabhängig von changed_rel).
+                    #
+                    # --since ersetzt die Manifest-Drift-Erkennung durch den Git-Diff (plus etwaige
+                    # --force-key-Pfade); die Manifeste werden weiterhin für die tatsächlich
+                    # übersetzten Keys nachgezogen, aber nicht mehr für die Entscheidung befragt.
+                    changed_rel = _changed_rel_keys(
+                        de_flat_rel, man_en, ns_name,
+                        do_full=do_full,
+                        since_paths=(since_changed.get(ns_name, set()) | forced_paths) if since_ref else None,
+                        forced_paths=forced_paths,
+                        any_force_key=any_force_key,
+                        synced_paths=synced_paths.get(ns_name, set()),
+                    )
+                    if SCHEDULER.first_pass:
+                        _report_planned("en", ns_name, _planned_rel_keys(de_flat_rel, {} if do_full else en_existing, changed_rel), de_flat_rel, estimates)
+                EVENTS.set_context(ns=ns_name, lang="en")
+                EVENTS.mark_idle()
+
+                with PROFILE.phase("phase-a", ns_name):
+                    # Mit Budget auch --full über den Merge (changed_rel = alle Keys), damit
+                    # spätere Durchgänge die Übersetzungen früherer nicht verwerfen.
+                    if do_full and not SCHEDULER.active:
+                        en_translated = translate_full(
+                            ns_base,
+                            "en",
+                            provider,
+                            openai_key,
+                            deepl_key,
+                            target_existing={},
+                            forced_paths=forced_paths,
+                            counters=counters,
+                            failed_paths=failed_paths_en,
+                        )
+                    else:
+                        en_translated = merge_keys_missing_or_changed(
+                            ns_base,
+                            en_existing,
+                            "en",
+                            provider,
+                            openai_key,
+                            deepl_key,
+                            changed_paths=changed_rel,
+                            forced_paths=forced_paths,
+                            counters=counters,
+                            failed_paths=failed_paths_en,
+                        )
+                    if do_prune:
+                        en_translated = prune_extra_keys(ns_base, en_translated)
+                with PROFILE.phase("save", ns_name):
+                    _count_written(provider, "en", en_out, save_json(en_out, en_translated))
+                EVENTS.note("namespaceUpdated", f"   → en/{ns_name}.json aktualisiert")
+
+                # Manifest aktualisieren (EN from DE) - NUR für Keys, die dieser Lauf
+                # tatsächlich übersetzt/ergänzt hat (do_full: alle; sonst: fehlende + changed_rel).
+                # Alle anderen Keys behalten ihren bisherigen Manifest-Eintrag unangetastet, damit
+                # echte, noch nicht nachgezogene Drift nicht durch einen unbeteiligten --force-key-
+                # Lauf still als "erledigt" markiert wird, ohne je neu übersetzt worden zu sein.
+                with PROFILE.phase("manifest", ns_name):
+                    touched_rel_en = set(de_flat_rel.keys()) if do_full else (_missing_rel_keys(de_flat_rel, en_existing) | changed_rel)
+                    for k, v in de_flat_pref.items():
+                        rel = k.split(f"{ns_name}.", 1)[-1]
+                        if rel in failed_paths_en or rel not in touched_rel_en:
+                            continue
+                        man_en[k] = SOURCE_ANALYSIS.digest(str(v))
+                    _count_written(provider, "en", _manifest_out_path("en", "de"), _save_manifest("en", "de", man_en))
+                # Verdächtige Übersetzungen (length_ratio) haben ihren Manifest-Eintrag, stehen
+                # aber trotzdem in failed.json.
+                failures.setdefault((ns_name, "en"), set()).update(
+                    r for r in failed_paths_en | VALIDATION.take_suspicious() if ("en", r) not in SCHEDULER.skipped
                 )
-            if do_prune:
-                en_translated = prune_extra_keys(ns_base, en_translated)
-            save_json(en_out, en_translated)
-            print(f"   → en/{ns_name}.json aktualisiert")
-
-            # Manifest aktualisieren (EN from DE) - NUR für Keys, die dieser Lauf
-            # tatsächlich übersetzt/ergänzt hat (do_full: alle; sonst: fehlende + changed_rel).
-            # Alle anderen Keys behalten ihren bisherigen Manifest-Eintrag unangetastet, damit
-            # echte, noch nicht nachgezogene Drift nicht durch einen unbeteiligten --force-key-
-            # Lauf still als "erledigt" markiert wird, ohne je neu übersetzt worden zu sein.
-            touched_rel_en = set(de_flat_rel.keys()) if do_full else (_missing_rel_keys(de_flat_rel, en_existing) | changed_rel)
-            for k, v in de_flat_pref.items():
-                rel = k.split(f"{ns_name}.", 1)[-1]
-                if rel in failed_paths_en or rel not in touched_rel_en:
-                    continue
-                man_en[k] = _sha256(str(v))
-            _save_manifest("en", "de", man_en)
-        except Exception as e:
-            print(f"❌ Abbruch für Sprache en / Namespace {ns_name}: {e}")
-            continue
+            except Exception as e:
+                VALIDATION.take_suspicious()
+                EVENTS.say(f"❌ Abbruch für Sprache en / Namespace {ns_name}: {e}")
+                continue
 
         # Phase B: en -> andere (hash-basiert, Pivot EN-NS)
-        en_ns = load_json(en_out) or {}
-        en_flat_rel = _flatten_dict(en_ns, prefix="")
-        en_flat_pref = {f"{ns_name}.{k}": v for k, v in en_flat_rel.items()}
+        with PROFILE.phase("plan", ns_name):
+            en_ns = load_json(en_out) or {}
+            en_flat_rel = _flatten_dict(en_ns, prefix="")
+            en_flat_pref = {f"{ns_name}.{k}": v for k, v in en_flat_rel.items()}
 
-        for lang in TARGET_LANGS:
-            if lang == "en":
+        for lang in langs:
+            if lang == "en" or not SHARD.owns(ns_name, lang):
                 continue
             try:
                 out_dir = os.path.join(base_path, lang)
                 os.makedirs(out_dir, exist_ok=True)
                 out_file = os.path.join(out_dir, f"{ns_name}.json")
-                existing = load_json(out_file)
                 failed_paths_lang: Set[str] = set()
-
-                man_lang = _load_manifest(lang, "en")
-
-                # Gleiche Begründung wie bei changed_rel in Phase A oben: ein --force-key
-                # für einen anderen Namespace darf hier keine generische Hash-Drift-
-                # Erkennung auslösen.
-                if do_full:
-                    changed_rel_lang = set(en_flat_rel.keys())
-                elif forced_paths:
-                    changed_rel_lang = set(forced_paths)
-                elif any_force_key:
-                    changed_rel_lang = set()
-                else:
-                    changed_rel_lang = set(
-                        k for k, v in en_flat_rel.items()
-                        if man_lang.get(f"{ns_name}.{k}") != _sha256(str(v))
-                    )
-
-                if do_full:
-                    translated = translate_full(
-                        en_ns,
-                        lang,
-                        provider,
-                        openai_key,
-                        deepl_key,
-                        target_existing={},
-                        forced_paths=set(),
-                        counters=counters,
-                        failed_paths=failed_paths_lang,
-                    )
-                else:
-                    translated = merge_keys_missing_or_changed(
-                        en_ns,
-                        existing,
-                        lang,
-                        provider,
-                        openai_key,
-                        deepl_key,
-                        changed_paths=changed_rel_lang,
+                with PROFILE.phase("plan", ns_name):
+                    existing = load_json(out_file)
+                    man_lang = _load_manifest(lang, "en")
+
+                    # Gleiche Begründung wie bei changed_rel in Phase A oben: ein --force-key
+                    # für einen anderen Namespace darf hier keine generische Hash-Drift-
+                    # Erkennung auslösen.
+                    #
+                    # --since: exakt die in Phase A neu übersetzten Pfade (die EN-Struktur spiegelt
+                    # die DE-Struktur, relative Pfade sind identisch) - ohne die, bei denen Phase A
+                    # gescheitert ist, denn deren EN-Pivot ist noch der alte Stand.
+                    changed_rel_lang = _changed_rel_keys(
+                        en_flat_rel, man_lang, ns_name,
+                        do_full=do_full,
+                        since_paths=(changed_rel - failed_paths_en) if since_ref else None,
                         forced_paths=forced_paths,
-                        counters=counters,
-                        failed_paths=failed_paths_lang,
+                        any_force_key=any_force_key,
+                        # Aus dem Checkpoint: eigene zurückgestellte Keys plus die in Phase A
+                        # nachgeholten (deren EN-Pivot sich gerade erst geändert hat).
+                        synced_paths=carried.get(lang, {}).get(ns_name, set()) | (
+                            carried.get("en", {}).get(ns_name, set()) - failed_paths_en if run_phase_a else set()
+                        ),
                     )
-                if do_prune:
-                    translated = prune_extra_keys(en_ns, translated)
-                save_json(out_file, translated)
-                print(f"   → {lang}/{ns_name}.json aktualisiert")
+                    if SCHEDULER.first_pass:
+                        _report_planned(lang, ns_name, _planned_rel_keys(en_flat_rel, {} if do_full else existing, changed_rel_lang), en_flat_rel, estimates)
+                EVENTS.set_context(ns=ns_name, lang=lang)
+                EVENTS.mark_idle()
+
+                with PROFILE.phase(f"phase-b:{lang}", ns_name):
+                    if do_full and not SCHEDULER.active:
+                        translated = translate_full(
+                            en_ns,
+                            lang,
+                            provider,
+                            openai_key,
+                            deepl_key,
+                            target_existing={},
+                            forced_paths=set(),
+                            counters=counters,
+                            failed_paths=failed_paths_lang,
+                        )
+                    else:
+                        translated = merge_keys_missing_or_changed(
+                            en_ns,
+                            existing,
+                            lang,
+                            provider,
+                            openai_key,
+                            deepl_key,
+                            changed_paths=changed_rel_lang,
+                            forced_paths=forced_paths,
+                            counters=counters,
+                            failed_paths=failed_paths_lang,
+                        )
+                    if do_prune:
+                        translated = prune_extra_keys(en_ns, translated)
+                with PROFILE.phase("save", ns_name):
+                    _count_written(provider, lang, out_file, save_json(out_file, translated))
+                EVENTS.note("namespaceUpdated", f"   → {lang}/{ns_name}.json aktualisiert")
 
                 # Manifest aktualisieren (lang from EN) - NUR für tatsächlich verarbeitete Keys
                 # (siehe Kommentar bei Phase A oben - gleiche Begründung).
-                touched_rel_lang = set(en_flat_rel.keys()) if do_full else (_missing_rel_keys(en_flat_rel, existing) | changed_rel_lang)
-                for k, v in en_flat_pref.items():
-                    rel = k.split(f"{ns_name}.", 1)[-1]
-                    if rel in failed_paths_lang or rel not in touched_rel_lang:
-                        continue
-                    man_lang[k] = _sha256(str(v))
-                _save_manifest(lang, "en", man_lang)
+                with PROFILE.phase("manifest", ns_name):
+                    touched_rel_lang = set(en_flat_rel.keys()) if do_full else (_missing_rel_keys(en_flat_rel, existing) | changed_rel_lang)
+                    for k, v in en_flat_pref.items():
+                        rel = k.split(f"{ns_name}.", 1)[-1]
+                        if rel in failed_paths_lang or rel not in touched_rel_lang:
+                            continue
+                        man_lang[k] = SOURCE_ANALYSIS.digest(str(v))
+                    _count_written(provider, lang, _manifest_out_path(lang, "en"), _save_manifest(lang, "en", man_lang))
+                failures.setdefault((ns_name, lang), set()).update(
+                    r for r in failed_paths_lang | VALIDATION.take_suspicious() if (lang, r) not in SCHEDULER.skipped
+                )
             except Exception as e:
-                print(f"❌ Abbruch für Sprache {lang} / Namespace {ns_name}: {e}")
+                VALIDATION.take_suspicious()
+                EVENTS.say(f"❌ Abbruch für Sprache {lang} / Namespace {ns_name}: {e}")
                 continue
 
-    print(f"\nZusammenfassung Namespaces: {{'skippedOriginalKeysCount': {counters.get('skippedOriginalKeysCount', 0)}, 'copiedOriginalKeysCount': {counters.get('copiedOriginalKeysCount', 0)}, 'preservedSpecialCharKeys': {counters.get('preservedSpecialCharKeys', 0)}, 'untranslatedEchoKeys': {counters.get('untranslatedEchoKeys', 0)}}}")
+    EVENTS.set_context(ns=None, lang=None)
+    if SHARD.active:
+        SHARD.write_failures(HASH_DIR, failures)
+    else:
+        record_failures(HASH_DIR, failures)
+    selected_ns = {f[:-5] for f in ns_files}
+    # Mit --shard je Shard ein eigener Checkpoint (zusammengeführt von i18n_shard.py merge).
+    checkpoint = SCHEDULER.save_checkpoint(SHARD.partial_dir(HASH_DIR) if SHARD.active else HASH_DIR, carried_over={
+        lang: {ns: keys for ns, keys in by_ns.items() if lang not in langs or ns not in selected_ns}
+        for lang, by_ns in carried.items()
+    })
+    if checkpoint and SCHEDULER.stop_reason:
+        print(f"⏸️ Lauf vorzeitig beendet ({SCHEDULER.stop_reason}): {SCHEDULER.deferred_count()} Key(s) zurückgestellt → {checkpoint}; der nächste Lauf setzt dort fort.")
+    if SHARD.active:
+        SHARD.write_marker(HASH_DIR)
+        print(f"INFO: Teil-Manifeste unter {SHARD.partial_dir(HASH_DIR)}; nach allen Shards: python3 i18n_shard.py merge --base-path {base_path}")
+    for (ns_left, lang_left), n in estimates.items():
+        # Geschätzt, aber nie erreicht (z.B. Abbruch einer Sprache) - ETA nicht verfälschen.
+        EVENTS.plan(lang_left, -n)
+
+    print(f"\nZusammenfassung Dateien: {WRITE_STATS['written']} geschrieben, {WRITE_STATS['unchanged']} unverändert (nicht angefasst)")
+    print(f"Zusammenfassung Dokument-Cache: {i18n_json.DOCUMENTS.summary()}")
+    print(f"Zusammenfassung Quelltext-Analyse: {SOURCE_ANALYSIS.summary()}")
+    print(f"Zusammenfassung Validierung: {VALIDATION.summary()}")
+    if SCHEDULER.active or SCHEDULER.stop_reason:
+        print(f"Zusammenfassung Budget: {SCHEDULER.summary()}")
+    print(f"Zusammenfassung Namespaces: {{'skippedOriginalKeysCount': {counters.get('skippedOriginalKeysCount', 0)}, 'copiedOriginalKeysCount': {counters.get('copiedOriginalKeysCount', 0)}, 'preservedSpecialCharKeys': {counters.get('preservedSpecialCharKeys', 0)}, 'untranslatedEchoKeys': {counters.get('untranslatedEchoKeys', 0)}}}")
     if counters.get('preservedSpecialCharKeys', 0) > 0:
         print(
             f"⚠️  {counters['preservedSpecialCharKeys']} Key(s) blieben unübersetzt, weil ein Sonderzeichen "
@@ -1079,6 +1976,9 @@ def main():
             "Diese Keys wurden NICHT als erledigt ins Manifest übernommen und werden beim nächsten Lauf "
             "automatisch erneut versucht."
         )
+    quiet_summary = EVENTS.quiet_summary()
+    if quiet_summary:
+        print(quiet_summary)
     print("\n✅ Namespaced-Verarbeitung abgeschlossen.")
 
 
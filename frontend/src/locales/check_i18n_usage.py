@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-import os, re, json, sys, time
+import hashlib, os, re, sys, time
 from typing import Dict, Set, List, Tuple
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_json  # noqa: E402
+
 # ==== KONFIG ====
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 LOCALES_DIR = os.path.join(PROJECT_ROOT, "frontend", "src", "locales")
@@ -27,8 +30,7 @@ CODE_EXTS = {".js", ".jsx", ".ts", ".tsx"}
 
 # ==== Helper ====
 def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    i18n_json.write_json_if_changed(path, data)
 
 def delete_path(d: dict, dotted: str) -> bool:
     """Löscht einen verschachtelten Key nach Pfad 'a.b.c'. Gibt True zurück, wenn er existierte."""
@@ -61,9 +63,9 @@ def load_json(path: str) -> Dict:
     if not os.path.exists(path):
         print(f"⚠️ JSON nicht gefunden: {path}")
         return {}
-    with open(path, encoding="utf-8") as f:
+    with open(path, "rb") as f:
         s = f.read().strip()
-        return json.loads(s) if s else {}
+        return i18n_json.loads(s) if s else {}
 
 def deep_merge_dict(dst: Dict, src: Dict) -> Dict:
     """Rekursiv src in dst mergen (Dicts werden tief zusammengeführt)."""
@@ -113,14 +115,140 @@ def flatten_i18n(d, prefix=""):
                 pass
     return out
 
+def _bracket_end(pattern: str, i: int) -> int:
+    """Index der ']', die die Klasse ab pattern[i] == '[' schließt (-1: keine Klasse).
+    Eine ']' direkt nach '[' bzw. '[!' gehört zur Klasse."""
+    first = i + 2 if pattern.startswith("!", i + 1) else i + 1
+    return pattern.find("]", first + 1)
+
+
+def _gitignore_regex(pattern: str, anchored: bool) -> str:
+    """Übersetzt ein .gitignore-Muster in eine Regex über den relativen Pfad (mit '/')."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and _bracket_end(pattern, i) > 0:
+            # Nur '!' direkt nach '[' negiert; '^' ist sonst ein gewöhnliches Zeichen.
+            end = _bracket_end(pattern, i)
+            negate = pattern.startswith("!", i + 1)
+            body = pattern[i + 2 if negate else i + 1:end]
+            body = body.replace("\\", "\\\\").replace("^", "\\^").replace("[", "\\[")
+            out.append("[" + ("^" if negate else "") + body + "]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    # Ohne '/' im Muster gilt es (wie bei git) in jeder Tiefe.
+    return ("" if anchored else "(?:.*/)?") + "".join(out)
+
+class GitIgnore:
+    """
+    Regeln einer .gitignore (Teilmenge der git-Syntax: #, !, **, führendes/abschließendes /).
+    Je Pfadart (Ordner/Datei) eine kombinierte Regex mit einer Gruppe je Regel in
+    umgekehrter Reihenfolge: die erste passende Alternative ist die letzte passende
+    Regel - die gewinnt wie bei git. Ein match() je Pfad statt einem je Regel.
+    """
+
+    def __init__(self, base: str, lines: List[str]):
+        self.base = base
+        rules = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate or line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            rules.append((_gitignore_regex(line.lstrip("/"), "/" in line), negate, dir_only))
+        rules.reverse()
+        self._dirs = self._compile(rules)
+        self._files = self._compile([r for r in rules if not r[2]])
+
+    @staticmethod
+    def _compile(rules):
+        if not rules:
+            return None, ()
+        regex = re.compile("(?:" + "|".join(f"({pattern})" for pattern, _, _ in rules) + r")\Z")
+        return regex, tuple(negate for _, negate, _ in rules)
+
+    @classmethod
+    def load(cls, dirpath: str):
+        """GitIgnore aus dirpath/.gitignore oder None."""
+        try:
+            with open(os.path.join(dirpath, ".gitignore"), encoding="utf-8", errors="ignore") as f:
+                return cls(dirpath, f.read().splitlines())
+        except OSError:
+            return None
+
+    def match(self, path: str, is_dir: bool):
+        """True = ignoriert, False = per ! wieder aufgenommen, None = keine Regel passt."""
+        regex, negates = self._dirs if is_dir else self._files
+        if regex is None:
+            return None
+        # path liegt immer unter base (beide aus demselben Walk) - kein relpath nötig
+        m = regex.match(path[len(self.base) + 1:].replace(os.sep, "/"))
+        return None if m is None else not negates[m.lastindex - 1]
+
+def is_ignored(ignores: List[GitIgnore], path: str, is_dir: bool) -> bool:
+    """Tiefere .gitignore-Dateien gehen vor, wie bei git."""
+    for gi in reversed(ignores):
+        result = gi.match(path, is_dir)
+        if result is not None:
+            return result
+    return False
+
 def iter_code_files(root: str):
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Ordner filtern
-        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
-        for fn in filenames:
-            _, ext = os.path.splitext(fn)
-            if ext.lower() in CODE_EXTS:
-                yield os.path.join(dirpath, fn)
+    """
+    Code-Dateien unter root in fester Reihenfolge (Einträge je Ordner nach Namen
+    sortiert). Ordner aus IGNORE_DIRS und per .gitignore ignorierte Pfade werden per
+    os.scandir gar nicht erst betreten; es gelten die .gitignore-Dateien in root, in
+    dessen Oberordnern bis PROJECT_ROOT und in allen Unterordnern.
+    """
+    root = os.path.abspath(root)
+    parents = []
+    d = os.path.dirname(root)
+    while d == PROJECT_ROOT or d.startswith(PROJECT_ROOT + os.sep):
+        parents.append(d)
+        d = os.path.dirname(d)
+    ignores = [gi for gi in map(GitIgnore.load, reversed(parents)) if gi is not None]
+    yield from _walk_code_files(root, ignores)
+
+def _walk_code_files(dirpath: str, ignores: List[GitIgnore]):
+    gi = GitIgnore.load(dirpath)
+    if gi is not None:
+        ignores = ignores + [gi]
+    try:
+        entries = sorted(os.scandir(dirpath), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # Symlink-Ordner wie bei os.walk nicht betreten
+            if entry.name in IGNORE_DIRS or entry.is_symlink() or is_ignored(ignores, entry.path, True):
+                continue
+            yield from _walk_code_files(entry.path, ignores)
+        elif os.path.splitext(entry.name)[1].lower() in CODE_EXTS and not is_ignored(ignores, entry.path, False):
+            yield entry.path
 
 # Namespace-Mapping: Code-Namespaces (case-insensitiv) -> echte Namespaces
 ns_map: Dict[str, str] = {}
@@ -133,72 +261,255 @@ ns_map: Dict[str, str] = {}
 # erlaubt: foo, foo.bar, foo_bar, foo1.bar2 (mind. 2 Zeichen insgesamt)
 VALID_KEY = r"[A-Za-z][A-Za-z0-9_.:]{1,}"
 
-RE_T_SINGLE = re.compile(rf"""(?<![A-Za-z0-9_])t\s*\(\s*'({VALID_KEY})'\s*\)""")
-RE_T_DOUBLE = re.compile(rf"""(?<![A-Za-z0-9_])t\s*\(\s*"({VALID_KEY})"\s*\)""")
-RE_T_BACK   = re.compile(rf"""(?<![A-Za-z0-9_])t\s*\(\s*`({VALID_KEY})`\s*\)""")
-
-# i18nKey‑Attribute wie gehabt
-RE_I18NKEY_DQ = re.compile(rf'''i18nKey\s*=\s*"({VALID_KEY})"''')
-RE_I18NKEY_SQ = re.compile(rf"""i18nKey\s*=\s*'({VALID_KEY})'""")
-RE_I18NKEY_BK = re.compile(rf"""i18nKey\s*=\s*`({VALID_KEY})`""")
-RE_I18NKEY_JS = re.compile(rf'''i18nKey\s*=\s*\{{\s*["'`]({VALID_KEY})["'`]\s*\}}''')
+# Alle sieben Key-Muster als eine Alternation - ein finditer je Zeile statt sieben
+# findall. Die Muster können sich nicht überlappen (Keys enthalten weder Klammern noch
+# Anführungszeichen), die Alternation findet also genau dieselben Treffer; genau eine
+# Gruppe ist je Treffer gesetzt (m.lastindex). Das Lookbehind steht hinter dem 't',
+# damit das Muster mit einem Literal beginnt - sonst prüft re es an jeder Position.
+RE_USAGE = re.compile(
+    rf"""t(?<![A-Za-z0-9_]t)\s*\(\s*(?:'({VALID_KEY})'|"({VALID_KEY})"|`({VALID_KEY})`)\s*\)"""
+    rf"""|i18nKey\s*=\s*(?:"({VALID_KEY})"|'({VALID_KEY})'|`({VALID_KEY})`"""
+    rf"""|\{{\s*["'`]({VALID_KEY})["'`]\s*\}})"""
+)
 
 # Dynamische Präfixe wie 'foo.bar:' + var
 RE_DYNAMIC_PREFIX = re.compile(r"""['"]([A-Za-z0-9_.:-]+:)['"]\s*\+""")
 
-def extract_keys_with_locations(path: str):
+# i18n-Kontext: nur Zeilen mit einem dieser Tokens werden untersucht.
+CONTEXT_TOKENS = ("t(", "i18nKey", "<Trans")
+
+
+def context_line_starts(text: str) -> List[int]:
+    """Aufsteigende Start-Offsets aller Zeilen mit i18n-Kontext. str.find springt von
+    Token zu Token; die übrigen Zeilen (die allermeisten) werden nie angefasst."""
+    starts = set()
+    for token in CONTEXT_TOKENS:
+        pos = text.find(token)
+        while pos != -1:
+            starts.add(text.rfind("\n", 0, pos) + 1)
+            end = text.find("\n", pos)
+            if end == -1:
+                break
+            pos = text.find(token, end)
+    return sorted(starts)
+
+
+def scan_text(text: str) -> Tuple[List[Tuple[str, int, str]], Set[str]]:
     """
-    Findet Keys NUR in Zeilen mit i18n-Kontext und liefert:
-      dict: key -> Liste[(datei, zeilennummer, zeileninhalt)]
-    i18n-Kontext bedeutet: Zeile enthält 't(', 'i18nKey' oder '<Trans'.
+    Ein Durchlauf über den Dateitext, liefert:
+      - Fundstellen: Liste[(roher key, zeilennummer, zeileninhalt.strip())], je Treffer
+        ein Eintrag (mehrfach genutzte Keys also mehrfach)
+      - dynamische Präfixe ('foo.bar:' + var)
+    Beides nur aus Zeilen mit i18n-Kontext. Die Keys bleiben roh (ns:foo.bar) -
+    normalize_key hängt vom Namespace-Mapping ab und läuft erst in main().
     """
-    key_locs = {}
+    hits: List[Tuple[str, int, str]] = []
+    dynamic: Set[str] = set()
+    lineno, prev = 1, 0
+    for start in context_line_starts(text):
+        lineno += text.count("\n", prev, start)
+        prev = start
+        end = text.find("\n", start)
+        line = text[start:] if end == -1 else text[start:end]
+        stripped = None
+        for m in RE_USAGE.finditer(line):
+            if stripped is None:
+                stripped = line.strip()
+            hits.append((m[m.lastindex], lineno, stripped))
+        if "+" in line:
+            dynamic.update(RE_DYNAMIC_PREFIX.findall(line))
+    return hits, dynamic
+
+
+def _read_and_scan(path: str):
+    """(Fundstellen, dynamische Präfixe, Fehlermeldung oder None, (Größe, mtime_ns, sha256)
+    oder None) - ohne Ausgabe, damit Worker-Prozesse nicht durcheinander auf stdout
+    schreiben. Gelesen wird binär (für den Hash des ScanCache); Dekodieren und
+    Zeilenenden wie beim Öffnen im Textmodus (utf-8, errors="ignore", universal newlines)."""
     try:
-        with open(path, encoding="utf-8", errors="ignore") as f:
-            for lineno, line in enumerate(f, start=1):
-                # ✅ Nur Zeilen mit echtem i18n-Kontext untersuchen
-                if "t(" not in line and "i18nKey" not in line and "<Trans" not in line:
-                    continue
-
-                # t('...'), t("..."), t(`...`)
-                for regex in (RE_T_SINGLE, RE_T_DOUBLE, RE_T_BACK):
-                    for match in regex.findall(line):
-                        k = normalize_key(match)
-                        if k:
-                            key_locs.setdefault(k, []).append((path, lineno, line.strip()))
-
-                # i18nKey="...", i18nKey={'...'}, i18nKey={`...`}
-                for regex in (RE_I18NKEY_DQ, RE_I18NKEY_SQ, RE_I18NKEY_BK, RE_I18NKEY_JS):
-                    for match in regex.findall(line):
-                        k = normalize_key(match)
-                        if k:
-                            key_locs.setdefault(k, []).append((path, lineno, line.strip()))
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
     except Exception as e:
-        print(f"⚠️ Konnte Datei nicht lesen: {path} ({e})")
+        return [], set(), str(e), None
+    text = raw.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    hits, dynamic = scan_text(text)
+    return hits, dynamic, None, (st.st_size, st.st_mtime_ns, hashlib.sha256(raw).hexdigest())
 
-    return key_locs
 
+def _scan_batch(paths: List[str]):
+    return [_read_and_scan(p) for p in paths]
 
-def extract_keys_from_file(path: str) -> Tuple[Set[str], Set[str]]:
-    used = set()
-    dynamic = set()
-    try:
-        with open(path, encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                # ✅ Nur Zeilen mit echtem i18n-Kontext untersuchen
-                if "t(" not in line and "i18nKey" not in line and "<Trans" not in line:
-                    continue
-
-                for regex in (RE_T_SINGLE, RE_T_DOUBLE, RE_T_BACK):
-                    used.update(regex.findall(line))
-                for regex in (RE_I18NKEY_DQ, RE_I18NKEY_SQ, RE_I18NKEY_BK, RE_I18NKEY_JS):
-                    used.update(regex.findall(line))
-                dynamic.update(RE_DYNAMIC_PREFIX.findall(line))
 
-    except Exception as e:
-        print(f"⚠️ Konnte Datei nicht lesen: {path} ({e})")
+def scan_file(path: str) -> Tuple[List[Tuple[str, int, str]], Set[str]]:
+    """Liest eine Datei genau einmal und wertet sie mit scan_text aus."""
+    hits, dynamic, error, _ = _read_and_scan(path)
+    if error:
+        print(f"⚠️ Konnte Datei nicht lesen: {path} ({error})")
+    return hits, dynamic
 
-    return used, dynamic
+
+# ==== Scan-Cache ====
+SCAN_CACHE_FILE = "usage_scan_cache.json"
+# Erhöhen, wenn sich scan_text/_read_and_scan ändern. Änderungen an RE_USAGE,
+# RE_DYNAMIC_PREFIX oder CONTEXT_TOKENS machen den Cache über den Fingerabdruck ohnehin
+# ungültig.
+SCANNER_VERSION = 1
+SCANNER_FINGERPRINT = hashlib.sha256(
+    "\0".join([str(SCANNER_VERSION), RE_USAGE.pattern, RE_DYNAMIC_PREFIX.pattern, *CONTEXT_TOKENS]).encode("utf-8")
+).hexdigest()[:16]
+# Dateien, die beim Scan jünger sind, werden beim nächsten Lauf per Inhalt geprüft:
+# eine zweite Änderung innerhalb der mtime-Auflösung fiele über (Größe, mtime) nicht auf.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ScanCache:
+    """
+    Persistente Scan-Ergebnisse je Datei (.i18n_hash/usage_scan_cache.json), Schlüssel
+    ist der Pfad relativ zu root. Ein Eintrag gilt, solange Größe und mtime_ns passen -
+    die Datei wird dann gar nicht gelesen. Hat sich nur der Zeitstempel geändert
+    (checkout, touch, Speichern ohne Änderung), entscheidet der sha256 des Inhalts.
+    Ein anderer SCANNER_FINGERPRINT verwirft den ganzen Cache. Einträge für Dateien,
+    die im Lauf nicht mehr vorkommen, fallen beim Speichern weg.
+    """
+
+    def __init__(self, path: str, root: str):
+        self.path = path
+        self.root = root
+        self.entries: Dict[str, Dict] = {}
+        self.seen: Set[str] = set()
+        self.dirty = False
+        self.stats = {"hits": 0, "verified": 0, "misses": 0}
+        try:
+            with open(path, "rb") as f:
+                data = i18n_json.loads(f.read())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("scanner") == SCANNER_FINGERPRINT and isinstance(data.get("files"), dict):
+            self.entries = data["files"]
+        else:
+            self.dirty = True
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def lookup(self, path: str):
+        """(Fundstellen, dynamische Präfixe) aus dem Cache oder None (neu scannen)."""
+        key = self._key(path)
+        self.seen.add(key)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if entry["size"] != st.st_size:
+            return None
+        if entry["mtime_ns"] != st.st_mtime_ns:
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except OSError:
+                return None
+            if len(raw) != st.st_size or hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+                return None
+            self.entries[key] = dict(entry, mtime_ns=self._stable_mtime(st.st_mtime_ns))
+            self.dirty = True
+            self.stats["verified"] += 1
+        else:
+            self.stats["hits"] += 1
+        return [tuple(h) for h in entry["hits"]], set(entry["dynamic"])
+
+    @staticmethod
+    def _stable_mtime(mtime_ns: int):
+        # None erzwingt beim nächsten Lauf den Inhaltsvergleich.
+        return mtime_ns if time.time_ns() - mtime_ns >= RACY_WINDOW_NS else None
+
+    def store(self, path: str, meta, hits: List[Tuple[str, int, str]], dynamic: Set[str]) -> None:
+        size, mtime_ns, digest = meta
+        key = self._key(path)
+        self.seen.add(key)
+        self.entries[key] = {
+            "size": size,
+            "mtime_ns": self._stable_mtime(mtime_ns),
+            "sha256": digest,
+            "hits": [list(h) for h in hits],
+            "dynamic": sorted(dynamic),
+        }
+        self.dirty = True
+        self.stats["misses"] += 1
+
+    def save(self) -> None:
+        stale = self.entries.keys() - self.seen
+        if not self.dirty and not stale:
+            return
+        for key in stale:
+            del self.entries[key]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        i18n_json.write_json_if_changed(self.path, {
+            "scanner": SCANNER_FINGERPRINT,
+            "files": dict(sorted(self.entries.items())),
+        })
+        self.dirty = False
+
+
+# Unterhalb dieser Dateizahl scannt main() seriell: der Start eines Prozess-Pools
+# (~50-100 ms) kostet mehr als der ganze Scan (~0,2 ms je Datei).
+PARALLEL_MIN_FILES = 500
+
+
+def scan_files(
+    paths: List[str], jobs: int = 0, cache: ScanCache | None = None,
+) -> List[Tuple[List[Tuple[str, int, str]], Set[str]]]:
+    """
+    scan_file für alle paths, Ergebnisse in Eingabereihenfolge.
+
+    jobs > 1 verteilt Stapel zusammenhängender Dateien auf einen Prozess-Pool (re hält
+    das GIL, Threads brächten nichts); jobs = 0 wählt automatisch (CPU-Kerne ab
+    PARALLEL_MIN_FILES Dateien, sonst seriell). Zusammengeführt wird in der Reihenfolge
+    der Stapel, Warnungen erscheinen in Dateireihenfolge - der Report ist unabhängig von
+    jobs bytegleich. Lässt sich kein Pool starten (z. B. Container ohne /dev/shm), wird
+    seriell weitergemacht. Mit cache werden nur Dateien ohne gültigen Eintrag gelesen
+    (und nur deren Zahl zählt für die automatische Wahl von jobs).
+    """
+    out: List = [cache.lookup(p) if cache is not None else None for p in paths]
+    todo = [i for i, r in enumerate(out) if r is None]
+    todo_paths = [paths[i] for i in todo]
+    if jobs <= 0:
+        jobs = (os.cpu_count() or 1) if len(todo_paths) >= PARALLEL_MIN_FILES else 1
+    results = None
+    if jobs > 1 and len(todo_paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        # ~4 Stapel je Prozess: gleicht unterschiedlich große Dateien aus, ohne je
+        # Datei einen Roundtrip zu zahlen.
+        size = -(-len(todo_paths) // (jobs * 4))
+        batches = [todo_paths[i:i + size] for i in range(0, len(todo_paths), size)]
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = [r for batch in pool.map(_scan_batch, batches) for r in batch]
+        except (OSError, ImportError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"⚠️ Paralleler Scan nicht möglich ({e}) - scanne seriell.")
+    if results is None:
+        results = _scan_batch(todo_paths)
+
+    for i, path, (hits, dynamic, error, meta) in zip(todo, todo_paths, results):
+        if error:
+            print(f"⚠️ Konnte Datei nicht lesen: {path} ({error})")
+        elif cache is not None:
+            cache.store(path, meta, hits, dynamic)
+        out[i] = (hits, dynamic)
+    return out
+
+
+def extract_keys_from_file(path: str) -> Tuple[Set[str], Set[str]]:
+    """(rohe Keys, dynamische Präfixe) einer Datei - ohne Fundstellen."""
+    hits, dynamic = scan_file(path)
+    return {k for k, _, _ in hits}, dynamic
 
 def normalize_key(k: str) -> str:
     """
@@ -231,31 +542,44 @@ def load_all_de_keys() -> Set[str]:
     return keys
 
 # ==== Analyse ====
-def main():
+def main(argv: List[str] | None = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Prüft, welche i18n-Keys im Frontend genutzt werden, fehlen oder ungenutzt sind.")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help=f"Prozesse für den Scan (0 = automatisch: CPU-Kerne ab {PARALLEL_MIN_FILES} Dateien, sonst seriell; 1 = seriell)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Alle Dateien neu scannen, .i18n_hash/{SCAN_CACHE_FILE} weder lesen noch schreiben")
+    args = parser.parse_args(argv)
+
     de_keys = load_all_de_keys()
 
     used_keys: Set[str] = set()
     key_locations = {}  # key -> Liste[(file, lineno, line)]
     dynamic_prefixes: Set[str] = set()
-    files_scanned = 0
 
+    files = []
     for fp in iter_code_files(SRC_ROOT):
         norm = fp.replace("\\", "/")
         if "/locales/" in norm:
             continue
         if re.search(r"\.(test|spec)\.(js|jsx|ts|tsx)$", os.path.basename(fp), re.IGNORECASE):
             continue
-        files_scanned += 1
-        # Normale Extraktion für dynamische Prefix-Erkennung
-        kset, dyn = extract_keys_from_file(fp)
-        used_keys.update(normalize_key(k) for k in kset if k.strip())
+        files.append(fp)
+    files_scanned = len(files)
+
+    # Keys, Fundstellen und dynamische Präfixe aus einem Lesedurchgang je Datei
+    cache = None if args.no_cache else ScanCache(os.path.join(LOCALES_DIR, ".i18n_hash", SCAN_CACHE_FILE), SRC_ROOT)
+    results = scan_files(files, args.jobs, cache)
+    if cache is not None:
+        cache.save()
+    for fp, (hits, dyn) in zip(files, results):
+        for raw, lineno, text in hits:
+            k = normalize_key(raw)
+            used_keys.add(k)
+            key_locations.setdefault(k, []).append((fp, lineno, text))
         dynamic_prefixes.update(dyn)
 
-        # Neue Fundstellen-Erfassung
-        file_key_locs = extract_keys_with_locations(fp)
-        for k, locs in file_key_locs.items():
-            key_locations.setdefault(k, []).extend(locs)
-
     # Keys, die mit whitelisted dynamischen Präfixen beginnen, nicht als 'missing' zählen
     def has_whitelisted_dynamic_prefix(k: str) -> bool:
         return any(k.startswith(p) for p in DYNAMIC_PREFIX_WHITELIST)
@@ -328,8 +652,7 @@ def main():
 
     # Optional JSON speichern
     out_path = os.path.join(LOCALES_DIR, "i18n_usage_report.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    save_json(out_path, report)
     print(f"\n💾 Report gespeichert: {out_path}")
 
 if __name__ == "__main__":
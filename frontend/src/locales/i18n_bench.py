@@ -0,0 +1,356 @@
+"""
+End-to-End-Benchmark fuer UpdateSprachdateienBasierendAufDE.py.
+
+Erzeugt einen synthetischen de/-Baum (Anzahl Namespaces, Keys, Verschachtelungstiefe,
+Wertlaenge, Anteil flacher Punkt-Keys wie "d"/"d.fb" in quiz.json, Anteil Glossar-
+Gruppen mit ".original"-Key wie in common.json) und laesst main() darauf in mehreren
+Modi laufen - gegen einen Fake-DeepL auf urlopen-Ebene, sodass Retry/Backoff-Pfad,
+Platzhalter-Maskierung und Echo-Pruefung genauso durchlaufen werden wie im echten Lauf:
+
+    full         --full auf frischem Baum (alle Sprachen leer)
+    noop         derselbe Baum ohne Aenderung (Soll: 0 Requests, 0 geschriebene Dateien)
+    incremental  --changed-share der DE-Werte geaendert
+    force-key    --force-key auf den ersten Namespace
+
+Der Fake-Provider antwortet nach latency-ms (+/- jitter-ms) und liefert mit
+Wahrscheinlichkeit rate-limit-share ein 429. Mit --server laeuft stattdessen der lokale
+HTTP-Stand-in (i18n_fake_provider.py) mit denselben Einstellungen - dann sind echter
+Socket-/HTTP-Overhead und Retry-After-Header mit im Bild. Die Wartezeiten des Skripts selbst
+(0,25 s Drosselung pro Request, exponentieller Backoff) werden mit --sleep-scale
+skaliert (Default 0: nicht schlafen, aber als virtual_sleep_s mitzaehlen) - sonst
+misst der Benchmark hauptsaechlich time.sleep().
+
+Ergebnis (Parameter, Umgebung, je Modus Wand-/CPU-Zeit, Requests, Zeichen, Retries,
+429, geschriebene/unveraenderte Dateien, geparste Dokumente) als JSON (--out).
+
+Aufruf: python3 i18n_bench.py --namespaces 20 --keys 200 --out bench.json
+"""
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import ExitStack, redirect_stdout
+from typing import Any, Dict, List
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_json  # noqa: E402
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_metrics import METRICS  # noqa: E402
+
+SCENARIOS = ("full", "noop", "incremental", "force-key")
+
+_WORDS = (
+    "Konto", "Schlüssel", "Zahlung", "Netzwerk", "Gebühr", "Vertrauenslinie", "Guthaben",
+    "senden", "empfangen", "prüfen", "sicher", "schnell", "die", "der", "und", "mit",
+    "für", "dein", "neue", "Transaktion", "Adresse", "Memo", "Angebot", "Handel",
+)
+
+
+# -------- Synthetischer Baum --------
+
+def _text(rng: random.Random, length: int) -> str:
+    words: List[str] = []
+    while sum(len(w) + 1 for w in words) < length:
+        words.append(rng.choice(_WORDS))
+    text = " ".join(words)
+    return text[0].upper() + text[1:] + "."
+
+
+def generate_namespace(
+    rng: random.Random,
+    keys: int,
+    depth: int,
+    value_len: int,
+    dotted_share: float,
+    original_share: float,
+    fanout: int = 4,
+) -> Dict[str, Any]:
+    """Ein Namespace mit ungefaehr `keys` uebersetzbaren Blaettern."""
+    root: Dict[str, Any] = {}
+    for i in range(keys):
+        node = root
+        for _ in range(max(depth - 1, 0)):
+            node = node.setdefault(f"s{rng.randrange(fanout)}", {})
+        leaf = f"k{i}"
+        roll = rng.random()
+        if roll < original_share:
+            # Glossar-Gruppe wie common.json: "original" wird kopiert, nie uebersetzt.
+            node[leaf] = {
+                "title": _text(rng, 12),
+                "original": _text(rng, 12),
+                "short": _text(rng, value_len),
+            }
+        elif roll < original_share + dotted_share:
+            # Flacher Punkt-Key neben gleichnamigem Geschwister wie quiz.json ("d" / "d.fb").
+            node[leaf] = _text(rng, value_len)
+            node[f"{leaf}.fb"] = _text(rng, value_len)
+        else:
+            node[leaf] = _text(rng, value_len)
+    return root
+
+
+def generate_tree(
+    base_path: str,
+    *,
+    namespaces: int,
+    keys: int,
+    depth: int,
+    value_len: int,
+    dotted_share: float,
+    original_share: float,
+    seed: int,
+) -> List[str]:
+    """Schreibt base_path/de/ns<i>.json. Gibt die Namespace-Namen zurueck."""
+    rng = random.Random(seed)
+    de_dir = os.path.join(base_path, usd.BASE_LANG)
+    os.makedirs(de_dir, exist_ok=True)
+    names = [f"ns{i:03d}" for i in range(namespaces)]
+    for name in names:
+        data = generate_namespace(rng, keys, depth, value_len, dotted_share, original_share)
+        with open(os.path.join(de_dir, f"{name}.json"), "wb") as f:
+            f.write(i18n_json.dumps(data))
+    return names
+
+
+def mutate_tree(base_path: str, share: float, seed: int) -> int:
+    """Aendert ca. share aller uebersetzbaren DE-Werte. Gibt die Anzahl zurueck."""
+    rng = random.Random(seed)
+    de_dir = os.path.join(base_path, usd.BASE_LANG)
+    changed = 0
+
+    def visit(node: Dict[str, Any], path: str) -> None:
+        nonlocal changed
+        for k, v in node.items():
+            p = f"{path}.{k}" if path else k
+            if isinstance(v, dict):
+                visit(v, p)
+            elif isinstance(v, str) and not usd.is_original_key(p) and rng.random() < share:
+                node[k] = v[:-1] + " (geändert)."
+                changed += 1
+
+    for fname in sorted(os.listdir(de_dir)):
+        path = os.path.join(de_dir, fname)
+        with open(path, "rb") as f:
+            data = i18n_json.loads(f.read())
+        visit(data, "")
+        with open(path, "wb") as f:
+            f.write(i18n_json.dumps(data))
+    return changed
+
+
+# -------- Fake-Provider --------
+
+class _Response(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeDeepL:
+    """Ersatz fuer urllib.request.urlopen mit Latenz und 429-Injektion."""
+
+    def __init__(self, latency_ms: float, jitter_ms: float, rate_limit_share: float, seed: int, sleep) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_share = rate_limit_share
+        self.rng = random.Random(seed)
+        self.sleep = sleep
+        self.calls = 0
+        self.rate_limited = 0
+
+    def __call__(self, req, timeout=None):
+        import email.message
+        import urllib.error
+
+        self.calls += 1
+        delay = max(self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms), 0.0) / 1000.0
+        if delay:
+            self.sleep(delay)
+        if self.rng.random() < self.rate_limit_share:
+            self.rate_limited += 1
+            headers = email.message.Message()
+            headers["Retry-After"] = "1"
+            raise urllib.error.HTTPError(req.full_url, 429, "Too Many Requests", headers, None)
+        body = json.loads(req.data)
+        target = body["target_lang"]
+        out = [{"detected_source_language": body.get("source_lang"), "text": f"[{target}] {t}"} for t in body["text"]]
+        return _Response(json.dumps({"translations": out}).encode("utf-8"))
+
+
+# -------- Laeufe --------
+
+def _run_main(base_path: str, extra: List[str]) -> Dict[str, Any]:
+    argv = [
+        "UpdateSprachdateienBasierendAufDE.py",
+        "--provider", "deepl",
+        "--base-path", base_path,
+        "--progress", "off",
+        "--quiet",
+        *extra,
+    ]
+    wall0 = time.perf_counter()
+    cpu0 = time.process_time()
+    with mock.patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()):
+        usd.main()
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+    totals: Dict[str, Any] = {"requests": 0, "chars": 0, "retries": 0, "rate_limited": 0, "failures": 0}
+    for series in METRICS.to_dict()["series"]:
+        for k in totals:
+            totals[k] += series[k]
+    return {
+        "wall_s": round(wall, 4),
+        "cpu_s": round(cpu, 4),
+        **totals,
+        "files_written": usd.WRITE_STATS["written"],
+        "files_unchanged": usd.WRITE_STATS["unchanged"],
+        "documents_parsed": i18n_json.DOCUMENTS.stats["misses"],
+    }
+
+
+def run_benchmark(
+    *,
+    namespaces: int = 10,
+    keys: int = 100,
+    depth: int = 3,
+    value_len: int = 40,
+    dotted_share: float = 0.1,
+    original_share: float = 0.05,
+    changed_share: float = 0.05,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    rate_limit_share: float = 0.0,
+    sleep_scale: float = 0.0,
+    seed: int = 1,
+    server: bool = False,
+    scenarios: tuple = SCENARIOS,
+    workdir: str | None = None,
+) -> Dict[str, Any]:
+    params = {k: v for k, v in locals().items() if k not in ("workdir", "scenarios")}
+    tmp = None
+    if workdir is None:
+        tmp = tempfile.mkdtemp(prefix="i18n-bench-")
+        workdir = tmp
+    # Eigenes Unterverzeichnis: lessons.json wird relativ als <base>/../data/learn gesucht.
+    base_path = os.path.join(workdir, "locales")
+    real_sleep = time.sleep
+    virtual_sleep = [0.0]
+
+    def scaled_sleep(seconds: float) -> None:
+        virtual_sleep[0] += seconds
+        if sleep_scale > 0:
+            real_sleep(seconds * sleep_scale)
+
+    results: List[Dict[str, Any]] = []
+    env_backup = {k: os.environ.get(k) for k in ("DEEPL_API_KEY", "DEEPL_API_URL")}
+    os.environ["DEEPL_API_KEY"] = "bench-key-not-used"
+    stack = ExitStack()
+    if server:
+        import i18n_fake_provider
+
+        behavior = i18n_fake_provider.Behavior(
+            latency=f"uniform:{max(latency_ms - jitter_ms, 0.0)}:{latency_ms + jitter_ms}",
+            rate_limit_share=rate_limit_share,
+            seed=seed,
+        )
+        stand_in = stack.enter_context(i18n_fake_provider.FakeProviderServer(behavior))
+        os.environ["DEEPL_API_URL"] = stand_in.deepl_url
+    else:
+        os.environ.pop("DEEPL_API_URL", None)
+        stack.enter_context(mock.patch("urllib.request.urlopen", FakeDeepL(latency_ms, jitter_ms, rate_limit_share, seed, real_sleep)))
+    try:
+        names = generate_tree(
+            base_path, namespaces=namespaces, keys=keys, depth=depth, value_len=value_len,
+            dotted_share=dotted_share, original_share=original_share, seed=seed,
+        )
+        with stack, mock.patch.object(usd.time, "sleep", scaled_sleep):
+            # noop/incremental/force-key setzen einen vollstaendig uebersetzten Baum voraus.
+            order = ["full"] + [s for s in scenarios if s != "full"]
+            for scenario in order:
+                extra: List[str] = []
+                info: Dict[str, Any] = {}
+                if scenario == "full":
+                    extra = ["--full"]
+                elif scenario == "incremental":
+                    info["changed_keys"] = mutate_tree(base_path, changed_share, seed + 1)
+                elif scenario == "force-key":
+                    extra = ["--force-key", names[0]]
+                virtual_sleep[0] = 0.0
+                result = _run_main(base_path, extra)
+                result["virtual_sleep_s"] = round(virtual_sleep[0], 3)
+                if scenario in scenarios:
+                    results.append({"scenario": scenario, **info, **result})
+    finally:
+        stack.close()
+        for k, v in env_backup.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+    import platform
+
+    return {
+        "params": params,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "json_backend": i18n_json.BACKEND,
+            "platform": platform.platform(),
+        },
+        "created_at": round(time.time(), 3),
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="End-to-End-Benchmark der Übersetzungs-Pipeline (synthetischer Baum, Fake-DeepL).")
+    parser.add_argument("--namespaces", type=int, default=10)
+    parser.add_argument("--keys", type=int, default=100, help="Blätter je Namespace")
+    parser.add_argument("--depth", type=int, default=3, help="Verschachtelungstiefe der Keys")
+    parser.add_argument("--value-len", type=int, default=40, help="ungefähre Länge eines DE-Werts in Zeichen")
+    parser.add_argument("--dotted-share", type=float, default=0.1, help="Anteil flacher Punkt-Keys (z.B. d.fb)")
+    parser.add_argument("--original-share", type=float, default=0.05, help="Anteil Glossar-Gruppen mit .original-Key")
+    parser.add_argument("--changed-share", type=float, default=0.05, help="Anteil geänderter DE-Werte im Modus incremental")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulierte Provider-Latenz je Request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-share", type=float, default=0.0, help="Wahrscheinlichkeit eines 429 je Request")
+    parser.add_argument("--sleep-scale", type=float, default=0.0, help="Faktor für Drosselung/Backoff des Skripts (0 = nicht schlafen)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--server", action="store_true", help="gegen den lokalen HTTP-Stand-in (i18n_fake_provider.py) statt gepatchtem urlopen laufen")
+    parser.add_argument("--scenario", dest="scenarios", action="append", choices=SCENARIOS, help="nur diese Modi (mehrfach nutzbar)")
+    parser.add_argument("--workdir", help="synthetischen Baum hier anlegen und behalten (Default: Temp-Verzeichnis)")
+    parser.add_argument("--out", help="Ergebnis als JSON nach PFAD")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        namespaces=args.namespaces, keys=args.keys, depth=args.depth, value_len=args.value_len,
+        dotted_share=args.dotted_share, original_share=args.original_share, changed_share=args.changed_share,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_limit_share=args.rate_limit_share,
+        sleep_scale=args.sleep_scale, seed=args.seed, server=args.server, scenarios=tuple(args.scenarios or SCENARIOS),
+        workdir=args.workdir,
+    )
+    for r in report["results"]:
+        print(
+            f"{r['scenario']:<12} {r['wall_s']:8.3f}s wand  {r['cpu_s']:8.3f}s cpu  {r['requests']:>6} Requests"
+            f"  {r['rate_limited']:>4}x 429  {r['files_written']:>4} geschrieben  {r['documents_parsed']:>4} geparst"
+        )
+    if args.out:
+        with open(args.out, "wb") as f:
+            f.write(i18n_json.dumps(report))
+        print(f"💾 Ergebnis gespeichert: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Zeichen-/Zeitbudget und Prioritaets-Reihenfolge fuer UpdateSprachdateienBasierendAufDE.py
+(--max-chars, --max-duration).
+
+Bei knappem Kontingent arbeitete ein Lauf die Namespaces alphabetisch ab, bis DeepL mit
+429/456 antwortete - "Abbruch fuer Sprache ..." traf dann irgendeine Sprache mitten in
+einem Namespace, und das Kontingent war fuer Texte verbraucht, die womoeglich nie
+angezeigt werden.
+
+Mit Budget laeuft die Arbeit in Durchgaengen nach Prioritaet (TIERS):
+
+    1. fehlend  + im Code genutzt     (Nutzer sehen sonst den Fallback)
+    2. geaendert + im Code genutzt
+    3. fehlend  + ungenutzt
+    4. geaendert + ungenutzt
+
+"Genutzt" kommt aus dem Bericht von check_i18n_usage.py (i18n_usage_report.json): dort
+steht unused_keys = alle DE-Keys ohne Fundstelle in key_locations; jeder andere Key
+(auch einer, der nach dem Bericht neu dazukam) gilt als genutzt. Ohne Bericht entscheidet
+nur fehlend/geaendert.
+
+Jeder Key wird vor seinem Provider-Aufruf per admit() zugelassen oder zurueckgestellt.
+Ist das Budget erschoepft (oder meldet DeepL "Quota exceeded", auch ohne Budget), werden
+alle weiteren Keys zurueckgestellt statt die Sprache abzubrechen: bereits Uebersetztes
+wird normal gespeichert, zurueckgestellte Keys landen NICHT im Manifest und werden mit
+Grund im Checkpoint (.i18n_hash/checkpoint.json) vermerkt. Der naechste Lauf nimmt sie
+in jedem Modus wieder in die Arbeitsmenge auf (auch bei --since/--force-key) und loescht
+den Checkpoint, sobald er ohne Abbruch durchlaeuft.
+"""
+import hashlib
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import i18n_json
+
+CHECKPOINT_FILE = "checkpoint.json"
+USAGE_REPORT_FILE = "i18n_usage_report.json"
+
+# (fehlend?, genutzt?) je Durchgang, in Abarbeitungsreihenfolge.
+TIERS: Tuple[Tuple[bool, bool], ...] = ((True, True), (False, True), (True, False), (False, False))
+TIER_NAMES = ("fehlend+genutzt", "geändert+genutzt", "fehlend+ungenutzt", "geändert+ungenutzt")
+
+
+class QuotaExceeded(RuntimeError):
+    """Provider meldet ein erschoepftes Kontingent (DeepL HTTP 456) - weitere Versuche
+    sind in diesem Lauf zwecklos."""
+
+
+def load_unused_keys(base_path: str) -> Set[str] | None:
+    """unused_keys aus i18n_usage_report.json ("<ns>.<key>") oder None ohne Bericht."""
+    try:
+        with open(os.path.join(base_path, USAGE_REPORT_FILE), "rb") as f:
+            report = i18n_json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    unused = report.get("unused_keys") if isinstance(report, dict) else None
+    return {k for k in unused if isinstance(k, str)} if isinstance(unused, list) else None
+
+
+def load_checkpoint(hash_dir: str) -> Dict[str, Dict[str, Set[str]]]:
+    """{Sprache: {Namespace: {relative Keys}}} des letzten abgebrochenen Laufs."""
+    try:
+        with open(os.path.join(hash_dir, CHECKPOINT_FILE), "rb") as f:
+            data = i18n_json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    deferred = data.get("deferred") if isinstance(data, dict) else None
+    if not isinstance(deferred, dict):
+        return {}
+    return {
+        lang: {ns: set(keys) for ns, keys in by_ns.items() if isinstance(keys, list)}
+        for lang, by_ns in deferred.items() if isinstance(by_ns, dict)
+    }
+
+
+def write_checkpoint(hash_dir: str, deferred: Dict[str, Dict[str, Set[str]]], reason: str | None, chars: int) -> str | None:
+    """Schreibt den Checkpoint bzw. entfernt ihn, wenn nichts zurueckgestellt ist; gibt
+    den Pfad zurueck, wenn einer geschrieben wurde."""
+    path = os.path.join(hash_dir, CHECKPOINT_FILE)
+    if not any(keys for by_ns in deferred.values() for keys in by_ns.values()):
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+    os.makedirs(hash_dir, exist_ok=True)
+    i18n_json.write_json_if_changed(path, {
+        "reason": reason,
+        "chars": chars,
+        "deferred": {
+            lang: {ns: sorted(keys) for ns, keys in sorted(by_ns.items()) if keys}
+            for lang, by_ns in sorted(deferred.items()) if any(by_ns.values())
+        },
+    })
+    return path
+
+
+class WorkScheduler:
+    def __init__(self) -> None:
+        self.configure()
+
+    def configure(
+        self,
+        max_chars: int | None = None,
+        max_duration: float | None = None,
+        unused_keys: Iterable[str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Setzt den Zustand fuer einen neuen Lauf zurueck; ohne Budget ein Durchgang in
+        der bisherigen Reihenfolge."""
+        self.max_chars = max_chars
+        self.max_duration = max_duration
+        self.active = max_chars is not None or max_duration is not None
+        self.unused: Set[str] = set(unused_keys or ())
+        self.clock = clock
+        self.started = clock()
+        self.chars = 0
+        self.tier: int | None = None
+        self.ns = ""
+        self.stop_reason: str | None = None
+        self._attempted: Set[Tuple[str, str, str, str]] = set()
+        self.admitted = [0] * len(TIERS)
+        self.deferred: Dict[str, Dict[str, Set[str]]] = {}
+        # (Sprache, Key) im aktuellen Namespace, die admit() abgelehnt hat - landen in
+        # failed_paths, sind aber keine gescheiterten Uebersetzungen (i18n_status.py).
+        self.skipped: Set[Tuple[str, str]] = set()
+
+    def passes(self) -> List[int | None]:
+        return list(range(len(TIERS))) if self.active else [None]
+
+    def begin_pass(self, tier: int | None) -> None:
+        self.tier = tier
+
+    @property
+    def first_pass(self) -> bool:
+        return self.tier in (None, 0)
+
+    def set_namespace(self, ns: str) -> None:
+        self.ns = ns
+        self.skipped = set()
+
+    def tier_of(self, rel: str, missing: bool, paths: Iterable[str] = ()) -> int:
+        """paths wie bei admit(): eine Pluralfamilie ist nur ungenutzt, wenn es alle
+        Mitglieder sind (unused_keys fuehrt Mitglieder, nie den Stamm)."""
+        used = any(f"{self.ns}.{p}" not in self.unused for p in (paths or (rel,)))
+        return TIERS.index((missing, used))
+
+    def stop(self, reason: str) -> None:
+        if self.stop_reason is None:
+            self.stop_reason = reason
+
+    def _check_budget(self, chars: int) -> None:
+        if self.max_chars is not None and self.chars + chars > self.max_chars:
+            self.stop("max-chars")
+        elif self.max_duration is not None and self.clock() - self.started >= self.max_duration:
+            self.stop("max-duration")
+
+    def admit(self, lang: str, rel: str, missing: bool, source: str, paths: Iterable[str] = ()) -> bool:
+        """True = jetzt uebersetzen. False = in diesem Durchgang nicht (spaetere Stufe)
+        oder zurueckgestellt (Budget erschoepft) - der Key darf dann weder geschrieben noch
+        ins Manifest uebernommen werden. paths: die Keys hinter rel, falls rel fuer mehrere
+        steht (Pluralfamilie: Stamm -> Mitglieder)."""
+        admitted = self._admit(lang, rel, missing, source, tuple(paths))
+        if not admitted:
+            self.skipped.update((lang, p) for p in (paths or (rel,)))
+        return admitted
+
+    def _admit(self, lang: str, rel: str, missing: bool, source: str, paths: Tuple[str, ...]) -> bool:
+        if self.active:
+            tier = self.tier_of(rel, missing, paths)
+            if self.tier is not None and tier > self.tier:
+                return False
+            # Je Quelltext nur ein Versuch: ein gescheiterter Key waere im naechsten
+            # Durchgang sonst "geaendert" und kaeme erneut dran.
+            attempt = (lang, self.ns, rel, hashlib.sha256(source.encode("utf-8")).hexdigest())
+            if attempt in self._attempted:
+                return False
+        if self.stop_reason is None:
+            self._check_budget(len(source))
+        if self.stop_reason is not None:
+            # Mitglieder statt Stamm - der naechste Lauf nimmt die Keys ueber ihre Pfade auf.
+            self.deferred.setdefault(lang, {}).setdefault(self.ns, set()).update(paths or (rel,))
+            return False
+        if self.active:
+            self._attempted.add(attempt)
+            self.admitted[tier] += 1
+        return True
+
+    def charge(self, chars: int) -> None:
+        """Tatsaechlich an den Provider geschickte Zeichen (Kassetten-Treffer zaehlen nicht)."""
+        self.chars += chars
+
+    def deferred_count(self) -> int:
+        return sum(len(keys) for by_ns in self.deferred.values() for keys in by_ns.values())
+
+    def summary(self) -> str:
+        parts = ", ".join(f"{name}={n}" for name, n in zip(TIER_NAMES, self.admitted))
+        limit = f"/{self.max_chars}" if self.max_chars is not None else ""
+        return f"{self.chars}{limit} Zeichen, {self.clock() - self.started:.0f}s, zugelassen: {parts}"
+
+    def save_checkpoint(self, hash_dir: str, carried_over: Dict[str, Dict[str, Set[str]]] | None = None) -> str | None:
+        """Checkpoint schreiben (bei Abbruch) bzw. entfernen (Lauf vollstaendig); gibt
+        den Pfad zurueck, wenn einer geschrieben wurde. carried_over sind Eintraege des
+        alten Checkpoints, die dieser Lauf gar nicht bearbeitet hat (--namespace/--lang)
+        - sie bleiben stehen, auch wenn der Lauf selbst vollstaendig war."""
+        deferred: Dict[str, Dict[str, Set[str]]] = {}
+        for source in (carried_over or {}, self.deferred):
+            for lang, by_ns in source.items():
+                for ns, keys in by_ns.items():
+                    if keys:
+                        deferred.setdefault(lang, {}).setdefault(ns, set()).update(keys)
+        return write_checkpoint(hash_dir, deferred, self.stop_reason, self.chars)
+
+
+SCHEDULER = WorkScheduler()
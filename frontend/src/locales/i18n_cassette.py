@@ -0,0 +1,133 @@
+"""
+Record/Replay-Kassetten fuer Provider-Aufrufe (--cassette / --cassette-mode).
+
+Wer auf einem Branch pruefen will, wie sich die Ausgabe eines Laufs aendert, bezahlte
+bisher jedes Mal dieselben DeepL/OpenAI-Aufrufe erneut; die Tests mussten
+translate_text_deepl fuer jedes Szenario von Hand nachbauen. CASSETTE (modulweite
+Instanz, wird von main() pro Lauf konfiguriert) sitzt direkt in translate_text():
+
+    record   jeder Aufruf geht an den Provider, Anfrage/Antwort werden gespeichert
+             (vorhandene Eintraege werden ueberschrieben)
+    replay   Treffer kommen aus der Kassette; bei einem Fehlschlag faellt der Aufruf
+             zum Provider durch und die Antwort wird nachgetragen
+    strict   wie replay, aber ein Fehlschlag wirft CassetteMiss (kein Netzwerk, kein
+             API-Key noetig) - die betroffene Sprache wird wie bei einem Provider-Fehler
+             abgebrochen
+
+Schluessel ist (provider, source, target, normalisierter Text). Normalisiert wird
+NFC, Zeilenenden und aeusserer Leerraum - genau die Unterschiede, die an der
+Uebersetzung nichts aendern, aber sonst zu Fehlschlaegen fuehren. Text ist der
+Provider-Eingabetext, also nach dem Maskieren der englischen Klammerbegriffe.
+
+Die Datei ist ein JSON-Dokument mit nach Schluessel sortierten Eintraegen (stabil
+diff-bar) und wird nur geschrieben, wenn sich etwas geaendert hat.
+"""
+import hashlib
+import unicodedata
+from typing import Any, Dict
+
+import i18n_json
+
+CASSETTE_VERSION = 1
+MODES = ("record", "replay", "strict")
+
+
+class CassetteMiss(RuntimeError):
+    """Kein Eintrag fuer einen Aufruf im strict-Modus."""
+
+
+def source_lang_for(target_lang: str) -> str:
+    # Wie translate_text_deepl: Phase A ist immer DE -> EN, Phase B immer EN -> Ziel.
+    return "de" if target_lang.lower() == "en" else "en"
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text.replace("\r\n", "\n")).strip()
+
+
+def cassette_key(provider: str, target_lang: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{provider}:{source_lang_for(target_lang)}:{target_lang.lower()}:{digest}"
+
+
+class Cassette:
+    def __init__(self) -> None:
+        self.configure()
+
+    def configure(self, path: str | None = None, mode: str = "replay") -> None:
+        """Setzt den Zustand fuer einen neuen Lauf zurueck und laedt path (falls
+        vorhanden). path=None schaltet die Kassette ab."""
+        if mode not in MODES:
+            raise ValueError(f"Unbekannter Kassetten-Modus: {mode}")
+        self.path = path
+        self.mode = mode
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            with open(path, "rb") as f:
+                data = i18n_json.loads(f.read())
+        except FileNotFoundError:
+            return
+        if not isinstance(data, dict) or data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Kassette {path}: unbekanntes Format (erwartet version={CASSETTE_VERSION})")
+        self.entries = dict(data.get("entries") or {})
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    @property
+    def offline(self) -> bool:
+        """True, wenn kein einziger Provider-Aufruf stattfinden darf."""
+        return self.enabled and self.mode == "strict"
+
+    def lookup(self, provider: str, target_lang: str, text: str) -> str | None:
+        """Antwort aus der Kassette oder None (= Provider fragen). strict: CassetteMiss."""
+        if not self.enabled or self.mode == "record":
+            return None
+        entry = self.entries.get(cassette_key(provider, target_lang, text))
+        if entry is not None:
+            self.hits += 1
+            return entry["translation"]
+        self.misses += 1
+        if self.mode == "strict":
+            raise CassetteMiss(
+                f"Kassette {self.path}: kein Eintrag fuer {provider} {source_lang_for(target_lang)}->{target_lang.lower()}: {text[:60]!r}"
+            )
+        return None
+
+    def store(self, provider: str, target_lang: str, text: str, translation: str) -> None:
+        if not self.enabled:
+            return
+        key = cassette_key(provider, target_lang, text)
+        entry = {
+            "provider": provider,
+            "source": source_lang_for(target_lang),
+            "target": target_lang.lower(),
+            "text": normalize_text(text),
+            "translation": translation,
+        }
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self.dirty = True
+        self.recorded += 1
+
+    def save(self) -> bool:
+        """Schreibt die Kassette (nur bei Aenderungen). True, wenn geschrieben wurde."""
+        if not self.enabled or not self.dirty:
+            return False
+        data = {"version": CASSETTE_VERSION, "entries": {k: self.entries[k] for k in sorted(self.entries)}}
+        written = i18n_json.write_bytes_if_changed(self.path, i18n_json.dumps(data))
+        self.dirty = False
+        return written
+
+    def summary(self) -> str:
+        return f"{self.mode}: {self.hits} Treffer, {self.misses} Fehlschläge, {self.recorded} aufgezeichnet, {len(self.entries)} Einträge"
+
+
+CASSETTE = Cassette()
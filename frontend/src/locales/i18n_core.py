@@ -0,0 +1,129 @@
+"""
+Import-leichter Kern der i18n-Skripte: Sprachkonfiguration, JSON laden/speichern,
+Flatten/Hashing und Hash-Manifeste.
+
+UpdateSprachdateienBasierendAufDE.py zieht Provider-Logik, argparse, subprocess usw.
+nach sich. sync_i18n_hashes.py, Pre-Commit-Hooks und die Tests brauchen davon nichts -
+nur exakt dieselben Hash- und Manifest-Funktionen. Deshalb liegen diese hier, und
+das Uebersetzungsskript importiert sie von hier (kein Copy-Paste, die Hashes bleiben
+garantiert byte-identisch). Dieses Modul darf nur Standardbibliothek-Module mit
+geringen Importkosten sowie i18n_json/i18n_events/i18n_profile importieren - siehe
+test_i18n_startup.py.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Set
+
+import i18n_json
+from i18n_events import EVENTS
+from i18n_profile import PROFILE
+
+BASE_LANG = "de"
+TARGET_LANGS = ["en", "nl", "es", "fr", "it", "fi", "hr", "ru"]
+# Standard-Basispfad: Verzeichnis dieser Datei, damit Aufruf von überall funktioniert
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+# Standard-Verzeichnis für Hash-Manifeste (die Skripte lassen es per --base-path umbiegen)
+DEFAULT_HASH_DIR = os.path.join(BASE_PATH, ".i18n_hash")
+
+
+# -------- Auswahl per Glob (--namespace/--lang) --------
+
+def split_globs(raw: Iterable[str] | None) -> List[str]:
+    """Mehrfach angegebene und/oder komma-separierte Muster -> flache Liste."""
+    return [p.strip() for item in raw or () for p in item.split(",") if p.strip()]
+
+
+def matches_globs(name: str, patterns: List[str]) -> bool:
+    """True ohne Muster oder wenn name auf eines passt (fnmatch, Groß-/Kleinschreibung
+    beachtet - Namespaces wie "quiz.ui" und "scamSimulator" sind case-sensitiv)."""
+    return not patterns or any(fnmatch.fnmatchcase(name, p) for p in patterns)
+
+
+def load_json(file: str) -> Dict[str, Any]:
+    """Lade eine JSON-Datei."""
+    try:
+        with PROFILE.phase("parse"):
+            return i18n_json.load_file(file)
+    except FileNotFoundError:
+        print(f"⚠️ Datei nicht gefunden: {file}")
+        return {}
+    except json.JSONDecodeError:
+        print(f"⚠️ Ungültiges JSON in: {file}")
+        return {}
+
+
+def save_json(file: str, data: Dict[str, Any]) -> bool:
+    """Speichere eine JSON-Datei (atomar, nur bei geändertem Inhalt).
+    Gibt True zurück, wenn die Datei tatsächlich geschrieben wurde."""
+    try:
+        written = i18n_json.write_json_if_changed(file, data)
+        EVENTS.emit("written" if written else "unchanged", file=file)
+        if written:
+            EVENTS.note("fileSaved", f"💾 Datei gespeichert: {file}")
+        return written
+    except Exception as e:
+        print(f"❌ Fehler beim Speichern von {file}: {e}")
+        return False
+
+
+# -------- Hash-basierte Änderungs-Erkennung --------
+
+def _collect_leaf_paths(d: Dict[str, Any], prefix: str = "") -> Set[str]:
+    paths: Set[str] = set()
+    for k, v in d.items():
+        p = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            paths |= _collect_leaf_paths(v, p)
+        else:
+            paths.add(p)
+    return paths
+
+
+def _flatten_dict(d: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for k, v in d.items():
+        p = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            out.update(_flatten_dict(v, p))
+        else:
+            out[p] = v
+    return out
+
+
+def _sha256(s: str) -> str:
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+def manifest_path(hash_dir: str, lang: str, from_pivot: str) -> str:
+    return os.path.join(hash_dir, f"{lang}_from_{from_pivot}.json")
+
+
+def load_manifest(hash_dir: str, lang: str, from_pivot: str) -> Dict[str, str]:
+    path = manifest_path(hash_dir, lang, from_pivot)
+    try:
+        with PROFILE.phase("parse"):
+            data = i18n_json.load_file(path)
+        if isinstance(data, dict):
+            return {str(k): str(v) for k, v in data.items()}
+        return {}
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        return {}
+
+
+def save_manifest(hash_dir: str, lang: str, from_pivot: str, data: Dict[str, str]) -> bool:
+    """Wie save_json: True, wenn das Manifest tatsächlich geschrieben wurde."""
+    os.makedirs(hash_dir, exist_ok=True)
+    path = manifest_path(hash_dir, lang, from_pivot)
+    try:
+        written = i18n_json.write_json_if_changed(path, data)
+        EVENTS.emit("written" if written else "unchanged", file=path)
+        if written:
+            EVENTS.note("fileSaved", f"💾 Manifest gespeichert: {path}")
+        return written
+    except Exception as e:
+        print(f"❌ Fehler beim Speichern von Manifest {path}: {e}")
+        return False
@@ -0,0 +1,177 @@
+"""
+Strukturierter Ereignis-Strom, Live-Fortschritt und --quiet fuer die i18n-Skripte.
+
+Vorher bestand der Fortschritt eines Laufs aus hunderten Emoji-print-Zeilen (u.a. eine
+pro ".original"-Key) - nicht maschinell auswertbar, bei grossen Laeufen selbst ein
+Bremsklotz (Konsolen-I/O) und ohne jede Aussage, wie lange der Lauf noch dauert.
+
+EVENTS (modulweite Instanz, wird von main() pro Lauf konfiguriert):
+- emit(): ein JSON-Objekt pro Zeile (JSONL) in eine Datei oder nach stdout. Ereignisse:
+    planned     Arbeitsmenge je Namespace/Sprache (count, chars)
+    translated  ein Key erfolgreich uebersetzt
+    cached      ein Key ohne Provider-Aufruf beantwortet (Cache/Replay)
+    skipped     ein Key bewusst nicht uebersetzt (z.B. ".original")
+    failed      ein Key nicht als erledigt markiert (reason)
+    retried     ein Provider-Aufruf wird wiederholt (z.B. 429)
+    written     eine Datei wurde geschrieben
+    unchanged   eine Datei war bereits aktuell
+  Jedes Ereignis traegt ts, event und - soweit gesetzt - den Kontext (ns, lang).
+- note(): menschenlesbare Einzelmeldung pro Key; mit --quiet nur gezaehlt und am Ende
+  als eine Zeile je Art zusammengefasst.
+- advance(): Live-Fortschritt (Keys erledigt/geplant, Req/s, ETA je Sprache) als eine
+  einzige, sich selbst ueberschreibende Zeile auf stderr.
+"""
+import json
+import sys
+import time
+from typing import Any, Dict, TextIO
+
+# Mindestabstand zwischen zwei Fortschritts-Ausgaben (Sekunden): TTY vs. Log-Datei/CI.
+PROGRESS_INTERVAL_TTY = 0.2
+PROGRESS_INTERVAL_PLAIN = 15.0
+
+
+def _fmt_duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+class EventLog:
+    def __init__(self) -> None:
+        self.configure()
+
+    def configure(
+        self,
+        stream: TextIO | None = None,
+        quiet: bool = False,
+        progress: bool = False,
+        progress_stream: TextIO | None = None,
+    ) -> None:
+        """Setzt den Zustand fuer einen neuen Lauf zurueck. stream: Ziel fuer JSONL (None
+        = keine Ereignisse). progress_stream: Ziel der Fortschrittszeile (Default stderr)."""
+        self.stream = stream
+        self.quiet = quiet
+        self.progress = progress
+        self.progress_stream = progress_stream or sys.stderr
+        self.context: Dict[str, Any] = {}
+        self.counts: Dict[str, int] = {}
+        self.notes: Dict[str, int] = {}
+        self.planned: Dict[str, int] = {}
+        self.done: Dict[str, int] = {}
+        self.active_time: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._last_tick = self._started
+        self._last_render = 0.0
+        self._progress_visible = False
+        self._tty = bool(getattr(self.progress_stream, "isatty", lambda: False)())
+
+    # -------- Ereignisse --------
+
+    def set_context(self, **fields: Any) -> None:
+        """Kontextfelder (z.B. ns, lang), die jedem folgenden Ereignis beigefuegt werden."""
+        for k, v in fields.items():
+            if v is None:
+                self.context.pop(k, None)
+            else:
+                self.context[k] = v
+
+    def emit(self, event: str, **fields: Any) -> None:
+        self.counts[event] = self.counts.get(event, 0) + 1
+        if self.stream is None:
+            return
+        record: Dict[str, Any] = {"ts": round(time.time(), 3), "event": event}
+        record.update(self.context)
+        record.update({k: v for k, v in fields.items() if v is not None})
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    # -------- Menschenlesbare Meldungen --------
+
+    def note(self, kind: str, message: str) -> None:
+        """Einzelmeldung pro Key/Datei. Mit --quiet nur gezaehlt (siehe quiet_summary)."""
+        self.notes[kind] = self.notes.get(kind, 0) + 1
+        if not self.quiet:
+            self.say(message)
+
+    def say(self, message: str) -> None:
+        """print(), ohne dass die Fortschrittszeile die Meldung ueberschreibt."""
+        self._clear_progress()
+        print(message)
+
+    def quiet_summary(self) -> str | None:
+        if not self.quiet or not self.notes:
+            return None
+        parts = ", ".join(f"{k}: {v}" for k, v in sorted(self.notes.items()))
+        return f"Zusammengefasste Einzelmeldungen (--quiet): {parts}"
+
+    # -------- Fortschritt --------
+
+    def plan(self, lang: str, count: int) -> None:
+        self.planned[lang] = self.planned.get(lang, 0) + count
+
+    def advance(self, lang: str) -> None:
+        """Ein geplanter Key fuer lang ist abgearbeitet (egal ob erfolgreich)."""
+        now = time.perf_counter()
+        # Die Zeit seit dem letzten erledigten Key wird der Sprache dieses Keys
+        # zugerechnet - Sprachen wechseln sich pro Namespace ab, eine reine
+        # Wanduhr-Rate pro Sprache waere deshalb stark verfaelscht.
+        self.active_time[lang] = self.active_time.get(lang, 0.0) + (now - self._last_tick)
+        self._last_tick = now
+        self.done[lang] = self.done.get(lang, 0) + 1
+        if self.progress:
+            interval = PROGRESS_INTERVAL_TTY if self._tty else PROGRESS_INTERVAL_PLAIN
+            if now - self._last_render >= interval:
+                self._last_render = now
+                self._render(lang)
+
+    def mark_idle(self) -> None:
+        """Zeit ohne Provider-Arbeit (Laden, Speichern) nicht der naechsten Sprache zurechnen."""
+        self._last_tick = time.perf_counter()
+
+    def eta(self, lang: str) -> float | None:
+        done = self.done.get(lang, 0)
+        active = self.active_time.get(lang, 0.0)
+        if not done or active <= 0:
+            return None
+        remaining = max(self.planned.get(lang, 0) - done, 0)
+        return remaining * active / done
+
+    def progress_line(self, lang: str) -> str:
+        done = self.done.get(lang, 0)
+        total = max(self.planned.get(lang, 0), done)
+        active = self.active_time.get(lang, 0.0)
+        rate = done / active if active > 0 else 0.0
+        all_done = sum(self.done.values())
+        all_total = sum(max(self.planned.get(l, 0), self.done.get(l, 0)) for l in set(self.planned) | set(self.done))
+        etas = [self.eta(l) for l in self.planned if self.planned.get(l, 0) > self.done.get(l, 0)]
+        total_eta = None if any(e is None for e in etas) else sum(e for e in etas if e is not None)
+        return (
+            f"⏳ [{lang}] {done}/{total} Keys · {rate:.1f} Req/s · ETA {lang} {_fmt_duration(self.eta(lang))}"
+            f" · gesamt {all_done}/{all_total}, ETA {_fmt_duration(total_eta)}"
+        )
+
+    def _render(self, lang: str) -> None:
+        line = self.progress_line(lang)
+        if self._tty:
+            self.progress_stream.write("\r\x1b[2K" + line)
+            self._progress_visible = True
+        else:
+            self.progress_stream.write(line + "\n")
+        self.progress_stream.flush()
+
+    def _clear_progress(self) -> None:
+        if self._progress_visible:
+            self.progress_stream.write("\r\x1b[2K")
+            self.progress_stream.flush()
+            self._progress_visible = False
+
+    def close(self) -> None:
+        self._clear_progress()
+        if self.stream is not None:
+            self.stream.flush()
+
+
+EVENTS = EventLog()
@@ -0,0 +1,332 @@
+"""
+Lokaler Stand-in-Server fuer DeepL (/v2/translate) und optional OpenAI
+(/v1/chat/completions) - fuer Last-, Durchsatz- und Fehlertests ohne Netzwerk und
+ohne echtes Kontingent.
+
+translate_text_deepl() liest DEEPL_API_URL, das openai-SDK OPENAI_BASE_URL - beide
+lassen sich auf diesen Server umbiegen:
+
+    python3 i18n_fake_provider.py --port 8765 --latency lognormal:80:0.5 \\
+        --burst-every 200 --burst-length 5 --retry-after 2 --echo-share 0.01
+    DEEPL_API_URL=http://127.0.0.1:8765/v2/translate DEEPL_API_KEY=x \\
+        python3 UpdateSprachdateienBasierendAufDE.py --provider deepl --base-path /tmp/kopie
+
+Verhalten (alle Anteile je Request, deterministisch per --seed):
+- Latenz: fixed:MS | uniform:MIN:MAX | normal:MITTEL:SD | lognormal:MEDIAN:SIGMA (ms)
+- 429-Bursts: nach je --burst-every Requests die naechsten --burst-length mit 429 und
+  Retry-After-Header; zusaetzlich zufaellige 429 mit --rate-limit-share
+- Timeouts: --timeout-share der Requests haengen --hang-s Sekunden und werden dann
+  ohne Antwort geschlossen
+- Echo: --echo-share liefert den Quelltext unveraendert zurueck
+- Emoji-Verlust: --drop-emoji-share entfernt Symbole/Emoji (Unicode-Kategorie So,
+  Variation Selectors, ZWJ) aus der Antwort
+Sonst lautet die "Uebersetzung" "[ZIEL] <text>" - Platzhalter wie __KEEP_EN_TERM_1__
+bleiben dabei erhalten.
+
+GET /stats liefert die Zaehler als JSON, GET /healthz ein schlichtes "ok".
+"""
+import json
+import math
+import random
+import sys
+import threading
+import unicodedata
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+_INVISIBLE_EMOJI_PARTS = {"\u200d", "\ufe0e", "\ufe0f"}  # ZWJ, Variation Selectors
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Latenz-Verteilung aus "art:param[:param]" (Millisekunden) -> Sampler in Sekunden."""
+    kind, _, rest = spec.partition(":")
+    params = [float(p) for p in rest.split(":")] if rest else []
+    if kind == "fixed" and len(params) == 1:
+        return lambda rng: params[0] / 1000.0
+    if kind == "uniform" and len(params) == 2:
+        return lambda rng: rng.uniform(params[0], params[1]) / 1000.0
+    if kind == "normal" and len(params) == 2:
+        return lambda rng: max(rng.gauss(params[0], params[1]), 0.0) / 1000.0
+    if kind == "lognormal" and len(params) == 2:
+        mu = math.log(max(params[0], 1e-9))
+        return lambda rng: rng.lognormvariate(mu, params[1]) / 1000.0
+    raise ValueError(f"Unbekannte Latenz-Angabe: {spec!r} (fixed:MS | uniform:MIN:MAX | normal:MITTEL:SD | lognormal:MEDIAN:SIGMA)")
+
+
+def drop_emoji(text: str) -> str:
+    return "".join(ch for ch in text if unicodedata.category(ch) != "So" and ch not in _INVISIBLE_EMOJI_PARTS)
+
+
+class Behavior:
+    """Konfiguration + Zustand (Zaehler, Burst-Position) des Stand-ins."""
+
+    def __init__(
+        self,
+        latency: str = "fixed:0",
+        burst_every: int = 0,
+        burst_length: int = 0,
+        retry_after: float = 1.0,
+        rate_limit_share: float = 0.0,
+        timeout_share: float = 0.0,
+        hang_s: float = 65.0,
+        echo_share: float = 0.0,
+        drop_emoji_share: float = 0.0,
+        require_auth: bool = True,
+        seed: int = 1,
+    ) -> None:
+        self.latency = parse_latency(latency)
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.retry_after = retry_after
+        self.rate_limit_share = rate_limit_share
+        self.timeout_share = timeout_share
+        self.hang_s = hang_s
+        self.echo_share = echo_share
+        self.drop_emoji_share = drop_emoji_share
+        self.require_auth = require_auth
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "requests": 0, "texts": 0, "chars": 0, "rate_limited": 0,
+            "timeouts": 0, "echoes": 0, "dropped_emoji": 0, "unauthorized": 0,
+        }
+        self._since_burst = 0
+        self._burst_left = 0
+
+    def decide(self) -> Dict[str, Any]:
+        """Wuerfelt das Schicksal eines Requests (thread-sicher, deterministisch je Reihenfolge)."""
+        with self.lock:
+            self.stats["requests"] += 1
+            fate: Dict[str, Any] = {"delay": self.latency(self.rng), "status": 200, "hang": False}
+            if self._burst_left > 0:
+                self._burst_left -= 1
+                fate["status"] = 429
+            elif self.burst_every and self.burst_length:
+                if self._since_burst >= self.burst_every:
+                    self._since_burst = 0
+                    self._burst_left = self.burst_length - 1
+                    fate["status"] = 429
+                else:
+                    self._since_burst += 1
+            if fate["status"] == 200 and self.rng.random() < self.rate_limit_share:
+                fate["status"] = 429
+            if fate["status"] == 200 and self.rng.random() < self.timeout_share:
+                fate["hang"] = True
+            fate["echo"] = self.rng.random() < self.echo_share
+            fate["drop"] = self.rng.random() < self.drop_emoji_share
+            if fate["status"] == 429:
+                self.stats["rate_limited"] += 1
+            elif fate["hang"]:
+                self.stats["timeouts"] += 1
+            return fate
+
+    def translate(self, text: str, target: str, fate: Dict[str, Any]) -> str:
+        with self.lock:
+            self.stats["texts"] += 1
+            self.stats["chars"] += len(text)
+            if fate["echo"]:
+                self.stats["echoes"] += 1
+        if fate["echo"]:
+            return text
+        out = f"[{target.upper()}] {text}"
+        if fate["drop"]:
+            dropped = drop_emoji(out)
+            if dropped != out:
+                with self.lock:
+                    self.stats["dropped_emoji"] += 1
+            out = dropped
+        return out
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeProviderServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - Signatur der Basisklasse
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: Any, headers: Dict[str, str] | None = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if not isinstance(payload, bytes) else payload
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json" if not isinstance(payload, bytes) else "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server-Konvention
+        if self.path == "/healthz":
+            self._send(200, b"ok")
+        elif self.path == "/stats":
+            with self.server.behavior.lock:
+                snapshot = dict(self.server.behavior.stats)
+            self._send(200, snapshot)
+        else:
+            self._send(404, {"message": "Not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.path.rstrip("/") == "/v2/translate":
+            self._deepl(raw)
+        elif self.path.rstrip("/") in ("/v1/chat/completions", "/chat/completions"):
+            self._chat(raw)
+        else:
+            self._send(404, {"message": "Not found"})
+
+    def _gate(self, auth_ok: bool) -> Dict[str, Any] | None:
+        """Gemeinsame Vorstufe: Auth, Schicksal wuerfeln, Latenz/Haenger. None = erledigt."""
+        behavior = self.server.behavior
+        if behavior.require_auth and not auth_ok:
+            with behavior.lock:
+                behavior.stats["unauthorized"] += 1
+            self._send(403, {"message": "Authorization failure, check auth_key"})
+            return None
+        fate = behavior.decide()
+        if fate["delay"]:
+            self.server.stopping.wait(fate["delay"])
+        if fate["hang"]:
+            self.server.stopping.wait(behavior.hang_s)
+            self.close_connection = True
+            return None
+        if fate["status"] == 429:
+            self._send(429, {"message": "Too many requests"}, {"Retry-After": f"{behavior.retry_after:g}"})
+            return None
+        return fate
+
+    def _deepl(self, raw: bytes) -> None:
+        auth = self.headers.get("Authorization") or ""
+        fate = self._gate(auth.startswith("DeepL-Auth-Key ") and len(auth) > len("DeepL-Auth-Key "))
+        if fate is None:
+            return
+        try:
+            body = json.loads(raw or b"{}")
+            texts: List[str] = body["text"]
+            target = body["target_lang"]
+        except (ValueError, KeyError, TypeError):
+            self._send(400, {"message": "Bad request: 'text' (Liste) und 'target_lang' erforderlich"})
+            return
+        source = body.get("source_lang") or "DE"
+        translations = [
+            {"detected_source_language": source.upper(), "text": self.server.behavior.translate(t, target, fate)}
+            for t in texts
+        ]
+        self._send(200, {"translations": translations})
+
+    def _chat(self, raw: bytes) -> None:
+        auth = self.headers.get("Authorization") or ""
+        fate = self._gate(auth.startswith("Bearer ") and len(auth) > len("Bearer "))
+        if fate is None:
+            return
+        try:
+            body = json.loads(raw or b"{}")
+            messages = body["messages"]
+            text = next(m["content"] for m in reversed(messages) if m.get("role") == "user")
+            system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        except (ValueError, KeyError, TypeError, StopIteration):
+            self._send(400, {"error": {"message": "Bad request: messages mit user-Nachricht erforderlich"}})
+            return
+        # Zielsprache aus dem System-Prompt des Skripts ("... präzise ins fr. ...").
+        target = "XX"
+        marker = " ins "
+        if marker in system:
+            target = system.split(marker, 1)[1].split(".", 1)[0].strip() or target
+        content = self.server.behavior.translate(text, target, fate)
+        self._send(200, {
+            "id": f"chatcmpl-fake-{self.server.behavior.stats['requests']}",
+            "object": "chat.completion",
+            "model": body.get("model", "fake"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(text) // 4 + 1, "completion_tokens": len(content) // 4 + 1, "total_tokens": len(text) // 2 + 2},
+        })
+
+
+class FakeProviderServer(ThreadingHTTPServer):
+    """Stand-in-Server; auch als Kontextmanager nutzbar (Thread im Hintergrund)."""
+
+    daemon_threads = True
+
+    def __init__(self, behavior: Behavior | None = None, host: str = "127.0.0.1", port: int = 0, verbose: bool = False) -> None:
+        super().__init__((host, port), _Handler)
+        self.behavior = behavior or Behavior()
+        self.verbose = verbose
+        self.stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def deepl_url(self) -> str:
+        return f"{self.base_url}/v2/translate"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.base_url}/v1"
+
+    def start(self) -> "FakeProviderServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="i18n-fake-provider", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main(argv: List[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Lokaler DeepL/OpenAI-Stand-in für Last- und Fehlertests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="fixed:0", help="fixed:MS | uniform:MIN:MAX | normal:MITTEL:SD | lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--burst-every", type=int, default=0, help="nach je N Requests einen 429-Burst auslösen")
+    parser.add_argument("--burst-length", type=int, default=0, help="Länge eines 429-Bursts (Requests)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After-Header (Sekunden) bei 429")
+    parser.add_argument("--rate-limit-share", type=float, default=0.0, help="zusätzliche zufällige 429 (Anteil)")
+    parser.add_argument("--timeout-share", type=float, default=0.0, help="Anteil Requests, die hängen und ohne Antwort enden")
+    parser.add_argument("--hang-s", type=float, default=65.0, help="Dauer eines Hängers (Default > 60 s Client-Timeout)")
+    parser.add_argument("--echo-share", type=float, default=0.0, help="Anteil unveränderter Rückgaben (Echo)")
+    parser.add_argument("--drop-emoji-share", type=float, default=0.0, help="Anteil Antworten ohne Emoji/Symbole")
+    parser.add_argument("--no-auth", action="store_true", help="Authorization-Header nicht prüfen")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true", help="jeden Request protokollieren")
+    args = parser.parse_args(argv)
+
+    behavior = Behavior(
+        latency=args.latency, burst_every=args.burst_every, burst_length=args.burst_length,
+        retry_after=args.retry_after, rate_limit_share=args.rate_limit_share,
+        timeout_share=args.timeout_share, hang_s=args.hang_s, echo_share=args.echo_share,
+        drop_emoji_share=args.drop_emoji_share, require_auth=not args.no_auth, seed=args.seed,
+    )
+    server = FakeProviderServer(behavior, args.host, args.port, verbose=args.verbose)
+    print(f"DEEPL_API_URL={server.deepl_url}")
+    print(f"OPENAI_BASE_URL={server.openai_base_url}")
+    print("Strg+C beendet den Server.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stopping.set()
+        server.server_close()
+        print(f"\nStatistik: {json.dumps(behavior.stats, ensure_ascii=False)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+Gemeinsame JSON-Schicht fuer die i18n-Skripte (UpdateSprachdateienBasierendAufDE.py,
+check_i18n_usage.py, sync_i18n_hashes.py).
+
+Pro Lauf werden mehrere hundert Sprach- und Manifest-Dateien gelesen und geschrieben.
+Ist orjson installiert, wird es fuer Parsen und Serialisieren verwendet, sonst die
+Standardbibliothek. Die geschriebenen Bytes sind in beiden Faellen identisch zu
+
+    json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+(2 Leerzeichen Einrueckung, rohes UTF-8, Key-Reihenfolge wie im Dict) - sonst wuerde
+allein der Wechsel des Backends Diffs in allen Sprachdateien erzeugen. Wo orjson
+abweichend formatieren wuerde (Floats wie 1e+16 vs. 1e16, Integer ausserhalb 64 Bit,
+Nicht-String-Keys), faellt dumps() fuer genau dieses Dokument auf die Standardbibliothek
+zurueck.
+
+I18N_JSON_BACKEND=json erzwingt die Standardbibliothek (z.B. zum Vergleichen).
+
+DOCUMENTS ist ein lauf-bezogener Cache geparster Dokumente (siehe DocumentCache).
+"""
+import json
+import os
+import tempfile
+from typing import Any, Dict
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - abhaengig von der Umgebung
+    orjson = None  # type: ignore
+
+BACKEND = "orjson" if orjson is not None and os.getenv("I18N_JSON_BACKEND", "").lower() != "json" else "json"
+
+# Schreibstatistik fuer die Abschluss-Zusammenfassung (wird pro Lauf zurueckgesetzt).
+WRITE_STATS: Dict[str, int] = {"written": 0, "unchanged": 0}
+
+_INT64_MIN = -(2 ** 63)
+_UINT64_MAX = 2 ** 64 - 1
+
+
+def _orjson_safe(obj: Any) -> bool:
+    """True, wenn orjson fuer obj garantiert dieselben Bytes liefert wie die stdlib."""
+    if isinstance(obj, str) or obj is None or obj is True or obj is False:
+        return True
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if not isinstance(k, str) or not _orjson_safe(v):
+                return False
+        return True
+    if isinstance(obj, list):
+        return all(_orjson_safe(v) for v in obj)
+    if type(obj) is int:
+        return _INT64_MIN <= obj <= _UINT64_MAX
+    # float, tuple, bool-Subklassen, eigene Typen: stdlib entscheidet
+    return False
+
+
+def dumps_stdlib(data: Any) -> bytes:
+    """Referenz-Serialisierung (Standardbibliothek)."""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps(data: Any, backend: str | None = None) -> bytes:
+    """Serialisiert data in die kanonische Byte-Form (siehe Modul-Docstring)."""
+    if (backend or BACKEND) == "orjson" and orjson is not None and _orjson_safe(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # z.B. einzelne Surrogates in Strings - die stdlib meldet den Fehler dann
+            # genauso, wie sie es ohne orjson getan haette.
+            pass
+    return dumps_stdlib(data)
+
+
+def loads(raw: bytes | str, backend: str | None = None) -> Any:
+    """Parst JSON. Wirft json.JSONDecodeError bei ungueltigem Inhalt."""
+    if (backend or BACKEND) == "orjson" and orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson ist strenger (NaN/Infinity, einzelne Surrogates) - die stdlib
+            # entscheidet, ob das Dokument wirklich ungueltig ist.
+            pass
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
+
+def _generation(st: os.stat_result) -> tuple[int, int, int]:
+    # os.replace() erzeugt eine neue Inode - zusammen mit mtime_ns/size erkennt das
+    # auch Schreibvorgaenge innerhalb derselben mtime-Granularitaet.
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class DocumentCache:
+    """Lauf-bezogener Cache geparster JSON-Dokumente, Schluessel = absoluter Pfad plus
+    Inhalts-Generation (mtime_ns, Groesse, Inode).
+
+    Ein Uebersetzungslauf liest dieselben Dateien mehrfach: die Kollisionspruefung laedt
+    alle de/*.json, die Hauptschleife laedt sie erneut; Phase A schreibt en/<ns>.json
+    und Phase B liest es sofort wieder; die Manifeste werden pro Namespace und Sprache
+    neu geladen. Mit dem Cache wird jede Datei pro Lauf hoechstens einmal geparst -
+    Schreibvorgaenge ueber write_json_if_changed() legen das geschriebene Dokument
+    direkt im Cache ab, ein os.stat() pro Zugriff stellt sicher, dass Aenderungen von
+    aussen (Editor, andere Prozesse) trotzdem bemerkt werden.
+
+    Vertrag: geladene und gespeicherte Dokumente werden geteilt, nicht kopiert -
+    Aufrufer duerfen sie danach nicht mehr veraendern (die Merge-Funktionen der
+    Skripte bauen ohnehin neue Dicts auf).
+    """
+
+    def __init__(self) -> None:
+        self._docs: Dict[str, tuple[tuple[int, int, int], Any]] = {}
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0}
+
+    def clear(self) -> None:
+        self._docs.clear()
+        for k in self.stats:
+            self.stats[k] = 0
+
+    def load(self, path: str) -> Any:
+        """Wie load_file(), aber aus dem Cache, solange die Datei unveraendert ist."""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        gen = _generation(st)
+        cached = self._docs.get(key)
+        if cached is not None and cached[0] == gen:
+            self.stats["hits"] += 1
+            return cached[1]
+        with open(key, "rb") as f:
+            data = loads(f.read())
+        self.stats["misses"] += 1
+        self._docs[key] = (gen, data)
+        return data
+
+    def store(self, path: str, data: Any) -> None:
+        """Legt das soeben geschriebene (oder als unveraendert erkannte) Dokument ab."""
+        key = os.path.abspath(path)
+        try:
+            gen = _generation(os.stat(key))
+        except FileNotFoundError:
+            self._docs.pop(key, None)
+            return
+        self.stats["stores"] += 1
+        self._docs[key] = (gen, data)
+
+    def summary(self) -> str:
+        s = self.stats
+        return f"{s['misses']} geparst, {s['hits']} aus dem Speicher, {s['stores']} nach dem Schreiben übernommen"
+
+
+DOCUMENTS = DocumentCache()
+
+
+def load_file(path: str) -> Any:
+    """Liest und parst eine JSON-Datei (ueber DOCUMENTS). FileNotFoundError/
+    json.JSONDecodeError werden an den Aufrufer durchgereicht (jedes Skript meldet
+    sie auf seine eigene Art)."""
+    return DOCUMENTS.load(path)
+
+
+def _default_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_bytes_if_changed(path: str, payload: bytes) -> bool:
+    """Schreibt payload nach path - aber nur, wenn sich der Inhalt tatsaechlich aendert,
+    und dann atomar (Temp-Datei im selben Verzeichnis + os.replace).
+
+    Ein Lauf fasst sonst jedes Mal ~300 Sprach-/Manifest-Dateien an, auch wenn sich
+    nichts geaendert hat: jede geaenderte mtime loest im laufenden Vite-Dev-Server HMR/
+    Rebuilds aus. Der direkte open("w")-Schreibweg konnte ausserdem bei einem Abbruch
+    mitten im Schreiben abgeschnittenes JSON hinterlassen. Gibt True zurueck, wenn
+    geschrieben wurde, False bei unveraendertem Inhalt.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is not None and st.st_size == len(payload):
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                WRITE_STATS["unchanged"] += 1
+                return False
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp legt die Datei mit 0600 an - Rechte der bisherigen Datei bzw. den
+        # ueblichen Default uebernehmen, sonst aendert jeder Lauf nebenbei die Dateirechte.
+        os.chmod(tmp_path, (st.st_mode & 0o777) if st is not None else _default_file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    WRITE_STATS["written"] += 1
+    return True
+
+
+def write_json_if_changed(path: str, data: Any) -> bool:
+    """dumps() + write_bytes_if_changed(); data landet danach in DOCUMENTS."""
+    written = write_bytes_if_changed(path, dumps(data))
+    DOCUMENTS.store(path, data)
+    return written
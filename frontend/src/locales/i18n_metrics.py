@@ -0,0 +1,134 @@
+"""
+Lauf-Metriken je Provider und Zielsprache (--metrics-json / --metrics-prom).
+
+Bisher gab es am Ende eines Laufs nur das counters-Dict (uebersprungene/kopierte
+Originale, bewahrte Sonderzeichen, Echos). Fuer Durchsatz und Kontingent (DeepL
+rechnet nach Zeichen ab) ueber viele CI-Laeufe hinweg braucht es je (provider, lang):
+
+    requests        logische Uebersetzungs-Aufrufe (ein translate_text()-Aufruf)
+    chars           gesendete Zeichen (nach Platzhalter-Maskierung, wie beim Provider)
+    retries         wiederholte HTTP-Versuche, davon rate_limited = Antworten mit 429
+    failures        Aufrufe ohne verwertbares Ergebnis (None/Exception)
+    cache_hits      Keys, die ohne Provider-Aufruf beantwortet wurden
+    latency         Histogramm der Aufrufdauer inkl. Drosselung/Backoff (Sekunden)
+    bytes_written   Bytes tatsaechlich geschriebener Sprach- und Manifest-Dateien
+
+Export als JSON (eigenes, stabiles Schema) und im Prometheus-Textformat fuer den
+node_exporter-textfile-Collector (Datei wird atomar ersetzt).
+"""
+import time
+from typing import Any, Dict, List
+
+# Obergrenzen der Latenz-Buckets in Sekunden (kumulativ, wie Prometheus "le").
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_COUNTERS = ("requests", "chars", "retries", "rate_limited", "failures", "cache_hits", "bytes_written")
+
+_PROM_HELP = {
+    "requests": "Logische Uebersetzungs-Aufrufe",
+    "chars": "An den Provider gesendete Zeichen",
+    "retries": "Wiederholte Provider-Versuche",
+    "rate_limited": "Provider-Antworten mit HTTP 429",
+    "failures": "Aufrufe ohne verwertbares Ergebnis",
+    "cache_hits": "Ohne Provider-Aufruf beantwortete Keys",
+    "bytes_written": "Geschriebene Bytes (Sprach- und Manifest-Dateien)",
+}
+
+
+def _new_series() -> Dict[str, Any]:
+    series: Dict[str, Any] = {name: 0 for name in _COUNTERS}
+    series["latency"] = {"buckets": [0] * len(LATENCY_BUCKETS), "count": 0, "sum": 0.0}
+    return series
+
+
+class RunMetrics:
+    def __init__(self) -> None:
+        self.configure()
+
+    def configure(self) -> None:
+        """Setzt den Zustand fuer einen neuen Lauf zurueck."""
+        self.series: Dict[tuple[str, str], Dict[str, Any]] = {}
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+
+    def _get(self, provider: str, lang: str) -> Dict[str, Any]:
+        key = (provider, lang)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = _new_series()
+        return series
+
+    def add(self, provider: str, lang: str, name: str, value: int = 1) -> None:
+        self._get(provider, lang)[name] += value
+
+    def request(self, provider: str, lang: str, chars: int, seconds: float, ok: bool) -> None:
+        series = self._get(provider, lang)
+        series["requests"] += 1
+        series["chars"] += chars
+        if not ok:
+            series["failures"] += 1
+        hist = series["latency"]
+        hist["count"] += 1
+        hist["sum"] += seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                hist["buckets"][i] += 1
+                break
+
+    def retry(self, provider: str, lang: str, status: int | None = None) -> None:
+        series = self._get(provider, lang)
+        series["retries"] += 1
+        if status == 429:
+            series["rate_limited"] += 1
+
+    # -------- Export --------
+
+    def to_dict(self) -> Dict[str, Any]:
+        series: List[Dict[str, Any]] = []
+        for (provider, lang), s in sorted(self.series.items()):
+            entry = {"provider": provider, "lang": lang}
+            entry.update({name: s[name] for name in _COUNTERS})
+            hist = s["latency"]
+            cumulative = 0
+            buckets = {}
+            for bound, n in zip(LATENCY_BUCKETS, hist["buckets"]):
+                cumulative += n
+                buckets[repr(bound)] = cumulative
+            buckets["+Inf"] = hist["count"]
+            entry["latency_seconds"] = {"buckets": buckets, "count": hist["count"], "sum": round(hist["sum"], 6)}
+            series.append(entry)
+        return {
+            "started_at": round(self.started_at, 3),
+            "duration_seconds": round(time.perf_counter() - self._started, 6),
+            "series": series,
+        }
+
+    def to_prometheus(self, prefix: str = "i18n_translate") -> str:
+        data = self.to_dict()
+        lines: List[str] = []
+        for name in _COUNTERS:
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {_PROM_HELP[name]}")
+            lines.append(f"# TYPE {metric} counter")
+            for e in data["series"]:
+                lines.append(f'{metric}{{provider="{e["provider"]}",lang="{e["lang"]}"}} {e[name]}')
+        metric = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {metric} Dauer eines Uebersetzungs-Aufrufs inkl. Drosselung/Backoff")
+        lines.append(f"# TYPE {metric} histogram")
+        for e in data["series"]:
+            labels = f'provider="{e["provider"]}",lang="{e["lang"]}"'
+            hist = e["latency_seconds"]
+            for le, n in hist["buckets"].items():
+                lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {n}')
+            lines.append(f"{metric}_sum{{{labels}}} {hist['sum']}")
+            lines.append(f"{metric}_count{{{labels}}} {hist['count']}")
+        lines.append(f"# HELP {prefix}_run_duration_seconds Wandzeit des Laufs")
+        lines.append(f"# TYPE {prefix}_run_duration_seconds gauge")
+        lines.append(f"{prefix}_run_duration_seconds {data['duration_seconds']}")
+        lines.append(f"# HELP {prefix}_run_start_timestamp_seconds Startzeitpunkt des Laufs (Unix-Zeit)")
+        lines.append(f"# TYPE {prefix}_run_start_timestamp_seconds gauge")
+        lines.append(f"{prefix}_run_start_timestamp_seconds {data['started_at']}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = RunMetrics()
@@ -0,0 +1,218 @@
+"""
+Microbenchmarks fuer die heissen Hilfsfunktionen der i18n-Skripte, mit gespeicherter
+Baseline und Toleranz.
+
+Gemessen wird auf deterministisch erzeugten Eingaben (i18n_bench.generate_namespace,
+feste Seeds, synthetische JSX-Datei) - der echte Locale-Baum waechst mit jedem Feature
+und wuerde die Baseline ohne Code-Aenderung verschieben.
+
+Absolute Zeiten sind zwischen Rechnern (Laptop vs. CI-Runner) nicht vergleichbar. Jede
+Messung wird deshalb zusaetzlich durch die Zeit einer festen reinen-Python-
+Kalibrierungslast geteilt; verglichen wird dieses Verhaeltnis. Eine Funktion gilt als
+Regression, wenn ihr Verhaeltnis mehr als --tolerance (Default 30 %) ueber der Baseline
+liegt - dann Exit-Code 1 und eine unuebersehbare Meldung je Funktion.
+
+Aufruf:
+    python3 i18n_microbench.py                    # gegen Baseline pruefen
+    python3 i18n_microbench.py --update-baseline  # Baseline neu schreiben (bewusste Aenderung)
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_bench  # noqa: E402
+import i18n_json  # noqa: E402
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+import check_i18n_usage  # noqa: E402
+import i18n_terms  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "i18n_microbench_baseline.json")
+DEFAULT_TOLERANCE = 0.30
+REPEATS = 7
+# Mindestdauer einer Wiederholung (Sekunden); die Aufrufanzahl wird daraus bestimmt.
+MIN_REPEAT_S = 0.02
+# Verdaechtige Regressionen werden so oft erneut gemessen (bestes Verhaeltnis zaehlt):
+# Stoerungen (andere Prozesse, Taktwechsel) machen Messungen nur langsamer, nie schneller.
+CONFIRM_ATTEMPTS = 2
+
+_SAMPLE_TEXTS = [
+    "Mehrfachsignatur (Multi-Signature) schützt dein Konto.",
+    "Sende XLM an die Adresse (G-Adresse) und prüfe das Memo (MEMO_TEXT).",
+    "★ Favoriten (leer) – füge Konten über das Menü hinzu 😀",
+    "Trustline (Vertrauenslinie) für CODE:ISSUER anlegen.",
+    "Einfacher Satz ohne Klammern, aber mit & und … Zeichen.",
+    "Your balance is low (minimum reserve) – add funds.",
+]
+
+
+def _calibration() -> int:
+    # Feste, reine-Python-Last mit aehnlichem Profil wie die Helfer (dict/str/Schleifen).
+    d: Dict[str, str] = {}
+    for i in range(300):
+        key = f"k{i}.sub"
+        d[key] = key.upper()
+    return sum(len(k) + len(v) for k, v in d.items())
+
+
+def _jsx_source(rng: random.Random, lines: int) -> str:
+    out: List[str] = []
+    for i in range(lines):
+        roll = rng.random()
+        if roll < 0.25:
+            out.append(f"  const label{i} = t('ns{i % 7}:group.s{i % 4}.k{i}');")
+        elif roll < 0.35:
+            out.append(f'  <Trans i18nKey="ns{i % 5}:help.k{i}" components={{[<b />]}} />')
+        elif roll < 0.40:
+            out.append(f"  const key{i} = t('learn:' + lessonId + '.title');")
+        elif roll < 0.45:
+            out.append(f'  {{t("common.k{i}")}} {{t(`common.tpl{i}`)}}')
+        else:
+            out.append(f"  const value{i} = compute(value{i - 1 if i else 0}, {i}); // keine Übersetzung")
+    return "\n".join(out) + "\n"
+
+
+def build_cases(workdir: str) -> List[Tuple[str, Callable[[], Any]]]:
+    """(Name, argumentloser Aufruf) je Funktion. Eingaben werden einmalig erzeugt."""
+    rng = random.Random(42)
+    ns = i18n_bench.generate_namespace(rng, keys=400, depth=3, value_len=50, dotted_share=0.1, original_share=0.05)
+    flat = usd._flatten_dict(ns)
+    values = [v for v in flat.values() if isinstance(v, str)]
+    dotted_paths = sorted(p for p in flat if p.endswith(".fb"))[:20]
+    texts = _SAMPLE_TEXTS * 5
+    echo_pairs = [(t, t) for t in texts] + [(t, t.upper()) for t in texts]
+    # Begriffsschutz: ~300 Begriffe (Glossar-Groessenordnung plus Reserve) ueber alle Werte.
+    terms = ["Stellar", "XLM", "Trustline", "Multisig", "MEMO_RETURN"] + [f"Term{i}X" for i in range(300)]
+    matcher = i18n_terms.TermMatcher(terms)
+    jsx_path = os.path.join(workdir, "Sample.jsx")
+    with open(jsx_path, "w", encoding="utf-8") as f:
+        f.write(_jsx_source(random.Random(7), 400))
+
+    return [
+        ("_flatten_dict", lambda: usd._flatten_dict(ns)),
+        ("_collect_leaf_paths", lambda: usd._collect_leaf_paths(ns)),
+        ("_get_node_by_path", lambda: [usd._get_node_by_path(ns, p) for p in dotted_paths]),
+        ("protect_parenthesized_english", lambda: [usd.protect_parenthesized_english(t) for t in texts]),
+        ("_extract_special_chars", lambda: [usd._extract_special_chars(t) for t in texts]),
+        ("_looks_like_untranslated_echo", lambda: [usd._looks_like_untranslated_echo(a, b) for a, b in echo_pairs]),
+        ("_sha256", lambda: [usd._sha256(v) for v in values]),
+        ("TermMatcher.mask", lambda: [matcher.mask(v, {}) for v in values + texts]),
+        ("check_i18n_usage.flatten_i18n", lambda: check_i18n_usage.flatten_i18n(ns)),
+        ("check_i18n_usage.extract_keys_from_file", lambda: check_i18n_usage.extract_keys_from_file(jsx_path)),
+    ]
+
+
+def _best_seconds_per_call(fn: Callable[[], Any], repeats: int = REPEATS, min_repeat_s: float = MIN_REPEAT_S) -> float:
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_repeat_s:
+            break
+        number *= 2
+    return min(timer.repeat(repeats, number)) / number
+
+
+def _measure_case(fn: Callable[[], Any], repeats: int, min_repeat_s: float) -> Dict[str, float]:
+    # Kalibrierung direkt vor UND nach der Funktion (bestes von beiden): Takt-/Last-
+    # Schwankungen waehrend des Laufs wirken so auf Zaehler und Nenner gleichermassen.
+    before = _best_seconds_per_call(_calibration, repeats, min_repeat_s)
+    seconds = _best_seconds_per_call(fn, repeats, min_repeat_s)
+    after = _best_seconds_per_call(_calibration, repeats, min_repeat_s)
+    calibration = min(before, after)
+    return {"ns_per_call": round(seconds * 1e9, 1), "ratio": round(seconds / calibration, 4), "calibration_ns": calibration * 1e9}
+
+
+def measure(
+    repeats: int = REPEATS,
+    min_repeat_s: float = MIN_REPEAT_S,
+    baseline: Dict[str, Any] | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Dict[str, Any]:
+    """Misst alle Funktionen. Mit baseline werden Funktionen ueber der Toleranz bis zu
+    CONFIRM_ATTEMPTS-mal nachgemessen, bevor sie als Regression gelten."""
+    cases: Dict[str, Dict[str, float]] = {}
+    calibrations: List[float] = []
+    base_cases = (baseline or {}).get("cases", {})
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, fn in build_cases(workdir):
+            result = _measure_case(fn, repeats, min_repeat_s)
+            base = base_cases.get(name)
+            attempts = 0
+            while base is not None and result["ratio"] > base["ratio"] * (1 + tolerance) and attempts < CONFIRM_ATTEMPTS:
+                attempts += 1
+                retry = _measure_case(fn, repeats, min_repeat_s)
+                if retry["ratio"] < result["ratio"]:
+                    result = retry
+            calibrations.append(result.pop("calibration_ns"))
+            cases[name] = result
+    return {"calibration_ns": round(min(calibrations), 1), "cases": cases}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Tuple[List[str], List[str]]:
+    """Gibt (Regressionen, Hinweise) als fertige Meldungszeilen zurueck."""
+    regressions: List[str] = []
+    notes: List[str] = []
+    base_cases = baseline.get("cases", {})
+    for name, cur in current["cases"].items():
+        base = base_cases.get(name)
+        if base is None:
+            notes.append(f"ℹ️  {name}: keine Baseline vorhanden (--update-baseline)")
+            continue
+        change = cur["ratio"] / base["ratio"] - 1.0
+        line = f"{name}: {cur['ratio']:.3f} vs. Baseline {base['ratio']:.3f} ({change:+.0%}, {cur['ns_per_call'] / 1000:.1f} µs/Aufruf)"
+        if change > tolerance:
+            regressions.append(f"❌ REGRESSION {line}")
+        elif change < -tolerance:
+            notes.append(f"🚀 schneller: {line} - Baseline ggf. mit --update-baseline nachziehen")
+        else:
+            notes.append(f"✅ {line}")
+    for name in base_cases:
+        if name not in current["cases"]:
+            notes.append(f"ℹ️  {name}: in Baseline, aber nicht mehr gemessen")
+    return regressions, notes
+
+
+def main(argv: List[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Microbenchmarks der i18n-Hilfsfunktionen gegen gespeicherte Baseline.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline-Datei (Default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="erlaubte Verlangsamung, z.B. 0.3 = +30%% (Default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="aktuelle Messung als neue Baseline speichern")
+    args = parser.parse_args(argv)
+
+    if args.update_baseline:
+        current = measure()
+        i18n_json.write_bytes_if_changed(args.baseline, i18n_json.dumps(current))
+        print(f"💾 Baseline gespeichert: {args.baseline}")
+        for name, c in current["cases"].items():
+            print(f"   {name}: {c['ns_per_call'] / 1000:.1f} µs/Aufruf (Verhältnis {c['ratio']:.3f})")
+        return 0
+
+    try:
+        with open(args.baseline, "rb") as f:
+            baseline = i18n_json.loads(f.read())
+    except FileNotFoundError:
+        print(f"❌ Keine Baseline gefunden: {args.baseline} - zuerst mit --update-baseline anlegen.")
+        return 2
+
+    current = measure(baseline=baseline, tolerance=args.tolerance)
+    regressions, notes = compare(current, baseline, args.tolerance)
+    for line in notes:
+        print(line)
+    if regressions:
+        print("")
+        print("=" * 72)
+        for line in regressions:
+            print(line)
+        print(f"{len(regressions)} Funktion(en) mehr als {args.tolerance:.0%} langsamer als die Baseline.")
+        print("=" * 72)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
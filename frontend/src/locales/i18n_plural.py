@@ -0,0 +1,151 @@
+"""
+i18next-Pluralfamilien (key_one/key_other/...) als Einheit uebersetzen.
+
+Bisher war jedes Familienmitglied ein unabhaengiges Blatt: getrennte Provider-Aufrufe,
+uneinheitliche Formulierung zwischen _one und _other, und Zielsprachen mit mehr
+Pluralformen (ru: _few/_many, hr: _few) bekamen diese Formen nie - i18next faellt dort
+fuer 2-4 bzw. 5+ auf eine grammatisch falsche Form zurueck.
+
+Ablauf je Familie und Zielsprache (UpdateSprachdateienBasierendAufDE._translate_plural_family):
+
+1. build_unit(): eine Zeile je CLDR-Kategorie, die die Zielsprache braucht
+   (PLURAL_CATEGORIES). Vorhandene Quell-Kategorien werden direkt uebersetzt. Fehlende
+   Kategorien (z.B. "few" fuer ru aus der DE/EN-Quelle, die nur one/other kennt) werden
+   aus dem _other-Text erzeugt, in dem {{count}} durch eine Beispielzahl der Kategorie
+   ersetzt ist (ru few: 3, many: 5) - der Provider beugt das Substantiv dann passend zur
+   Zahl ("3 теста", "5 тестов").
+2. Alle Zeilen gehen als EIN Text (Zeilenumbruch-getrennt) an den Provider - einheitliche
+   Formulierung, ein Request statt vieler.
+3. parse_unit(): Antwort zeilenweise zuordnen, Beispielzahl wieder zu {{count}}.
+   Kategorien, deren Form in der Praxis mit "other" zusammenfaellt (COPY_FORMS: fr/es/it
+   "many" = Zahlwort-Konstruktion "1 million de ..."), werden aus "other" kopiert.
+
+Eine Familie, in der eine Quellform selbst einen Zeilenumbruch enthaelt, laesst sich so
+nicht zuordnen (die Zeilenzahl der Antwort passt nie - jeder Lauf wuerde sie erneut
+schicken). build_unit() lehnt sie ab, plural_families() erkennt sie gar nicht erst als
+Familie: ihre Mitglieder werden wie frueher einzeln uebersetzt.
+
+Invalidiert wird die Familie als Ganzes: aendert sich ein Mitglied in der Quelle, werden
+alle neu uebersetzt (expand_families), und scheitert eine Form, gilt die ganze Familie
+als nicht erledigt.
+"""
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+PLURAL_SUFFIXES = ("zero", "one", "two", "few", "many", "other")
+PLURAL_KEY_RE = re.compile(r"^(.+)_(zero|one|two|few|many|other)$")
+COUNT_RE = re.compile(r"\{\{\s*count\s*\}\}")
+
+# CLDR-Kardinalkategorien (Intl.PluralRules, wie i18next sie aufloest) je Sprache.
+PLURAL_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "de": ("one", "other"),
+    "en": ("one", "other"),
+    "nl": ("one", "other"),
+    "fi": ("one", "other"),
+    "es": ("one", "many", "other"),
+    "fr": ("one", "many", "other"),
+    "it": ("one", "many", "other"),
+    "hr": ("one", "few", "other"),
+    "ru": ("one", "few", "many", "other"),
+}
+DEFAULT_CATEGORIES = ("one", "other")
+
+COPY_FORMS: Dict[str, Dict[str, str]] = {
+    "es": {"many": "other"},
+    "fr": {"many": "other"},
+    "it": {"many": "other"},
+}
+
+# Beispielzahlen je Kategorie (ru/hr); die erste, die nicht schon im Text vorkommt, gewinnt.
+SAMPLE_COUNTS: Dict[str, Tuple[str, ...]] = {
+    "few": ("3", "4", "23", "24"),
+    "many": ("5", "6", "7", "8", "9", "11"),
+}
+
+# (Kategorie, Quellzeile oder None, Beispielzahl oder None)
+Unit = List[Tuple[str, str | None, str | None]]
+
+
+def plural_families(d: Dict[str, object]) -> Dict[str, Dict[str, str]]:
+    """Familien unter den String-Blaettern EINER Ebene: {stem: {kategorie: key}}. Nur mit
+    "other" und mindestens zwei Mitgliedern; ist ein Mitglied mehrzeilig, bleibt die ganze
+    Familie bei Einzel-Blaettern (siehe fits_unit)."""
+    families: Dict[str, Dict[str, str]] = {}
+    for key, value in d.items():
+        if not isinstance(value, str):
+            continue
+        m = PLURAL_KEY_RE.match(key)
+        if m:
+            families.setdefault(m.group(1), {})[m.group(2)] = key
+    return {
+        stem: members for stem, members in families.items()
+        if "other" in members and len(members) >= 2 and fits_unit({c: d[k] for c, k in members.items()})
+    }
+
+
+def fits_unit(sources: Dict[str, str]) -> bool:
+    """Eine Zeile je Form: mit Zeilenumbruch in einer Quellform liesse sich die Antwort
+    nicht mehr den Kategorien zuordnen."""
+    return not any("\n" in text for text in sources.values())
+
+
+def target_categories(lang: str, source_categories: Iterable[str]) -> Tuple[str, ...]:
+    cats = PLURAL_CATEGORIES.get(lang, DEFAULT_CATEGORIES)
+    # i18next-Sonderform _zero gilt sprachunabhaengig, wenn die Quelle sie hat.
+    return (("zero",) + cats) if "zero" in source_categories else cats
+
+
+def _sample_for(category: str, text: str) -> str | None:
+    for sample in SAMPLE_COUNTS.get(category, ()):
+        if not re.search(rf"(?<![\d.,]){sample}(?![\d.,])", text):
+            return sample
+    return None
+
+
+def build_unit(sources: Dict[str, str], lang: str) -> Unit | None:
+    """Zeilen der Provider-Einheit fuer die Familie sources ({kategorie: quelltext});
+    None, wenn eine Quellform mehrzeilig ist (Mitglieder einzeln uebersetzen)."""
+    if not fits_unit(sources):
+        return None
+    other = sources["other"]
+    unit: Unit = []
+    for cat in target_categories(lang, sources):
+        if cat in sources:
+            unit.append((cat, sources[cat], None))
+            continue
+        sample = None if cat in COPY_FORMS.get(lang, {}) or not COUNT_RE.search(other) else _sample_for(cat, other)
+        if sample is None:
+            unit.append((cat, None, None))
+        else:
+            unit.append((cat, COUNT_RE.sub(sample, other), sample))
+    return unit
+
+
+def parse_unit(unit: Unit, translated: str, sources: Dict[str, str]) -> Dict[str, str] | str:
+    """{kategorie: uebersetzter Text} oder eine Fehlerbeschreibung (str)."""
+    lines = [line.strip() for line in translated.strip().split("\n") if line.strip()]
+    expected = [u for u in unit if u[1] is not None]
+    if len(lines) != len(expected):
+        return f"{len(lines)} statt {len(expected)} Zeilen"
+    forms: Dict[str, str] = {}
+    for (cat, _, sample), line in zip(expected, lines):
+        if sample is not None:
+            pattern = re.compile(rf"(?<![\d.,]){sample}(?![\d.,])")
+            want = len(COUNT_RE.findall(sources["other"]))
+            if len(pattern.findall(line)) != want:
+                return f"Beispielzahl {sample} für '{cat}' nicht eindeutig wiedergefunden"
+            line = pattern.sub("{{count}}", line)
+        forms[cat] = line
+    for cat, line, _ in unit:
+        if line is None:
+            forms[cat] = forms["other"]
+    return forms
+
+
+def expand_families(keys: Set[str], flat_keys: Iterable[str]) -> Set[str]:
+    """keys plus alle Geschwister (gleicher Stamm) jeder betroffenen Pluralfamilie."""
+    stems = {m.group(1) for m in map(PLURAL_KEY_RE.match, keys) if m}
+    if not stems:
+        return keys
+    siblings = {k for k in flat_keys if (m := PLURAL_KEY_RE.match(k)) and m.group(1) in stems}
+    return keys | siblings
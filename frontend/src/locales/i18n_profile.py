@@ -0,0 +1,124 @@
+"""
+Phasen-Profiling fuer UpdateSprachdateienBasierendAufDE.py (--profile).
+
+Bisher war nicht sichtbar, wohin die Laufzeit eines Laufs geht: Provider-Latenz,
+Backoff-Wartezeiten, JSON-Parsen, Flatten/Hashing oder Schreiben. PROFILE misst pro
+Phase Wand- und CPU-Zeit, aufgeschluesselt nach Namespace:
+
+    source-sync, collision-check, plan         einmal pro Lauf
+    phase-a, phase-b:<lang>                    Merge/Uebersetzung je Namespace
+    save, manifest                             Sprachdatei bzw. Manifest schreiben
+    provider, throttle, backoff, parse         verschachtelt in den obigen Phasen
+
+Phasen duerfen verschachtelt sein; die Rangliste sortiert nach Eigenzeit (Wandzeit
+abzueglich verschachtelter Phasen), damit sich die Zeilen zur Gesamtlaufzeit
+aufsummieren und z.B. "provider" nicht doppelt in "phase-b:fr" mitgezaehlt wird.
+Ein Namespace wird von der aeusseren Phase an alle inneren vererbt.
+
+Ohne --profile ist phase() ein wiederverwendeter nullcontext - keine Messkosten.
+"""
+import contextlib
+import time
+from typing import Dict, Iterator, List
+
+_NULL = contextlib.nullcontext()
+
+
+class _Stat:
+    __slots__ = ("wall", "cpu", "self_wall", "calls")
+
+    def __init__(self) -> None:
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.self_wall = 0.0
+        self.calls = 0
+
+
+class PhaseProfiler:
+    def __init__(self) -> None:
+        self.configure(False)
+
+    def configure(self, enabled: bool) -> None:
+        """Setzt den Zustand fuer einen neuen Lauf zurueck."""
+        self.enabled = enabled
+        self.stats: Dict[tuple[str, str], _Stat] = {}
+        # Stack offener Phasen: [namespace, Wandzeit verschachtelter Phasen]
+        self._stack: List[list] = []
+        self._started = time.perf_counter()
+
+    def phase(self, name: str, ns: str | None = None):
+        if not self.enabled:
+            return _NULL
+        return self._measure(name, ns)
+
+    @contextlib.contextmanager
+    def _measure(self, name: str, ns: str | None) -> Iterator[None]:
+        if ns is None:
+            ns = self._stack[-1][0] if self._stack else ""
+        frame = [ns, 0.0]
+        self._stack.append(frame)
+        wall0 = time.perf_counter()
+        cpu0 = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall0
+            cpu = time.process_time() - cpu0
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += wall
+            st = self.stats.get((name, ns))
+            if st is None:
+                st = self.stats[(name, ns)] = _Stat()
+            st.wall += wall
+            st.cpu += cpu
+            st.self_wall += wall - frame[1]
+            st.calls += 1
+
+    def by_phase(self) -> Dict[str, _Stat]:
+        """Summen je Phase ueber alle Namespaces."""
+        out: Dict[str, _Stat] = {}
+        for (name, _), st in self.stats.items():
+            agg = out.setdefault(name, _Stat())
+            agg.wall += st.wall
+            agg.cpu += st.cpu
+            agg.self_wall += st.self_wall
+            agg.calls += st.calls
+        return out
+
+    def summary(self, top: int = 15) -> str:
+        total = time.perf_counter() - self._started
+        lines = [f"⏱️  Profil ({total:.2f}s Wandzeit gesamt), je Phase nach Eigenzeit:"]
+        phases = sorted(self.by_phase().items(), key=lambda kv: kv[1].self_wall, reverse=True)
+        for name, st in phases:
+            share = 100.0 * st.self_wall / total if total > 0 else 0.0
+            lines.append(
+                f"   {name:<16} eigen {st.self_wall:8.3f}s ({share:5.1f}%)  wand {st.wall:8.3f}s"
+                f"  cpu {st.cpu:8.3f}s  {st.calls:>6}x"
+            )
+        ranked = sorted(
+            ((k, st) for k, st in self.stats.items() if k[1]),
+            key=lambda kv: kv[1].self_wall,
+            reverse=True,
+        )[:top]
+        if ranked:
+            lines.append(f"   Top {len(ranked)} Phase × Namespace:")
+            for (name, ns), st in ranked:
+                lines.append(f"   {name:<16} {ns:<20} eigen {st.self_wall:8.3f}s  cpu {st.cpu:8.3f}s  {st.calls:>6}x")
+        return "\n".join(lines)
+
+
+PROFILE = PhaseProfiler()
+
+
+def cprofile_summary(stats_path: str, source_dir: str, top: int = 20) -> str:
+    """Top-Funktionen aus einem cProfile-Dump, beschraenkt auf die i18n-Skripte selbst
+    (Bibliotheks-Interna wie json/urllib interessieren fuer Optimierungen hier nicht)."""
+    import io
+    import pstats
+    import re
+
+    buf = io.StringIO()
+    st = pstats.Stats(stats_path, stream=buf)
+    st.sort_stats("tottime").print_stats(re.escape(source_dir), top)
+    return buf.getvalue().rstrip()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Deterministisches Aufteilen eines Uebersetzungslaufs auf mehrere Prozesse/CI-Jobs
+(UpdateSprachdateienBasierendAufDE.py --shard i/N) und Zusammenfuehren der Manifeste.
+
+Ein --full-Lauf oder eine neue Zielsprache dauert laenger, als ein einzelner CI-Job
+laufen sollte, und main() konnte die Arbeit bisher nicht aufteilen.
+
+Aufteilung: Einheit ist ein (Namespace, Sprache)-Job. Phase B uebersetzt aus dem
+EN-Pivot - hat ein Namespace in Phase A noch offene Arbeit, bleiben deshalb alle seine
+Sprachen EINE Einheit (sonst wuerde ein anderer Shard aus einem veralteten Pivot
+uebersetzen). Gewicht einer Einheit = geschaetzte Zeichenzahl der geplanten Keys (nicht
+Dateianzahl: ein grosser Namespace kostet ein Vielfaches eines kleinen). Verteilt wird
+per LPT (groesste Einheit zuerst an den aktuell leichtesten Shard; Gleichstand ->
+Einheiten-Name bzw. kleinster Index) - jeder Shard rechnet aus demselben Checkout
+denselben Plan und nimmt sich nur seinen Teil. plan_id (Hash ueber Einheiten, Gewichte
+und N) macht sichtbar, wenn Shards aus unterschiedlichen Staenden stammen. Laufen die
+Shards nacheinander oder parallel im SELBEN Verzeichnis, veraendern die Ausgaben des
+ersten die Arbeitsmenge der spaeteren - deshalb legt der erste Shard den Plan in
+.i18n_hash/shards/plan.json ab, und alle weiteren uebernehmen ihn.
+
+Ausgaben: ein Shard schreibt nur die Sprachdateien seiner Jobs; statt der kanonischen
+Manifeste legt er Teil-Manifeste unter .i18n_hash/shards/<i>-of-<N>/ ab, die nur die
+Eintraege seiner (Namespace, Sprache)-Jobs enthalten. Die im Shard gescheiterten Keys
+(sonst direkt .i18n_hash/failed.json, siehe i18n_status.py) landen ebenfalls dort in
+failed.json - je bearbeitetem Job, auch ohne Fehlschlag, damit alte Eintraege beim
+Zusammenfuehren verschwinden. Ebenso der Checkpoint eines vom Budget abgebrochenen
+Shards (sonst .i18n_hash/checkpoint.json, siehe i18n_budget.py): jeder Shard schreibt
+checkpoint.json in sein Verzeichnis, mit den zurueckgestellten Keys seiner Jobs und den
+Eintraegen des alten Checkpoints, die kein Job des Laufs betrifft.
+
+Zusammenfuehren (nach allen Shards, z.B. im abschliessenden CI-Job):
+
+    python3 i18n_shard.py merge [--base-path PFAD] [--keep]
+
+prueft Vollstaendigkeit (alle Indizes 1..N, gleiche plan_id) und Konflikte (derselbe Job
+in zwei Shards, derselbe Key mit verschiedenen Hashes). Bei Konflikten wird nichts
+geschrieben (Exit-Code 1); sonst werden die Teil-Manifeste in die kanonischen
+.i18n_hash/<lang>_from_<pivot>.json uebernommen, die gescheiterten Keys per
+i18n_status.record_failures in .i18n_hash/failed.json, die Vereinigung der
+Shard-Checkpoints als .i18n_hash/checkpoint.json (ohne Shard-Checkpoint wird er
+entfernt), und das shards/-Verzeichnis entfernt.
+"""
+import hashlib
+import os
+import shutil
+import sys
+from typing import Dict, Iterable, List, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_core  # noqa: E402
+import i18n_json  # noqa: E402
+from i18n_budget import CHECKPOINT_FILE, write_checkpoint  # noqa: E402
+from i18n_status import FAILED_FILE, record_failures  # noqa: E402
+
+SHARDS_DIR = "shards"
+MARKER_FILE = "shard.json"
+PLAN_FILE = "plan.json"
+
+Job = Tuple[str, str]  # (Namespace, Sprache)
+
+
+def parse_shard_spec(value: str) -> Tuple[int, int]:
+    """"i/N" -> (i, N) mit 1 <= i <= N (argparse-type: ValueError = ungueltiger Wert)."""
+    index, sep, count = value.partition("/")
+    if not sep or not index.strip().isdigit() or not count.strip().isdigit():
+        raise ValueError(value)
+    i, n = int(index), int(count)
+    if n < 1 or not 1 <= i <= n:
+        raise ValueError(value)
+    return i, n
+
+
+def build_units(job_chars: Dict[Job, int], pivot_pending: Set[str]) -> Dict[str, Tuple[List[Job], int]]:
+    """{Einheit: (Jobs, Gewicht)}; Namespaces in pivot_pending bilden eine Einheit."""
+    units: Dict[str, Tuple[List[Job], int]] = {}
+    for (ns, lang), chars in sorted(job_chars.items()):
+        unit = ns if ns in pivot_pending else f"{ns}/{lang}"
+        jobs, weight = units.get(unit, ([], 0))
+        units[unit] = (jobs + [(ns, lang)], weight + chars)
+    return units
+
+
+def assign_units(units: Dict[str, Tuple[List[Job], int]], count: int) -> Dict[str, int]:
+    """LPT-Verteilung {Einheit: Shard-Index (1-basiert)} - deterministisch."""
+    loads = [0] * count
+    assignment: Dict[str, int] = {}
+    for unit, (_, weight) in sorted(units.items(), key=lambda item: (-item[1][1], item[0])):
+        target = min(range(count), key=lambda i: (loads[i], i))
+        loads[target] += weight
+        assignment[unit] = target + 1
+    return assignment
+
+
+def _plan_id(units: Dict[str, Tuple[List[Job], int]], count: int) -> str:
+    h = hashlib.sha256(f"{count}\n".encode())
+    for unit, (_, weight) in sorted(units.items()):
+        h.update(f"{unit}\t{weight}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _read_json(path: str):
+    try:
+        with open(path, "rb") as f:
+            return i18n_json.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _create_exclusive(path: str, payload: bytes) -> bool:
+    """Legt path atomar an - False, wenn es ihn schon gibt (Temp-Datei + os.link)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    try:
+        os.link(tmp_path, path)
+        return True
+    except FileExistsError:
+        return False
+    finally:
+        os.unlink(tmp_path)
+
+
+def owner_namespace(key: str, namespaces: Iterable[str]) -> str | None:
+    """Namespace eines Manifest-Keys "<ns>.<rel>" - laengster passender Name gewinnt
+    ("quiz.ui.title" gehoert zu quiz.ui, nicht zu quiz)."""
+    best = None
+    for ns in namespaces:
+        if key.startswith(ns + ".") and (best is None or len(ns) > len(best)):
+            best = ns
+    return best
+
+
+class ShardPlan:
+    """Lauf-bezogener Shard-Zustand; inaktiv (alles gehoert dem Lauf) ohne --shard."""
+
+    def __init__(self) -> None:
+        self.configure(None)
+
+    def configure(self, spec: Tuple[int, int] | None) -> None:
+        self.index, self.count = spec if spec is not None else (1, 1)
+        self.active = spec is not None
+        self.jobs: Set[Job] = set()
+        self.namespaces: List[str] = []
+        self.plan_id = ""
+        self.chars = 0
+        self.total_chars = 0
+        self.reused = False
+
+    def assign(self, job_chars: Dict[Job, int], pivot_pending: Set[str], hash_dir: str) -> None:
+        """Berechnet den Plan - oder uebernimmt shards/plan.json, falls ein anderer Shard
+        im selben Verzeichnis schon gelaufen ist (dessen Ausgaben haben die Arbeitsmenge
+        bereits veraendert, ein neu berechneter Plan wuerde nicht mehr passen). Ein Plan
+        mit anderem N ist ein Fehler (ValueError)."""
+        plan_path = os.path.join(hash_dir, SHARDS_DIR, PLAN_FILE)
+        plan = _read_json(plan_path)
+        self.reused = plan is not None
+        if plan is None:
+            units = build_units(job_chars, pivot_pending)
+            assignment = assign_units(units, self.count)
+            plan = {
+                "count": self.count,
+                "plan": _plan_id(units, self.count),
+                "namespaces": sorted({ns for ns, _ in job_chars}),
+                "units": {
+                    unit: {"shard": assignment[unit], "chars": weight, "jobs": [list(job) for job in jobs]}
+                    for unit, (jobs, weight) in sorted(units.items())
+                },
+            }
+            # Parallele Shards im selben Verzeichnis: nur der erste Plan gilt.
+            if not _create_exclusive(plan_path, i18n_json.dumps(plan)):
+                plan = _read_json(plan_path)
+                self.reused = True
+        if not isinstance(plan, dict) or plan.get("count") != self.count:
+            found = plan.get("count") if isinstance(plan, dict) else "?"
+            raise ValueError(f"{plan_path} gehört zu N={found}, nicht {self.count} (erst zusammenführen oder löschen)")
+        self.plan_id = str(plan["plan"])
+        self.namespaces = list(plan["namespaces"])
+        for unit in plan["units"].values():
+            self.total_chars += unit["chars"]
+            if unit["shard"] == self.index:
+                self.jobs.update((ns, lang) for ns, lang in unit["jobs"])
+                self.chars += unit["chars"]
+
+    def owns(self, ns: str, lang: str) -> bool:
+        return not self.active or (ns, lang) in self.jobs
+
+    def owns_namespace(self, ns: str) -> bool:
+        return not self.active or any(job_ns == ns for job_ns, _ in self.jobs)
+
+    def partial_dir(self, hash_dir: str) -> str:
+        return os.path.join(hash_dir, SHARDS_DIR, f"{self.index}-of-{self.count}")
+
+    def partial_path(self, hash_dir: str, lang: str, from_pivot: str) -> str:
+        return os.path.join(self.partial_dir(hash_dir), f"{lang}_from_{from_pivot}.json")
+
+    def load_partial(self, hash_dir: str, lang: str, from_pivot: str) -> Dict[str, str]:
+        """Eintraege des eigenen Teil-Manifests (das kanonische Manifest bleibt waehrend
+        eines Shard-Laufs unveraendert - ohne diese Ueberlagerung gingen die Eintraege
+        frueherer Namespaces beim naechsten Laden verloren)."""
+        try:
+            part = i18n_json.load_file(self.partial_path(hash_dir, lang, from_pivot))
+        except (OSError, ValueError):
+            return {}
+        entries = part.get("entries") if isinstance(part, dict) else None
+        return dict(entries) if isinstance(entries, dict) else {}
+
+    def write_partial(self, hash_dir: str, lang: str, from_pivot: str, manifest: Dict[str, str]) -> bool:
+        """Teil-Manifest mit den Eintraegen der eigenen Jobs dieser Sprache."""
+        owned = sorted(ns for ns, job_lang in self.jobs if job_lang == lang)
+        owned_set = set(owned)
+        entries = {k: v for k, v in manifest.items() if owner_namespace(k, self.namespaces) in owned_set}
+        payload = {
+            "shard": f"{self.index}/{self.count}",
+            "plan": self.plan_id,
+            "lang": lang,
+            "pivot": from_pivot,
+            "namespaces": owned,
+            "entries": dict(sorted(entries.items())),
+        }
+        os.makedirs(self.partial_dir(hash_dir), exist_ok=True)
+        return i18n_json.write_json_if_changed(self.partial_path(hash_dir, lang, from_pivot), payload)
+
+    def write_failures(self, hash_dir: str, failures: Dict[Job, Set[str]]) -> None:
+        """Gescheiterte Keys der bearbeiteten Jobs (leere Menge = Job ohne Fehlschlag);
+        ein erneuter Lauf desselben Shards ersetzt nur die Jobs, die er bearbeitet."""
+        path = os.path.join(self.partial_dir(hash_dir), FAILED_FILE)
+        previous = _read_json(path)
+        jobs = {}
+        if isinstance(previous, dict) and previous.get("plan") == self.plan_id:
+            jobs = {(ns, lang): list(keys) for ns, lang, keys in previous.get("jobs") or []}
+        jobs.update({job: sorted(keys) for job, keys in failures.items()})
+        os.makedirs(self.partial_dir(hash_dir), exist_ok=True)
+        i18n_json.write_json_if_changed(path, {
+            "shard": f"{self.index}/{self.count}",
+            "plan": self.plan_id,
+            "jobs": [[ns, lang, keys] for (ns, lang), keys in sorted(jobs.items())],
+        })
+
+    def write_marker(self, hash_dir: str) -> None:
+        """Abschluss-Marker - auch ein Shard ohne Jobs zaehlt beim Zusammenfuehren mit."""
+        directory = self.partial_dir(hash_dir)
+        os.makedirs(directory, exist_ok=True)
+        i18n_json.write_json_if_changed(os.path.join(directory, MARKER_FILE), {
+            "shard": f"{self.index}/{self.count}",
+            "plan": self.plan_id,
+            "jobs": len(self.jobs),
+            "chars": self.chars,
+        })
+
+
+SHARD = ShardPlan()
+
+
+# -------- Zusammenfuehren --------
+
+class MergeReport:
+    def __init__(self) -> None:
+        self.errors: List[str] = []
+        self.manifests: Dict[Tuple[str, str], Dict[str, str]] = {}  # (lang, pivot) -> neue Eintraege
+        self.failures: Dict[Job, Set[str]] = {}  # (Namespace, Sprache) -> gescheiterte Keys
+        self.deferred: Dict[str, Dict[str, Set[str]]] = {}  # Sprache -> Namespace -> zurueckgestellte Keys
+        self.stop_reason: str | None = None
+        self.deferred_chars = 0
+        self.shards = 0
+
+
+def collect_partials(hash_dir: str) -> MergeReport:
+    """Liest und prueft alle Teil-Manifeste; schreibt nichts."""
+    report = MergeReport()
+    root = os.path.join(hash_dir, SHARDS_DIR)
+    if not os.path.isdir(root):
+        report.errors.append(f"keine Teil-Manifeste unter {root}")
+        return report
+    plans: Set[Tuple[str, int]] = set()
+    seen: Set[int] = set()
+    owners: Dict[Tuple[str, str], str] = {}                  # (Sprache, Namespace) -> Shard
+    values: Dict[Tuple[str, str], Dict[str, Tuple[str, str]]] = {}  # (lang, pivot) -> key -> (Hash, Shard)
+    for dirname in sorted(os.listdir(root)):
+        directory = os.path.join(root, dirname)
+        if not os.path.isdir(directory):
+            continue
+        for fname in sorted(os.listdir(directory)):
+            if not fname.endswith(".json"):
+                continue
+            if fname == CHECKPOINT_FILE:
+                # Format von i18n_budget (ohne shard/plan) - die Zuordnung liefert der Marker.
+                checkpoint = _read_json(os.path.join(directory, fname)) or {}
+                for lang, by_ns in (checkpoint.get("deferred") or {}).items():
+                    for ns, keys in by_ns.items():
+                        report.deferred.setdefault(lang, {}).setdefault(ns, set()).update(keys)
+                report.stop_reason = report.stop_reason or checkpoint.get("reason")
+                report.deferred_chars += checkpoint.get("chars") or 0
+                continue
+            with open(os.path.join(directory, fname), "rb") as f:
+                part = i18n_json.loads(f.read())
+            shard = str(part.get("shard", dirname))
+            index, count = parse_shard_spec(shard)
+            plans.add((str(part.get("plan")), count))
+            if fname == MARKER_FILE:
+                seen.add(index)
+                continue
+            if fname == FAILED_FILE:
+                for ns, lang, keys in part.get("jobs") or []:
+                    report.failures.setdefault((ns, lang), set()).update(keys)
+                continue
+            lang, pivot = str(part["lang"]), str(part["pivot"])
+            for ns in part.get("namespaces") or []:
+                other = owners.setdefault((lang, ns), shard)
+                if other != shard:
+                    report.errors.append(f"Job {ns}/{lang} von Shard {other} und {shard} bearbeitet")
+            bucket = values.setdefault((lang, pivot), {})
+            for key, digest in (part.get("entries") or {}).items():
+                prev = bucket.setdefault(key, (digest, shard))
+                if prev[0] != digest:
+                    report.errors.append(f"{lang}_from_{pivot}: {key} hat in Shard {prev[1]} und {shard} verschiedene Hashes")
+    if len(plans) > 1:
+        report.errors.append("Teil-Manifeste aus verschiedenen Plänen (unterschiedlicher Stand oder N): " + ", ".join(sorted(p for p, _ in plans)))
+    if plans:
+        count = max(n for _, n in plans)
+        missing = sorted(set(range(1, count + 1)) - seen)
+        if missing:
+            report.errors.append(f"Shard(s) nicht (vollständig) gelaufen: {', '.join(f'{i}/{count}' for i in missing)}")
+        report.shards = count
+    report.manifests = {k: {key: v[0] for key, v in bucket.items()} for k, bucket in values.items()}
+    return report
+
+
+def merge_partials(hash_dir: str, keep: bool = False) -> MergeReport:
+    """Uebernimmt die Teil-Manifeste in die kanonischen Manifeste (nur ohne Fehler)."""
+    report = collect_partials(hash_dir)
+    if report.errors:
+        return report
+    for (lang, pivot), entries in sorted(report.manifests.items()):
+        manifest = i18n_core.load_manifest(hash_dir, lang, pivot)
+        manifest.update(entries)
+        i18n_core.save_manifest(hash_dir, lang, pivot, manifest)
+    record_failures(hash_dir, report.failures)
+    write_checkpoint(hash_dir, report.deferred, report.stop_reason, report.deferred_chars)
+    if not keep:
+        shutil.rmtree(os.path.join(hash_dir, SHARDS_DIR))
+    return report
+
+
+def main(argv: List[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Teil-Manifeste aus --shard-Läufen zusammenführen.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    merge = sub.add_parser("merge", help="shards/*/ in die kanonischen .i18n_hash-Manifeste übernehmen")
+    merge.add_argument("--base-path", default=i18n_core.BASE_PATH, help="Pfad zum Verzeichnis mit Sprachdateien")
+    merge.add_argument("--keep", action="store_true", help="shards/-Verzeichnis nach dem Zusammenführen behalten")
+    args = parser.parse_args(argv)
+
+    hash_dir = os.path.join(args.base_path, ".i18n_hash")
+    report = merge_partials(hash_dir, keep=args.keep)
+    if report.errors:
+        for err in report.errors:
+            print(f"❌ {err}")
+        print("Nichts geschrieben.")
+        return 1
+    total = sum(len(v) for v in report.manifests.values())
+    print(f"✅ {report.shards} Shard(s) zusammengeführt: {total} Manifest-Einträge in {len(report.manifests)} Manifest(en)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
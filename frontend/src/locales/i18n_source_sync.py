@@ -0,0 +1,295 @@
+"""
+Inkrementelle Quell-Synchronisation: Lern-Daten unter data/learn -> DE-Namespaces.
+
+Bisher lud der Learn-Sync-Block in main() bei JEDEM Lauf data/learn/lessons.json,
+kopierte de/learn.json komplett (json.loads(json.dumps(...))) und verglich zwei
+vollstaendige sort_keys-Dumps, nur um zu entscheiden, ob geschrieben wird. Die
+Geschwister-Datensaetze data/learn/quiz/*.json und data/learn/scam-scenarios/
+scenarios.js hatten gar keinen Abgleich - ein dort neu referenzierter Key ohne DE-Text
+fiel erst in der Oberflaeche auf.
+
+Jede Datenquelle ist jetzt ein SourceSpec mit ihrer Abbildung auf einen DE-Namespace:
+
+    texts  extract() liefert {key-pfad (Tupel): DE-Text}; fehlende Keys werden in den
+           Namespace uebernommen, abweichende vorhandene Werte NICHT ueberschrieben
+           (wie bisher deep_merge_missing: de/<ns>.json ist die gepflegte Quelle).
+    refs   extract() liefert die referenzierten Keys ("ns:key"/"key"); die Daten
+           enthalten selbst keinen Text, geprueft wird nur, ob der DE-Namespace jeden
+           referenzierten Key aufloesen kann (i18next-Regel: auch woertliche
+           Punkt-Keys wie "a.fb" neben "a").
+
+Pro Quelle wird ein Fingerabdruck (sha256 ueber Quelldateien + DE-Zieldatei) in
+.i18n_hash/source_sync.json abgelegt; ist beides unveraendert, wird die Quelle weder
+geparst noch abgeglichen. Uebernommene Keys werden einzeln eingefuegt - kopiert werden
+nur die Dicts auf dem Pfad zum neuen Key (die geladenen Dokumente gehoeren dem
+DocumentCache und duerfen nicht veraendert werden). Die so neu angelegten Pfade gehen
+als Arbeitsmenge direkt an den Uebersetzungslauf (auch bei --since/--force-key, wo die
+Manifest-Drift-Erkennung sonst nicht greift).
+"""
+import glob
+import hashlib
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+import i18n_json
+
+SYNC_STATE_FILE = "source_sync.json"
+# Erhoehen, wenn sich eine Abbildung aendert - alle Fingerabdruecke werden dann ungueltig.
+STATE_VERSION = 1
+
+KeyPath = Tuple[str, ...]
+
+
+class SourceSpec:
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        namespace: str,
+        kind: str,
+        extract: Callable[[List[Tuple[str, bytes]]], Any],
+    ) -> None:
+        if kind not in ("texts", "refs"):
+            raise ValueError(f"unbekannte Quellart: {kind}")
+        self.name = name
+        self.pattern = pattern  # relativ zu base_path, glob erlaubt
+        self.namespace = namespace
+        self.kind = kind
+        self.extract = extract
+
+    def files(self, base_path: str) -> List[str]:
+        return sorted(glob.glob(os.path.normpath(os.path.join(base_path, self.pattern))))
+
+
+# -------- Abbildungen --------
+
+LESSON_FIELDS = ("title", "goal", "task", "learningOutcome", "reward")
+
+
+def extract_lessons(files: List[Tuple[str, bytes]]) -> Dict[KeyPath, str]:
+    out: Dict[KeyPath, str] = {}
+    for path, raw in files:
+        lessons = i18n_json.loads(raw)
+        if not isinstance(lessons, list):
+            raise ValueError(f"{os.path.basename(path)}: keine gültige Lektionsliste")
+        for lesson in lessons:
+            if not isinstance(lesson, dict):
+                continue
+            lid = lesson.get("id")
+            if not isinstance(lid, str) or not lid:
+                continue
+            for field in LESSON_FIELDS:
+                out[(lid, field)] = lesson.get(field, "")
+    return out
+
+
+def extract_quiz_refs(files: List[Tuple[str, bytes]]) -> Set[str]:
+    """Alle Werte von *Key-Feldern (titleKey, questionKey, textKey, feedbackKey, ...)."""
+    refs: Set[str] = set()
+
+    def walk(node: Any, field: str) -> None:
+        if isinstance(node, dict):
+            for k, v in node.items():
+                walk(v, k)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v, field)
+        elif isinstance(node, str) and field.endswith("Key"):
+            refs.add(node)
+
+    for _, raw in files:
+        walk(i18n_json.loads(raw), "")
+    return refs
+
+
+SCENARIO_KEY_RE = re.compile(r"""['"](scenarios\.[A-Za-z0-9_.-]+)['"]""")
+
+
+def extract_scenario_refs(files: List[Tuple[str, bytes]]) -> Set[str]:
+    """scenarios.js ist ein ES-Modul - statt eines JS-Parsers genuegen die
+    String-Literale "scenarios.*" (i18nKey, nameKey, redFlags, ...)."""
+    refs: Set[str] = set()
+    for _, raw in files:
+        refs.update(SCENARIO_KEY_RE.findall(raw.decode("utf-8")))
+    return refs
+
+
+SOURCES: Tuple[SourceSpec, ...] = (
+    SourceSpec("lessons", os.path.join("..", "data", "learn", "lessons.json"), "learn", "texts", extract_lessons),
+    SourceSpec("quiz", os.path.join("..", "data", "learn", "quiz", "*.json"), "quiz", "refs", extract_quiz_refs),
+    SourceSpec("scam-scenarios", os.path.join("..", "data", "learn", "scam-scenarios", "scenarios.js"), "scamSimulator", "refs", extract_scenario_refs),
+)
+
+
+# -------- Abgleich --------
+
+def resolves(doc: Any, key: str) -> bool:
+    """True, wenn key in doc existiert - verschachtelt oder ueber woertliche Punkt-Keys
+    (i18next probiert beides, z.B. "l1.q1.a.fb" -> l1 -> q1 -> "a.fb"). Auch ein Teilbaum
+    zaehlt: Szenarien referenzieren mit i18nKey einen Basis-Schluessel."""
+    if not isinstance(doc, dict):
+        return False
+    if key in doc:
+        return True
+    parts = key.split(".")
+    for i in range(1, len(parts)):
+        head = ".".join(parts[:i])
+        if head in doc and resolves(doc[head], ".".join(parts[i:])):
+            return True
+    return False
+
+
+def insert_missing(doc: Dict[str, Any], texts: Dict[KeyPath, str]) -> Tuple[Dict[str, Any], Set[str], List[str]]:
+    """(neues Dokument, neu angelegte Pfade, abweichende vorhandene Pfade). doc selbst
+    bleibt unveraendert; kopiert werden nur die Dicts entlang neuer Pfade."""
+    result = doc
+    copied: Set[KeyPath] = set()
+    added: Set[str] = set()
+    diffs: List[str] = []
+    for path, text in texts.items():
+        node: Any = result
+        for part in path[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                break
+            node = child
+        else:
+            leaf = node.get(path[-1])
+            if leaf is not None:
+                if leaf != text:
+                    diffs.append(".".join(path))
+                continue
+        # Pfad (ab der ersten fehlenden Ebene) anlegen; Elternknoten vorher kopieren.
+        if () not in copied:
+            result = dict(result)
+            copied.add(())
+        node = result
+        for depth, part in enumerate(path[:-1]):
+            prefix = path[:depth + 1]
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {}
+            elif prefix not in copied:
+                child = dict(child)
+            copied.add(prefix)
+            node[part] = child
+            node = child
+        node[path[-1]] = text
+        added.add(".".join(path))
+    return result, added, diffs
+
+
+def _fingerprint(files: Iterable[Tuple[str, bytes]], target_raw: bytes | None, base_path: str) -> str:
+    h = hashlib.sha256(f"v{STATE_VERSION}".encode())
+    for path, raw in files:
+        h.update(os.path.relpath(path, base_path).encode("utf-8") + b"\0")
+        h.update(hashlib.sha256(raw).digest())
+    h.update(b"\0target\0" + (hashlib.sha256(target_raw).digest() if target_raw is not None else b"-"))
+    return h.hexdigest()
+
+
+def _read(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+class SyncReport:
+    def __init__(self) -> None:
+        self.added: Dict[str, Set[str]] = {}     # Namespace -> neu angelegte relative Keys
+        self.diffs: Dict[str, List[str]] = {}     # Quelle -> abweichende DE-Werte (nicht ueberschrieben)
+        self.dangling: Dict[str, List[str]] = {}  # Quelle -> referenzierte Keys ohne DE-Text
+        self.skipped: List[str] = []             # unveraendert (Fingerabdruck)
+        self.errors: Dict[str, str] = {}
+
+
+def sync_sources(
+    de_ns_dir: str,
+    hash_dir: str,
+    save: Callable[[str, Dict[str, Any]], Any],
+    sources: Iterable[SourceSpec] = SOURCES,
+    include: Callable[[str], bool] | None = None,
+) -> SyncReport:
+    """Gleicht alle sources gegen de_ns_dir ab (siehe Modul-Docstring); Quellpfade sind
+    relativ zum Elternverzeichnis von de_ns_dir (base_path). save(path, doc) schreibt
+    einen geaenderten DE-Namespace.
+
+    Der Zustand je Quelle merkt sich neben dem Fingerabdruck auch die zuletzt gefundenen
+    Abweichungen/offenen Referenzen, damit eine uebersprungene Quelle sie weiter meldet.
+    include(namespace) = False (--namespace) laesst eine Quelle komplett aus - weder
+    gelesen noch gemeldet, ihr gespeicherter Zustand bleibt unveraendert."""
+    base_path = os.path.dirname(os.path.abspath(de_ns_dir))
+    report = SyncReport()
+    state_path = os.path.join(hash_dir, SYNC_STATE_FILE)
+    state: Dict[str, Dict[str, Any]] = {}
+    raw_state = _read(state_path)
+    if raw_state is not None:
+        try:
+            loaded = i18n_json.loads(raw_state)
+        except ValueError:
+            loaded = None
+        if isinstance(loaded, dict) and loaded.get("version") == STATE_VERSION:
+            state = dict(loaded.get("sources") or {})
+    next_state: Dict[str, Dict[str, Any]] = {}
+
+    for spec in sources:
+        if include is not None and not include(spec.namespace):
+            if spec.name in state:
+                next_state[spec.name] = state[spec.name]
+            continue
+        paths = spec.files(base_path)
+        if not paths:
+            continue
+        target_path = os.path.join(de_ns_dir, f"{spec.namespace}.json")
+        files = [(p, _read(p) or b"") for p in paths]
+        target_raw = _read(target_path)
+        fp = _fingerprint(files, target_raw, base_path)
+        previous = state.get(spec.name) or {}
+        if previous.get("fingerprint") == fp:
+            next_state[spec.name] = previous
+            report.skipped.append(spec.name)
+            if previous.get("diffs"):
+                report.diffs[spec.name] = list(previous["diffs"])
+            if previous.get("dangling"):
+                report.dangling[spec.name] = list(previous["dangling"])
+            continue
+        try:
+            extracted = spec.extract(files)
+            target = i18n_json.load_file(target_path) if target_raw is not None else {}
+        except (ValueError, UnicodeDecodeError) as e:
+            report.errors[spec.name] = str(e)
+            continue
+        if not isinstance(target, dict):
+            report.errors[spec.name] = f"{spec.namespace}.json ist kein JSON-Objekt"
+            continue
+
+        entry: Dict[str, Any] = {}
+        if spec.kind == "texts":
+            merged, added, diffs = insert_missing(target, extracted)
+            if added:
+                os.makedirs(de_ns_dir, exist_ok=True)
+                save(target_path, merged)
+                report.added.setdefault(spec.namespace, set()).update(added)
+                target_raw = _read(target_path)
+            if diffs:
+                entry["diffs"] = report.diffs[spec.name] = sorted(diffs)
+        else:
+            dangling = []
+            for ref in sorted(extracted):
+                ns, _, key = ref.rpartition(":")
+                if ns and ns != spec.namespace:
+                    continue
+                if not resolves(target, key):
+                    dangling.append(key)
+            if dangling:
+                entry["dangling"] = report.dangling[spec.name] = dangling
+        entry["fingerprint"] = _fingerprint(files, target_raw, base_path)
+        next_state[spec.name] = entry
+
+    if next_state != state or (raw_state is None and next_state):
+        os.makedirs(hash_dir, exist_ok=True)
+        i18n_json.write_json_if_changed(state_path, {"version": STATE_VERSION, "sources": dict(sorted(next_state.items()))})
+    return report
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Offline-Status der Uebersetzungen: Matrix Namespace x Sprache ohne Provider und API-Key.
+
+Ob die Uebersetzungen aktuell sind, liess sich bisher nur per Uebersetzungslauf
+(braucht --provider und einen Key) oder ueber i18n_changes_report.json der JS-Tools
+herausfinden. status liest nur Quell-, Zieldateien und Manifeste und zaehlt je
+(Namespace, Sprache) - Quelle ist fuer en die DE-Datei, fuer alle anderen der EN-Pivot,
+genau wie im Uebersetzungslauf:
+
+    fehlend      Quell-Key fehlt in der Zieldatei - auch Pluralformen, die die
+                 Zielsprache zusaetzlich braucht (ru _few/_many, siehe i18n_plural.py)
+    veraltet     Key vorhanden, Manifest-Hash != sha256(Quelltext) (Quelle geaendert,
+                 letzter Versuch gescheitert oder zurueckgestellt, Hand-Edit)
+    ueberzaehlig Key nur in der Zieldatei (ohne zusaetzliche Pluralformen einer
+                 Quell-Familie wie ru _few/_many) - Kandidaten fuer --prune-extra
+    gescheitert  fehlende/veraltete Keys, deren Uebersetzung im letzten Lauf scheiterte
+                 (.i18n_hash/failed.json, vom Uebersetzungslauf je bearbeitetem Job
+                 geschrieben)
+
+Exit-Code 1, sobald irgendetwas fehlt oder veraltet ist - als Pre-Commit-Hook oder
+CI-Schritt geeignet. Importiert nur i18n_core/i18n_json (kein argparse beim Import,
+keine Provider-Logik); jede Datei wird einmal geparst, jeder Quelltext einmal gehasht.
+
+Aufruf: python3 i18n_status.py [--base-path P] [--namespace GLOB] [--lang GLOB] [--json PFAD|-]
+"""
+import hashlib
+import os
+import sys
+from typing import Any, Dict, List, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_core  # noqa: E402
+import i18n_json  # noqa: E402
+from i18n_plural import PLURAL_KEY_RE, plural_families, target_categories  # noqa: E402
+
+FAILED_FILE = "failed.json"
+COLUMNS = ("missing", "stale", "extra", "failed")
+# Kurzzeichen fuer die Matrix: Fehlend, Veraltet, Ueberzaehlig, Gescheitert.
+LABELS = {"missing": "F", "stale": "V", "extra": "Ü", "failed": "G"}
+
+
+# -------- Gescheiterte Keys des letzten Laufs --------
+
+def load_failures(hash_dir: str) -> Dict[str, Dict[str, Set[str]]]:
+    """{Sprache: {Namespace: {relative Keys}}} aus failed.json."""
+    try:
+        with open(os.path.join(hash_dir, FAILED_FILE), "rb") as f:
+            data = i18n_json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    failed = data.get("failed") if isinstance(data, dict) else None
+    if not isinstance(failed, dict):
+        return {}
+    return {
+        lang: {ns: set(keys) for ns, keys in by_ns.items() if isinstance(keys, list)}
+        for lang, by_ns in failed.items() if isinstance(by_ns, dict)
+    }
+
+
+def record_failures(hash_dir: str, jobs: Dict[Tuple[str, str], Set[str]]) -> None:
+    """Ersetzt die Eintraege der bearbeiteten Jobs (Namespace, Sprache) in failed.json;
+    Jobs dieses Laufs ohne Fehlschlag werden entfernt, andere bleiben stehen."""
+    if not jobs:
+        return
+    failures = load_failures(hash_dir)
+    for (ns, lang), keys in jobs.items():
+        by_ns = failures.setdefault(lang, {})
+        if keys:
+            by_ns[ns] = set(keys)
+        else:
+            by_ns.pop(ns, None)
+    data = {
+        lang: {ns: sorted(keys) for ns, keys in sorted(by_ns.items())}
+        for lang, by_ns in sorted(failures.items()) if by_ns
+    }
+    path = os.path.join(hash_dir, FAILED_FILE)
+    if not data:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    os.makedirs(hash_dir, exist_ok=True)
+    i18n_json.write_json_if_changed(path, {"version": 1, "failed": data})
+
+
+# -------- Status --------
+
+def _flatten_into(out: Dict[str, Any], d: Dict[str, Any], prefix: str) -> None:
+    # Wie i18n_core._flatten_dict, aber ohne Zwischen-Dicts je Ebene (ueber 350 Dateien
+    # der groesste Einzelposten).
+    for k, v in d.items():
+        p = prefix + k
+        if isinstance(v, dict):
+            _flatten_into(out, v, p + ".")
+        else:
+            out[p] = v
+
+
+def _load_flat(path: str) -> Dict[str, Any] | None:
+    try:
+        data = i18n_json.load_file(path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    out: Dict[str, Any] = {}
+    _flatten_into(out, data, "")
+    return out
+
+
+def _load_manifest(hash_dir: str, lang: str, pivot: str) -> Dict[str, Any]:
+    # Nur gelesen und per != verglichen - die str()-Normalisierung von
+    # i18n_core.load_manifest ist hier ueberfluessig.
+    try:
+        data = i18n_json.load_file(i18n_core.manifest_path(hash_dir, lang, pivot))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _extra_keys(source: Dict[str, Any], target: Dict[str, Any]) -> List[str]:
+    extra = []
+    for key in target:
+        if key in source:
+            continue
+        m = PLURAL_KEY_RE.match(key)
+        if m and f"{m.group(1)}_other" in source:
+            continue
+        extra.append(key)
+    return extra
+
+
+def _missing_keys(source: Dict[str, Any], target: Dict[str, Any], families: Dict[str, Dict[str, str]], lang: str) -> List[str]:
+    missing = [k for k in source if k not in target]
+    # Formen, die lang braucht, die Quelle aber nicht hat (wie im Uebersetzungslauf).
+    for stem, members in families.items():
+        for cat in target_categories(lang, members):
+            key = f"{stem}_{cat}"
+            if key not in source and key not in target:
+                missing.append(key)
+    return missing
+
+
+def compute_status(base_path: str, ns_globs: List[str] = (), lang_globs: List[str] = ()) -> Dict[str, Any]:
+    """Status-Dokument (siehe Modul-Docstring); cells[ns][lang][spalte] = sortierte Keys."""
+    hash_dir = os.path.join(base_path, ".i18n_hash")
+    de_dir = os.path.join(base_path, i18n_core.BASE_LANG)
+    namespaces = sorted(
+        f[:-5] for f in os.listdir(de_dir)
+        if f.endswith(".json") and i18n_core.matches_globs(f[:-5], ns_globs)
+    )
+    langs = [lang for lang in i18n_core.TARGET_LANGS if i18n_core.matches_globs(lang, lang_globs)]
+    manifests = {lang: _load_manifest(hash_dir, lang, "de" if lang == "en" else "en") for lang in langs}
+    failures = load_failures(hash_dir)
+    digests: Dict[str, str] = {}
+
+    def digest(text: str) -> str:
+        d = digests.get(text)
+        if d is None:
+            d = digests[text] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return d
+
+    cells: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+    for ns in namespaces:
+        de_flat = _load_flat(os.path.join(de_dir, f"{ns}.json")) or {}
+        en_flat = _load_flat(os.path.join(base_path, "en", f"{ns}.json")) or {}
+        # (relativer Key, Manifest-Key, erwarteter Hash) je Quelle - einmal je Namespace
+        # statt je Sprache; die 7 Pivot-Sprachen teilen sich die EN-Liste.
+        expected = {
+            "de": [(k, f"{ns}.{k}", digest(str(v))) for k, v in de_flat.items()] if "en" in langs else [],
+            "en": [(k, f"{ns}.{k}", digest(str(v))) for k, v in en_flat.items()],
+        }
+        families = {
+            "de": plural_families(de_flat) if "en" in langs else {},
+            "en": plural_families(en_flat),
+        }
+        row = cells[ns] = {}
+        for lang in langs:
+            source = de_flat if lang == "en" else en_flat
+            target = en_flat if lang == "en" else (_load_flat(os.path.join(base_path, lang, f"{ns}.json")) or {})
+            manifest = manifests[lang]
+            missing = _missing_keys(source, target, families["de" if lang == "en" else "en"], lang)
+            stale = [k for k, mk, h in expected["de" if lang == "en" else "en"] if k in target and manifest.get(mk) != h]
+            # Inzwischen erledigte Fehlschläge (Hand-Edit, sync_i18n_hashes.py) zählen nicht.
+            failed = failures.get(lang, {}).get(ns, set()) & (set(missing) | set(stale))
+            row[lang] = {
+                "missing": sorted(missing),
+                "stale": sorted(stale),
+                "extra": sorted(_extra_keys(source, target)),
+                "failed": sorted(failed),
+            }
+    totals = {lang: {c: sum(len(cells[ns][lang][c]) for ns in namespaces) for c in COLUMNS} for lang in langs}
+    return {
+        "langs": langs,
+        "namespaces": namespaces,
+        "cells": cells,
+        "totals": totals,
+        "outdated": any(t["missing"] or t["stale"] for t in totals.values()),
+    }
+
+
+def _cell(counts: Dict[str, int]) -> str:
+    parts = [f"{LABELS[c]}{counts[c]}" for c in COLUMNS if counts[c]]
+    return " ".join(parts) if parts else "✓"
+
+
+def render_matrix(status: Dict[str, Any]) -> str:
+    """Nur Namespaces mit Befund als Zeile, dazu Summen je Sprache."""
+    langs = status["langs"]
+    rows = []
+    for ns in status["namespaces"]:
+        counts = {lang: {c: len(status["cells"][ns][lang][c]) for c in COLUMNS} for lang in langs}
+        if any(any(v.values()) for v in counts.values()):
+            rows.append([ns] + [_cell(counts[lang]) for lang in langs])
+    clean = len(status["namespaces"]) - len(rows)
+    rows.append(["Summe"] + [_cell(status["totals"][lang]) for lang in langs])
+    header = ["Namespace"] + langs
+    widths = [max(len(r[i]) for r in rows + [header]) for i in range(len(header))]
+    fmt = lambda r: "  ".join(v.ljust(w) for v, w in zip(r, widths)).rstrip()  # noqa: E731
+    lines = [fmt(header), fmt(["-" * w for w in widths])] + [fmt(r) for r in rows]
+    lines.append(f"({clean} Namespace(s) ohne Befund; F=fehlend V=veraltet Ü=überzählig G=gescheitert)")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Übersetzungsstatus je Namespace und Sprache (offline, ohne Provider).")
+    parser.add_argument("--base-path", default=i18n_core.BASE_PATH, help="Pfad zum Verzeichnis mit Sprachdateien")
+    parser.add_argument("--namespace", dest="namespaces", metavar="GLOB", action="append", help="Nur passende Namespaces (wie beim Übersetzungslauf)")
+    parser.add_argument("--lang", dest="langs", metavar="GLOB", action="append", help="Nur passende Zielsprachen")
+    parser.add_argument("--json", metavar="PFAD", help="Status als JSON nach PFAD; '-' = stdout statt der Matrix")
+    args = parser.parse_args(argv)
+
+    status = compute_status(args.base_path, i18n_core.split_globs(args.namespaces), i18n_core.split_globs(args.langs))
+    if args.json == "-":
+        sys.stdout.write(i18n_json.dumps(status).decode("utf-8") + "\n")
+    else:
+        if args.json:
+            i18n_json.write_bytes_if_changed(args.json, i18n_json.dumps(status))
+        print(render_matrix(status))
+        print("❌ Übersetzungen nicht aktuell." if status["outdated"] else "✅ Alle Übersetzungen aktuell.")
+    return 1 if status["outdated"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
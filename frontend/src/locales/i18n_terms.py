@@ -0,0 +1,163 @@
+"""
+Glossar-gesteuerter Begriffsschutz: Fachbegriffe (Stellar, XLM, Trustline, Multisig,
+Memo-Typen, ...) werden vor der Uebersetzung maskiert und danach wiederhergestellt.
+
+Bisher gab es nur KEEP_EN_RE (englische Begriffe IN Klammern) plus Heuristiken - ein
+"Stellar" oder "MEMO_RETURN" im Fliesstext war ungeschuetzt. Die Begriffsliste kommt aus
+
+- i18n_terms.json ("terms": feste Liste, "exclude": nie schuetzen) und
+- optional ("fromGlossary": true) aus <lang>/glossary.json: jeder Eintrag, dessen
+  "original" in ALLEN vorhandenen Sprachen unveraendert als "title" steht - das Projekt
+  uebersetzt diesen Begriff offensichtlich nirgends (z.B. XLM, Friendbot, Airdrop).
+
+TermMatcher baut daraus einen Aho-Corasick-Automaten: jeder Text wird in EINEM linearen
+Durchlauf nach allen Begriffen gleichzeitig durchsucht, statt eine Regex je Begriff
+anzuwenden (hunderte Begriffe x tausende Texte). Treffer zaehlen nur als ganze Woerter
+(kein Wortzeichen davor/dahinter, Gross-/Kleinschreibung exakt); bei Ueberlappungen
+gewinnt der am weitesten links beginnende, dann der laengste Begriff.
+
+Maskiert wird mit denselben __KEEP_EN_TERM_n__-Platzhaltern wie bei den
+Klammer-Begriffen (Nummerierung wird fortgesetzt), restore_parenthesized_english()
+stellt beide Sorten zurueck.
+
+TERMS (modulweite Instanz) wird von _run() pro Lauf aus base_path konfiguriert.
+"""
+import os
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+import i18n_json
+
+TERMS_FILE = "i18n_terms.json"
+GLOSSARY_NS = "glossary"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class TermMatcher:
+    def __init__(self, terms: Iterable[str] = ()) -> None:
+        self.configure(terms)
+
+    def configure(self, terms: Iterable[str]) -> None:
+        """Baut den Automaten fuer terms neu auf (leere/doppelte Eintraege werden ignoriert)."""
+        self.terms = sorted({t for t in terms if isinstance(t, str) and t.strip()})
+        # Zustand 0 = Wurzel. goto[s][ch] -> Folgezustand, fail[s] -> laengstes echtes
+        # Suffix, das ebenfalls Praefix eines Begriffs ist, out[s] -> Laengen aller
+        # Begriffe, die in s enden (inkl. ueber fail erreichbarer).
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+        for term in self.terms:
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = (len(term),)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._first_chars = frozenset(goto[0])
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """Nicht-ueberlappende (start, end)-Spannen aller Begriffe als ganze Woerter."""
+        if not self.terms or not text:
+            return []
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: List[Tuple[int, int]] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length in out[state]:
+                start = i + 1 - length
+                if (start == 0 or not _is_word_char(text[start - 1])) and (i + 1 == len(text) or not _is_word_char(text[i + 1])):
+                    hits.append((start, i + 1))
+        if len(hits) <= 1:
+            return hits
+        hits.sort(key=lambda h: (h[0], -h[1]))
+        chosen: List[Tuple[int, int]] = []
+        for start, end in hits:
+            if not chosen or start >= chosen[-1][1]:
+                chosen.append((start, end))
+        return chosen
+
+    def mask(self, text: str, placeholders: Dict[str, str]) -> str:
+        """Ersetzt alle Begriffe in text durch __KEEP_EN_TERM_n__ und traegt sie in
+        placeholders ein (n setzt die vorhandene Nummerierung fort)."""
+        if not self.terms or not isinstance(text, str) or self._first_chars.isdisjoint(text):
+            return text
+        spans = self.find(text)
+        if not spans:
+            return text
+        parts: List[str] = []
+        pos = 0
+        for start, end in spans:
+            placeholder = f"__KEEP_EN_TERM_{len(placeholders) + 1}__"
+            placeholders[placeholder] = text[start:end]
+            parts.append(text[pos:start])
+            parts.append(placeholder)
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
+
+
+def _glossary_terms(base_path: str) -> List[str]:
+    langs = sorted(
+        d for d in os.listdir(base_path)
+        if os.path.isfile(os.path.join(base_path, d, f"{GLOSSARY_NS}.json"))
+    ) if os.path.isdir(base_path) else []
+    docs = []
+    for lang in langs:
+        try:
+            data = i18n_json.load_file(os.path.join(base_path, lang, f"{GLOSSARY_NS}.json"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict):
+            docs.append(data)
+    if not docs:
+        return []
+    terms: List[str] = []
+    for key, entry in docs[0].items():
+        if not isinstance(entry, dict) or not isinstance(entry.get("original"), str):
+            continue
+        original = entry["original"]
+        if all(isinstance(d.get(key), dict) and d[key].get("title") == original for d in docs):
+            terms.append(original)
+    return terms
+
+
+def load_term_list(base_path: str) -> List[str]:
+    """Begriffsliste fuer base_path (siehe Modul-Docstring); leer ohne i18n_terms.json."""
+    try:
+        with open(os.path.join(base_path, TERMS_FILE), "rb") as f:
+            config = i18n_json.loads(f.read())
+    except FileNotFoundError:
+        return []
+    if not isinstance(config, dict):
+        raise ValueError(f"{TERMS_FILE}: erwartet ein JSON-Objekt")
+    terms = [t for t in config.get("terms") or [] if isinstance(t, str)]
+    if config.get("fromGlossary"):
+        terms.extend(_glossary_terms(base_path))
+    exclude = set(config.get("exclude") or [])
+    return sorted({t for t in terms if t not in exclude})
+
+
+TERMS = TermMatcher()
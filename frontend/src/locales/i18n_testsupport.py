@@ -0,0 +1,95 @@
+"""
+Gemeinsames Test-Geruest fuer komplette Laeufe von UpdateSprachdateienBasierendAufDE.main()
+(keine Tests - liegt ohne test_-Praefix neben ihnen, damit unittest/pytest es nicht sammeln).
+
+Jede test_i18n_*.py mit Main-Tests hatte bisher ihre eigene Kopie: DEEPL_API_KEY setzen,
+TemporaryDirectory, de/<ns>.json schreiben, Fake fuer translate_text_deepl, dazu die
+drei mock.patch (translate_text_deepl, HASH_DIR, sys.argv) und redirect_stdout. Die Tests
+behalten nur ihre Fixture-Daten und Pruefungen:
+
+    class MainXTests(MainRunMixin, unittest.TestCase):
+        def setUp(self):
+            super().setUp()
+            self.write_de({"a": "Wert A"})
+
+        def test_x(self):
+            out = self.run_main("--full")
+            self.assertEqual(self.read_lang("fr"), {"a": "[fr] [en] Wert A"})
+
+Fake-Provider: translate(text, target_lang) liefert "[ziel] text" (ueberschreibbar, auch
+per Instanz-Attribut; None = Provider-Fehler, Ausnahmen gehen durch). Jeder Aufruf ohne
+Ausnahme landet als (Ziel, Text) in self.calls.
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import ExitStack, redirect_stdout
+from typing import Any, Iterable, List, Tuple
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+
+SCRIPT = "UpdateSprachdateienBasierendAufDE.py"
+
+
+def write_json(path: str, data: Any) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+class MainRunMixin:
+    """Mixin fuer unittest.TestCase (vor TestCase erben): temporaeres self.root =
+    self.base_path, DEEPL_API_KEY fuer die Dauer des Tests, run_main() mit Fake-Provider."""
+
+    namespace = "ns"
+
+    def setUp(self) -> None:
+        super().setUp()
+        os.environ["DEEPL_API_KEY"] = "test-key-not-used"
+        self.addCleanup(lambda: os.environ.pop("DEEPL_API_KEY", None))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = self.base_path = tmp.name
+        self.calls: List[Tuple[str, str]] = []
+
+    @property
+    def hash_dir(self) -> str:
+        return os.path.join(self.base_path, ".i18n_hash")
+
+    def translate(self, text: str, target_lang: str) -> str | None:
+        return f"[{target_lang}] {text}"
+
+    def write_de(self, data: Any, ns: str | None = None) -> None:
+        write_json(os.path.join(self.base_path, "de", f"{ns or self.namespace}.json"), data)
+
+    def read_lang(self, lang: str, ns: str | None = None) -> Any:
+        with open(os.path.join(self.base_path, lang, f"{ns or self.namespace}.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def run_main(self, *extra: str, base_path: str | None = None, patches: Iterable[Any] = (), fake_provider: bool = True) -> str:
+        """usd.main() mit --provider deepl --progress off und extra; gibt stdout zurueck.
+        patches: weitere mock.patch-Kontexte. fake_provider=False laesst
+        translate_text_deepl echt (z.B. fuer Tests auf urlopen-Ebene)."""
+        base_path = base_path or self.base_path
+
+        def fake_translate_text_deepl(text, target_lang, api_key, api_url=None):
+            result = self.translate(text, target_lang)
+            self.calls.append((target_lang, text))
+            return result
+
+        argv = [SCRIPT, "--provider", "deepl", "--base-path", base_path, "--progress", "off", *extra]
+        out = io.StringIO()
+        with ExitStack() as stack:
+            if fake_provider:
+                stack.enter_context(mock.patch.object(usd, "translate_text_deepl", side_effect=fake_translate_text_deepl))
+            stack.enter_context(mock.patch.object(usd, "HASH_DIR", os.path.join(base_path, ".i18n_hash")))
+            stack.enter_context(mock.patch.object(sys, "argv", argv))
+            for patch in patches:
+                stack.enter_context(patch)
+            stack.enter_context(redirect_stdout(out))
+            usd.main()
+        return out.getvalue()
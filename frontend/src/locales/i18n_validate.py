@@ -0,0 +1,125 @@
+"""
+Strukturelle Pruefung einer Uebersetzung gegen ihren Quelltext (Validierungs-Stufe).
+
+Bisher prueften nur _preserve_special_chars (Sonderzeichen) und
+_looks_like_untranslated_echo (Echo) das Provider-Ergebnis. i18next-Syntax wurde nie
+geprueft - ein kaputter Platzhalter fiel erst zur Laufzeit auf und kostete einen
+weiteren kompletten Uebersetzungszyklus. Konkret im Bestand gefunden: DeepL hat
+Variablennamen mituebersetzt ("{{address}}" -> fr "{{adresse}}", "{{time}}" -> ru "{{время}}"), die
+Oberflaeche zeigt dann den rohen Platzhalter statt des Werts.
+
+Ein vorkompilierter Regex (TOKEN_RE) zerlegt einen Text in EINEM Durchlauf in seine
+strukturellen Tokens; verglichen werden die Multimengen je Art:
+
+    interpolation   {{var}} / {{count, number}} (Leerraum im Innern wird normalisiert)
+    tags            <0>...</0>, <1/>, <strong> (Trans-Komponenten)
+    nesting         $t(key) / $t(key, {...})
+    keep_placeholder  __KEEP_EN_TERM_n__ nach dem Zuruecksetzen (Platzhalter verloren/
+                    vom Provider verstuemmelt)
+
+dazu length_ratio: Laenge Uebersetzung/Quelle ausserhalb LENGTH_RATIO_BOUNDS (erst ab
+LENGTH_RATIO_MIN_SOURCE Zeichen - kurze Texte schwanken legitim stark) und plural: die
+Antwort auf eine Pluralfamilie liess sich nicht den Formen zuordnen (i18n_plural.py).
+
+Zusammen mit Sonderzeichen und Echo fuehrt UpdateSprachdateienBasierendAufDE.
+_validate_translation alle Pruefungen je Ergebnis aus; VALIDATION zaehlt die Fehler je
+Pruefung fuer die Abschluss-Zusammenfassung. Ein auffaelliges Laengenverhaeltnis ist nur
+verdaechtig: die Uebersetzung bleibt stehen und bekommt ihren Manifest-Eintrag (sonst
+ginge derselbe Text bei jedem Lauf erneut zum Provider), der Pfad landet ueber
+VALIDATION.flag trotzdem in failed.json.
+"""
+import re
+from collections import Counter
+from typing import Dict, Set, Tuple
+
+# Reihenfolge der Gruppen = Reihenfolge der Token-Arten in TOKEN_KINDS.
+TOKEN_RE = re.compile(
+    r"\{\{\s*([^{}]*?)\s*\}\}"
+    r"|(</?[A-Za-z0-9]+\s*/?>)"
+    r"|(\$t\([^()]*\))"
+    r"|(__KEEP_EN_TERM_\d+__)"
+)
+TOKEN_KINDS = ("interpolation", "tags", "nesting", "keep_placeholder")
+_WS_RE = re.compile(r"\s+")
+
+# Pruefungen in Auswertungsreihenfolge (auch Reihenfolge der Zusammenfassung).
+CHECKS = ("keep_placeholder", "interpolation", "tags", "nesting", "special_chars", "echo", "length_ratio", "plural")
+
+LENGTH_RATIO_BOUNDS = (0.3, 3.5)
+LENGTH_RATIO_MIN_SOURCE = 20
+
+Tokens = Dict[str, Counter]
+
+
+def extract_tokens(text: str) -> Tokens:
+    """Multimenge der strukturellen Tokens je Art (nur Arten mit Treffern)."""
+    found: Tokens = {}
+    for m in TOKEN_RE.finditer(text):
+        idx = m.lastindex or 1
+        kind = TOKEN_KINDS[idx - 1]
+        if idx == 1:
+            token = "{{" + _WS_RE.sub(" ", m.group(1)) + "}}"
+        else:
+            token = _WS_RE.sub("", m.group(idx))
+        found.setdefault(kind, Counter())[token] += 1
+    return found
+
+
+def structural_failure(source_tokens: Tokens, translated: str) -> Tuple[str, str] | None:
+    """(Pruefung, Detail) der ersten verletzten Strukturpruefung oder None."""
+    got = extract_tokens(translated)
+    if "keep_placeholder" in got:
+        return "keep_placeholder", " ".join(sorted(got["keep_placeholder"]))
+    for kind in ("interpolation", "tags", "nesting"):
+        want = source_tokens.get(kind) or Counter()
+        have = got.get(kind) or Counter()
+        if want != have:
+            missing = sorted((want - have).elements())
+            extra = sorted((have - want).elements())
+            detail = " ".join([f"-{t}" for t in missing] + [f"+{t}" for t in extra])
+            return kind, detail
+    return None
+
+
+def length_ratio_failure(source: str, translated: str) -> str | None:
+    """Detail, falls das Laengenverhaeltnis ausserhalb LENGTH_RATIO_BOUNDS liegt."""
+    src_len = len(source.strip())
+    if src_len < LENGTH_RATIO_MIN_SOURCE:
+        return None
+    ratio = len(translated.strip()) / src_len
+    low, high = LENGTH_RATIO_BOUNDS
+    if ratio < low or ratio > high:
+        return f"{ratio:.2f}"
+    return None
+
+
+class ValidationStats:
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.checked = 0
+        self.failures: Dict[str, int] = {check: 0 for check in CHECKS}
+        self.suspicious: Set[str] = set()
+
+    def record(self, check: str | None) -> None:
+        self.checked += 1
+        if check is not None:
+            self.failures[check] += 1
+
+    def flag(self, path: str) -> None:
+        """Uebersetzung bleibt stehen und wird ins Manifest uebernommen, ist aber
+        verdaechtig (length_ratio) - erscheint in failed.json, ohne erneuten Versuch."""
+        self.suspicious.add(path)
+
+    def take_suspicious(self) -> Set[str]:
+        """Verdaechtige Pfade des gerade bearbeiteten Jobs (Namespace, Sprache)."""
+        paths, self.suspicious = self.suspicious, set()
+        return paths
+
+    def summary(self) -> str:
+        parts = ", ".join(f"{check}={n}" for check, n in self.failures.items())
+        return f"{self.checked} geprüft, {sum(self.failures.values())} beanstandet ({parts})"
+
+
+VALIDATION = ValidationStats()
@@ -0,0 +1,86 @@
+"""
+Watch-Modus fuer UpdateSprachdateienBasierendAufDE.py (--watch).
+
+Beim Pflegen von Inhalten lief das Skript bisher nach jeder Aenderung von Hand - jeder
+Lauf zahlte Start, Parsen und Hashen aller Namespaces. Mit --watch bleibt der Prozess
+nach dem ersten Lauf stehen, beobachtet de/*.json und die Lern-Daten (i18n_source_sync.
+SOURCES) und startet nur fuer die betroffenen Namespaces einen inkrementellen Lauf.
+Dokument-Cache und Quelltext-Analyse bleiben dabei im Speicher (beide pruefen per
+os.stat bzw. Quelltext selbst, ob ein Eintrag noch gilt), Manifeste und unveraenderte
+Zieldateien werden also nicht erneut geparst.
+
+Beobachtet wird per Polling (os.stat je Datei, Standard alle 0,5 s): bei den wenigen
+Dutzend Dateien kostet das praktisch nichts, funktioniert auf jedem System und in
+Containern mit gemounteten Verzeichnissen (wo inotify-Ereignisse oft fehlen) und
+braucht keine Zusatzabhaengigkeit. Editoren speichern gern in Schueben (Temp-Datei,
+rename, Formatter); eine Aenderung wird deshalb erst gemeldet, wenn fuer `debounce`
+Sekunden keine weitere hinzukam.
+"""
+import glob
+import os
+import time
+from typing import Callable, Dict, Iterable, Set, Tuple
+
+# (mtime_ns, Groesse) - wie DocumentCache, ohne Inode (rename-Speichern aendert ihn immer).
+Stamp = Tuple[int, int]
+
+
+def watched_files(base_path: str, de_dir: str, sources: Iterable) -> Dict[str, str]:
+    """{absoluter Pfad: Namespace} aller beobachteten Dateien."""
+    files = {os.path.abspath(p): os.path.basename(p)[:-5] for p in glob.glob(os.path.join(de_dir, "*.json"))}
+    for spec in sources:
+        for p in spec.files(base_path):
+            files[os.path.abspath(p)] = spec.namespace
+    return files
+
+
+class PollWatcher:
+    def __init__(
+        self,
+        list_files: Callable[[], Iterable[str]],
+        interval: float = 0.5,
+        debounce: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.list_files = list_files
+        self.interval = interval
+        self.debounce = debounce
+        self.clock = clock
+        self.sleep = sleep
+        self._stamps = self._scan()
+
+    def _scan(self) -> Dict[str, Stamp]:
+        stamps: Dict[str, Stamp] = {}
+        for path in self.list_files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def _diff(self, new: Dict[str, Stamp]) -> Set[str]:
+        old = self._stamps
+        return {p for p in old.keys() | new.keys() if old.get(p) != new.get(p)}
+
+    def rebase(self) -> None:
+        """Aktuellen Stand als gesehen uebernehmen - nach einem Lauf, der selbst
+        beobachtete Dateien geschrieben hat (Quell-Sync ergaenzt de/learn.json)."""
+        self._stamps = self._scan()
+
+    def wait(self) -> Set[str]:
+        """Blockiert bis zur naechsten Aenderung und liefert alle geaenderten, neuen oder
+        geloeschten Pfade, sobald debounce Sekunden Ruhe war."""
+        changed: Set[str] = set()
+        quiet_since = 0.0
+        while True:
+            self.sleep(self.interval)
+            current = self._scan()
+            delta = self._diff(current)
+            self._stamps = current
+            if delta:
+                changed |= delta
+                quiet_since = self.clock()
+            elif changed and self.clock() - quiet_since >= self.debounce:
+                return changed
@@ -10,19 +10,20 @@ UpdateSprachdateienBasierendAufDE.py wuerde beim naechsten Lauf die
 betroffenen Keys faelschlich als "geaendert" erkennen und per API neu
 uebersetzen - und damit bereits korrekte manuelle Uebersetzungen ueberschreiben.
 
-Nutzt _flatten_dict/_sha256/load_json/_save_manifest direkt aus
-UpdateSprachdateienBasierendAufDE.py (Import, kein Copy-Paste), damit die
-Hashes garantiert byte-identisch zu dem sind, was das Original-Skript selbst
-berechnen wuerde.
+Nutzt _flatten_dict/_sha256/load_json/save_manifest direkt aus i18n_core.py
+(Import, kein Copy-Paste) - dieselben Funktionen, die auch
+UpdateSprachdateienBasierendAufDE.py verwendet, damit die Hashes garantiert
+byte-identisch zu dem sind, was das Original-Skript selbst berechnen wuerde.
+Das Uebersetzungsskript selbst wird bewusst NICHT importiert (Startzeit).
 """
 import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+import i18n_core as core  # noqa: E402
 
-BASE_PATH = usd.BASE_PATH
-TARGET_LANGS = usd.TARGET_LANGS
+BASE_PATH = core.BASE_PATH
+TARGET_LANGS = core.TARGET_LANGS
 
 
 def sync_manifest(ns_dir: str, lang: str, pivot: str) -> int:
@@ -31,18 +32,18 @@ def sync_manifest(ns_dir: str, lang: str, pivot: str) -> int:
     ns_files = sorted(f for f in os.listdir(ns_dir) if f.endswith(".json"))
     for ns_file in ns_files:
         ns_name = ns_file[:-5]
-        data = usd.load_json(os.path.join(ns_dir, ns_file))
+        data = core.load_json(os.path.join(ns_dir, ns_file))
         if not isinstance(data, dict):
             continue
-        flat = usd._flatten_dict(data)
+        flat = core._flatten_dict(data)
         for k, v in flat.items():
-            manifest[f"{ns_name}.{k}"] = usd._sha256(str(v))
-    usd._save_manifest(lang, pivot, manifest)
+            manifest[f"{ns_name}.{k}"] = core._sha256(str(v))
+    core.save_manifest(core.DEFAULT_HASH_DIR, lang, pivot, manifest)
     return len(manifest)
 
 
 def main():
-    de_dir = os.path.join(BASE_PATH, usd.BASE_LANG)
+    de_dir = os.path.join(BASE_PATH, core.BASE_LANG)
     en_dir = os.path.join(BASE_PATH, "en")
 
     print("== Sync en_from_de (Pivot: de/*.json) ==")
@@ -57,8 +57,10 @@ Deckt konkret aufgetretene Pipeline-Bugs ab:
 Nur Standardbibliothek (unittest) - kein pytest/Netzwerk noetig.
 Aufruf: python3 -m unittest test_UpdateSprachdateienBasierendAufDE -v
 """
+import io
 import json
 import os
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -283,6 +285,43 @@ class ForceKeyScopingTests(unittest.TestCase):
         en_data = self._load("en")
         self.assertEqual(en_data["b"], "[en] Wert B", "Echte Drift bei 'b' hätte ohne --force-key erkannt werden müssen")
 
+    def test_each_file_is_parsed_at_most_once_per_run(self):
+        # de/testns.json (Kollisionsprüfung + Hauptschleife), en/testns.json (Phase A
+        # schreibt, Phase B liest) und die Manifeste (pro Namespace/Sprache geladen)
+        # werden über den Dokument-Cache je Lauf nur einmal geparst.
+        argv = [
+            "UpdateSprachdateienBasierendAufDE.py",
+            "--provider", "deepl",
+            "--base-path", self.base_path,
+        ]
+        test_hash_dir = os.path.join(self.base_path, ".i18n_hash")
+        with mock.patch.object(usd, "translate_text_deepl", side_effect=lambda text, target_lang, api_key, api_url=None: text + "!"), \
+             mock.patch.object(usd, "HASH_DIR", test_hash_dir), \
+             mock.patch.object(usd.i18n_json, "loads", wraps=usd.i18n_json.loads) as loads, \
+             mock.patch.object(sys, "argv", argv):
+            usd.main()
+        # 1x de + 1x en + 7 Zielsprachen + 8 Manifeste
+        self.assertEqual(loads.call_count, 2 + len(self.langs) + len(usd.TARGET_LANGS))
+
+    def test_source_analysis_runs_once_per_unique_text_not_per_language(self):
+        # Drift-Erkennung und Manifest hashen in Phase B denselben EN-Pivot-Text je
+        # Zielsprache; über SOURCE_ANALYSIS wird jeder eindeutige Text nur einmal gehasht:
+        # "Wert A", "Wert B" (DE) + "Value A (old)", "Wert B!" (EN-Pivot).
+        argv = [
+            "UpdateSprachdateienBasierendAufDE.py",
+            "--provider", "deepl",
+            "--base-path", self.base_path,
+        ]
+        test_hash_dir = os.path.join(self.base_path, ".i18n_hash")
+        with mock.patch.object(usd, "translate_text_deepl", side_effect=lambda text, target_lang, api_key, api_url=None: text + "!"), \
+             mock.patch.object(usd, "HASH_DIR", test_hash_dir), \
+             mock.patch.object(usd, "_sha256", wraps=usd._sha256) as sha, \
+             mock.patch.object(sys, "argv", argv):
+            usd.main()
+        self.assertEqual(sha.call_count, 4)
+        self.assertEqual(self._load("nl")["b"], "Wert B!!")
+        self.assertGreater(usd.SOURCE_ANALYSIS.hits, len(self.langs))
+
 
 class CrossNamespaceScopingTests(unittest.TestCase):
     """Bug 1 (eigentliche Ursache): --force-key für Namespace A darf Namespace B mit
@@ -735,5 +774,235 @@ class UntranslatedEchoTests(unittest.TestCase):
         )
 
 
+class SinceRefTests(unittest.TestCase):
+    """--since <git-ref>: Arbeitsmenge aus dem Git-Diff der DE-Quellen statt aus den
+    (driftanfälligen) Hash-Manifesten."""
+
+    def test_changed_leaf_paths_handles_dotted_flat_keys(self):
+        old = {"l1": {"q2": {"d": "Ein Trick.", "d.fb": "Schön wär's!"}}, "x": "gleich"}
+        new = {"l1": {"q2": {"d": "Ein Trick.", "d.fb": "Schön wäre es!", "e": "neu"}}, "x": "gleich"}
+        self.assertEqual(usd._changed_leaf_paths(old, new), {"l1.q2.d.fb", "l1.q2.e"})
+
+    def test_changed_leaf_paths_leaf_replaced_by_subtree(self):
+        old = {"a": "Text"}
+        new = {"a": {"b": "Text"}}
+        self.assertEqual(usd._changed_leaf_paths(old, new), {"a.b"})
+        self.assertEqual(usd._changed_leaf_paths({}, new), {"a.b"})
+
+    def _git(self, cwd, *args):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.invalid", *args],
+            cwd=cwd, check=True, capture_output=True,
+        )
+
+    def test_since_translates_only_git_diff_and_ignores_manifest_drift(self):
+        os.environ["DEEPL_API_KEY"] = "test-key-not-used"
+        self.addCleanup(lambda: os.environ.pop("DEEPL_API_KEY", None))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        base_path = tmp.name
+        langs = [l for l in usd.TARGET_LANGS if l != "en"]
+
+        de_dir = os.path.join(base_path, "de")
+        os.makedirs(de_dir)
+        with open(os.path.join(de_dir, "quiz.json"), "w", encoding="utf-8") as f:
+            json.dump({"q": {"d": "Ein Trick.", "d.fb": "Alt", "stale": "Unverändert"}}, f)
+        for lang in usd.TARGET_LANGS:
+            os.makedirs(os.path.join(base_path, lang))
+            with open(os.path.join(base_path, lang, "quiz.json"), "w", encoding="utf-8") as f:
+                json.dump({"q": {"d": f"{lang}-d", "d.fb": f"{lang}-fb", "stale": f"{lang}-stale"}}, f)
+        self._git(base_path, "init", "-q")
+        self._git(base_path, "add", "-A")
+        self._git(base_path, "commit", "-q", "-m", "base")
+
+        with open(os.path.join(de_dir, "quiz.json"), "w", encoding="utf-8") as f:
+            json.dump({"q": {"d": "Ein Trick.", "d.fb": "Neu", "stale": "Unverändert"}}, f)
+
+        # Leeres Manifest: ein normaler Lauf würde ALLE Keys als geändert ansehen.
+        hash_dir = os.path.join(base_path, ".i18n_hash")
+        os.makedirs(hash_dir)
+        calls = []
+
+        def fake_translate_text_deepl(text, target_lang, api_key, api_url=None):
+            calls.append((target_lang, text))
+            return f"[{target_lang}] {text}"
+
+        argv = [
+            "UpdateSprachdateienBasierendAufDE.py",
+            "--provider", "deepl",
+            "--base-path", base_path,
+            "--since", "HEAD",
+        ]
+        with mock.patch.object(usd, "translate_text_deepl", side_effect=fake_translate_text_deepl), \
+             mock.patch.object(usd, "HASH_DIR", hash_dir), \
+             mock.patch.object(sys, "argv", argv):
+            usd.main()
+
+        self.assertEqual(calls[0], ("en", "Neu"))
+        self.assertEqual(len(calls), 1 + len(langs), f"Nur d.fb darf übersetzt werden: {calls}")
+        with open(os.path.join(base_path, "en", "quiz.json"), encoding="utf-8") as f:
+            en_data = json.load(f)
+        self.assertEqual(en_data["q"], {"d": "en-d", "d.fb": "[en] Neu", "stale": "en-stale"})
+        with open(os.path.join(hash_dir, "en_from_de.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"quiz.q.d.fb": usd._sha256("Neu")})
+
+    def test_since_unknown_ref_aborts_without_translating(self):
+        os.environ["DEEPL_API_KEY"] = "test-key-not-used"
+        self.addCleanup(lambda: os.environ.pop("DEEPL_API_KEY", None))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        base_path = tmp.name
+        os.makedirs(os.path.join(base_path, "de"))
+        with open(os.path.join(base_path, "de", "ns.json"), "w", encoding="utf-8") as f:
+            json.dump({"a": "Wert"}, f)
+        self._git(base_path, "init", "-q")
+
+        argv = [
+            "UpdateSprachdateienBasierendAufDE.py",
+            "--provider", "deepl",
+            "--base-path", base_path,
+            "--since", "does-not-exist",
+        ]
+        translate = mock.Mock(side_effect=AssertionError("darf nicht aufgerufen werden"))
+        with mock.patch.object(usd, "translate_text_deepl", translate), \
+             mock.patch.object(usd, "HASH_DIR", os.path.join(base_path, ".i18n_hash")), \
+             mock.patch.object(sys, "argv", argv):
+            usd.main()
+        translate.assert_not_called()
+        self.assertFalse(os.path.exists(os.path.join(base_path, "en", "ns.json")))
+
+
+class AtomicSaveJsonTests(unittest.TestCase):
+    """save_json/_save_manifest schreiben nur bei geändertem Inhalt und dann atomar -
+    unveränderte Dateien behalten ihre mtime (kein Vite-HMR-Sturm)."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(self.dir, "ns.json")
+        stats = dict(usd.WRITE_STATS)
+        self.addCleanup(lambda: usd.WRITE_STATS.update(stats))
+        usd.WRITE_STATS.update(written=0, unchanged=0)
+
+    def test_identical_content_is_not_rewritten(self):
+        data = {"a": "Äpfel & Birnen", "b": {"c": "★"}}
+        self.assertTrue(usd.save_json(self.path, data))
+        mtime = os.stat(self.path).st_mtime_ns
+        self.assertFalse(usd.save_json(self.path, dict(data)))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+        self.assertEqual(usd.WRITE_STATS, {"written": 1, "unchanged": 1})
+
+    def test_output_bytes_match_previous_json_dump_format(self):
+        data = {"b": "ü", "a": {"x": [1, 2]}, "e": {}}
+        usd.save_json(self.path, data)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+
+    def test_changed_content_is_replaced_and_keeps_file_mode(self):
+        usd.save_json(self.path, {"a": "alt"})
+        os.chmod(self.path, 0o644)
+        self.assertTrue(usd.save_json(self.path, {"a": "neu"}))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"a": "neu"})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_failed_write_leaves_old_file_intact_and_no_temp_files(self):
+        usd.save_json(self.path, {"a": "alt"})
+        with mock.patch.object(usd.os, "replace", side_effect=OSError("disk full")):
+            self.assertFalse(usd.save_json(self.path, {"a": "neu"}))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"a": "alt"})
+        self.assertEqual(os.listdir(self.dir), ["ns.json"])
+
+
+class SelectionFilterTests(unittest.TestCase):
+    """--namespace/--lang (Globs): nicht ausgewählte Namespaces/Sprachen werden weder
+    gelesen noch geschrieben, ihre Manifeste bleiben byte-identisch."""
+
+    def setUp(self):
+        os.environ["DEEPL_API_KEY"] = "test-key-not-used"
+        self.addCleanup(lambda: os.environ.pop("DEEPL_API_KEY", None))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base_path = tmp.name
+        self.hash_dir = os.path.join(self.base_path, ".i18n_hash")
+        self._write_de("v1")
+        self.calls = []
+        self._run()
+
+    def _write_de(self, version):
+        os.makedirs(os.path.join(self.base_path, "de"), exist_ok=True)
+        for ns in ("quiz", "quiz.ui", "common"):
+            with open(os.path.join(self.base_path, "de", f"{ns}.json"), "w", encoding="utf-8") as f:
+                json.dump({"a": f"{ns} {version}"}, f)
+
+    def _run(self, *extra):
+        def fake_translate_text_deepl(text, target_lang, api_key, api_url=None):
+            self.calls.append((target_lang, text))
+            return f"[{target_lang}] {text}"
+
+        argv = ["UpdateSprachdateienBasierendAufDE.py", "--provider", "deepl", "--base-path", self.base_path, *extra]
+        out = io.StringIO()
+        with mock.patch.object(usd, "translate_text_deepl", side_effect=fake_translate_text_deepl), \
+             mock.patch.object(usd, "HASH_DIR", self.hash_dir), \
+             mock.patch.object(sys, "argv", argv), \
+             mock.patch.object(sys, "stdout", out):
+            usd.main()
+        return out.getvalue()
+
+    def _snapshot(self):
+        snap = {}
+        for root, _, files in os.walk(self.base_path):
+            for name in files:
+                with open(os.path.join(root, name), "rb") as f:
+                    snap[os.path.relpath(os.path.join(root, name), self.base_path)] = f.read()
+        return snap
+
+    def test_only_selected_namespaces_and_languages_are_touched(self):
+        self._write_de("v2")
+        before = self._snapshot()
+        self.calls = []
+        loaded = []
+        real_load_file = usd.i18n_json.load_file
+
+        def recording_load_file(path):
+            loaded.append(os.path.relpath(path, self.base_path))
+            return real_load_file(path)
+
+        with mock.patch.object(usd.i18n_json, "load_file", side_effect=recording_load_file):
+            out = self._run("--namespace", "quiz*", "--lang", "en,f?")
+        self.assertIn("INFO: Auswahl: 2/3 Namespace(s), Sprachen: en, fr, fi", out)
+        self.assertEqual(sorted(self.calls), sorted(
+            (lang, f"{src} v2" if lang == "en" else f"[en] {src} v2")
+            for lang in ("en", "fi", "fr") for src in ("quiz", "quiz.ui")
+        ))
+        self.assertFalse([p for p in loaded if "common" in p or p.startswith("nl") or "nl_from" in p], loaded)
+
+        after = self._snapshot()
+        changed = sorted(p for p in after if after[p] != before.get(p))
+        self.assertEqual(changed, sorted(
+            [os.path.join(lang, f"{ns}.json") for lang in ("en", "fi", "fr") for ns in ("quiz", "quiz.ui")]
+            + [os.path.join(".i18n_hash", f) for f in ("en_from_de.json", "fi_from_en.json", "fr_from_en.json")]
+        ))
+        with open(os.path.join(self.hash_dir, "en_from_de.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["common.a"], usd._sha256("common v1"))
+
+    def test_without_en_the_existing_pivot_is_used(self):
+        with open(os.path.join(self.base_path, "en", "common.json"), "w", encoding="utf-8") as f:
+            json.dump({"a": "common edited"}, f)
+        self.calls = []
+        self._run("--namespace", "common", "--lang", "ru")
+        self.assertEqual(self.calls, [("ru", "common edited")])
+
+    def test_unknown_selection_aborts(self):
+        self.calls = []
+        out = self._run("--lang", "xx")
+        self.assertIn("❌ --lang xx passt auf keine Zielsprache", out)
+        out = self._run("--namespace", "nope*")
+        self.assertIn("❌ --namespace nope* passt auf keinen Namespace", out)
+        self.assertEqual(self.calls, [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,211 @@
+"""
+Tests fuer check_i18n_usage.py (Scanner fuer genutzte Keys, Fundstellen, dynamische Praefixe;
+Walker mit .gitignore-Pruning, paralleler Scan, persistenter Scan-Cache).
+
+Aufruf: python3 -m unittest test_check_i18n_usage -v
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import check_i18n_usage as ciu  # noqa: E402
+
+SOURCE = "\r\n".join([
+    "import { useTranslation } from 'react-i18next';",
+    "const a = t('common.save') + t(\"common.save\");",
+    "const b = t ( `Menu:open` ), c = i18n.t('x.y'), d = sett('no.key');",
+    "const e = t ('ohne.kontext');",
+    "<Trans i18nKey=\"tx.dq\" /> <Trans i18nKey='tx.sq' /> <Trans i18nKey=`tx.bk` />",
+    "<Trans i18nKey={ 'tx.js' } />",
+    "const f = 'nur.prefix:' + x;",
+    "const g = t('errors:' + code) || t(\"x\") || t('dyn.prefix:' + y);",
+    "  return t('last.line')  ",
+])
+
+
+class ScanTextTests(unittest.TestCase):
+    def test_hits_in_line_order_only_in_i18n_context(self):
+        hits, dynamic = ciu.scan_text(SOURCE.replace("\r\n", "\n"))
+        self.assertEqual([(k, ln) for k, ln, _ in hits], [
+            ("common.save", 2), ("common.save", 2),
+            ("Menu:open", 3), ("x.y", 3),
+            ("tx.dq", 5), ("tx.sq", 5), ("tx.bk", 5),
+            ("tx.js", 6),
+            ("last.line", 9),
+        ])
+        self.assertEqual(hits[-1][2], "return t('last.line')")
+        # 'nur.prefix:' steht in einer Zeile ohne i18n-Kontext.
+        self.assertEqual(dynamic, {"errors:", "dyn.prefix:"})
+
+
+def _touch(root, *parts, content=""):
+    path = os.path.join(root, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+class WalkerTests(unittest.TestCase):
+    def test_ignore_dirs_and_nested_gitignore_rules_prune_the_walk(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = tmp.name
+        _touch(root, ".gitignore", content="# Kommentar\n*.local.js\n/generated/\nlogs\n!keep.local.js\n")
+        _touch(root, "src", ".gitignore", content="vendor/**/*.ts\nout/\n")
+        for parts in [
+            ("src", "b.tsx"), ("src", "A.jsx"), ("src", "x.local.js"), ("src", "keep.local.js"),
+            ("src", "notes.md"), ("src", "vendor", "lib", "v.ts"), ("src", "vendor", "v.js"),
+            ("src", "out", "o.js"), ("src", "generated", "g.js"), ("generated", "g.js"),
+            ("logs", "l.js"), ("node_modules", "pkg", "i.js"), ("src", "out.js"),
+        ]:
+            _touch(root, *parts)
+
+        files = [os.path.relpath(p, root).replace(os.sep, "/") for p in ciu.iter_code_files(root)]
+        self.assertEqual(files, [
+            "src/A.jsx", "src/b.tsx", "src/generated/g.js", "src/keep.local.js", "src/out.js", "src/vendor/v.js",
+        ])
+
+    def test_bracket_negation_only_at_the_start_of_the_class(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        _touch(tmp.name, ".gitignore", content="[a!].js\n[!x]y.js\n[]^]z.js\n")
+        for name in ("a.js", "!.js", "^.js", "zy.js", "xy.js", "]z.js", "^z.js", "bz.js"):
+            _touch(tmp.name, name)
+        files = sorted(os.path.basename(p) for p in ciu.iter_code_files(tmp.name))
+        self.assertEqual(files, ["^.js", "bz.js", "xy.js"])
+
+    def test_gitignore_of_parent_directories_applies(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        _touch(tmp.name, ".gitignore", content="skip/\n")
+        _touch(tmp.name, "frontend", "skip", "s.js")
+        keep = _touch(tmp.name, "frontend", "k.js")
+        with mock.patch.object(ciu, "PROJECT_ROOT", tmp.name):
+            self.assertEqual(list(ciu.iter_code_files(os.path.join(tmp.name, "frontend"))), [keep])
+
+
+class ScanFilesTests(unittest.TestCase):
+    def test_process_pool_merges_in_input_order(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        paths = [_touch(tmp.name, f"f{i}.js", content=f"t('k.n{i}')\nconst p = t('p{i}:' + x);\n") for i in range(12)]
+        paths.insert(5, os.path.join(tmp.name, "fehlt.js"))
+        serial = io.StringIO()
+        with redirect_stdout(serial):
+            expected = ciu.scan_files(paths, jobs=1)
+        self.assertEqual(expected[0], ([("k.n0", 1, "t('k.n0')")], {"p0:"}))
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(ciu.scan_files(paths, jobs=3), expected)
+        self.assertIn("fehlt.js", out.getvalue())
+        self.assertNotIn("seriell", out.getvalue())
+
+
+class ScanCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.cache_path = os.path.join(self.root, ".i18n_hash", ciu.SCAN_CACHE_FILE)
+        self.old = time.time_ns() - 60 * 10**9
+        self.a = self._write("a.js", "t('a.one')\n", self.old)
+        self.b = self._write("b.js", "t('b.one') + t('b.two')\n", self.old)
+
+    def _write(self, name, content, mtime_ns=None):
+        path = _touch(self.root, name, content=content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def _scan(self, paths):
+        cache = ciu.ScanCache(self.cache_path, self.root)
+        with mock.patch.object(ciu, "scan_text", wraps=ciu.scan_text) as spy:
+            results = ciu.scan_files(paths, jobs=1, cache=cache)
+        cache.save()
+        return [sorted(k for k, _, _ in hits) for hits, _ in results], spy.call_count, cache.stats
+
+    def test_unchanged_files_come_from_cache_and_edits_are_rescanned(self):
+        self.assertEqual(self._scan([self.a, self.b]), ([["a.one"], ["b.one", "b.two"]], 2, {"hits": 0, "verified": 0, "misses": 2}))
+        self.assertEqual(self._scan([self.a, self.b]), ([["a.one"], ["b.one", "b.two"]], 0, {"hits": 2, "verified": 0, "misses": 0}))
+
+        self._write("a.js", "t('a.one')\nt('a.two')\n", self.old + 1)
+        os.utime(self.b, ns=(self.old + 1, self.old + 1))  # touch ohne Inhaltsänderung
+        self.assertEqual(self._scan([self.a, self.b]), ([["a.one", "a.two"], ["b.one", "b.two"]], 1, {"hits": 0, "verified": 1, "misses": 1}))
+
+    def test_recent_mtime_is_verified_by_content_next_time(self):
+        self._write("a.js", "t('a.new')\n")
+        self.assertEqual(self._scan([self.a])[1], 1)
+        # Gleiche Größe, gleicher Zeitstempel - fällt nur über den Inhalts-Hash auf.
+        mtime = os.stat(self.a).st_mtime_ns
+        self._write("a.js", "t('a.neu')\n", mtime)
+        self.assertEqual(self._scan([self.a])[:2], ([["a.neu"]], 1))
+
+    def test_scanner_change_invalidates_and_vanished_files_are_dropped(self):
+        self._scan([self.a, self.b])
+        with mock.patch.object(ciu, "SCANNER_FINGERPRINT", "anders"):
+            self.assertEqual(self._scan([self.a])[1], 1)
+        with open(self.cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual((data["scanner"], sorted(data["files"])), ("anders", ["a.js"]))
+
+
+class MainTests(unittest.TestCase):
+    def test_report_with_normalized_keys_and_grouped_missing_locations(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = tmp.name
+        locales = os.path.join(root, "src", "locales")
+        os.makedirs(os.path.join(locales, "de"))
+        with open(os.path.join(locales, "de", "menu.json"), "w", encoding="utf-8") as f:
+            json.dump({"open": "Öffnen", "close": "Schließen"}, f)
+        with open(os.path.join(locales, "de", "common.json"), "w", encoding="utf-8") as f:
+            json.dump({"save": "Speichern"}, f)
+        os.makedirs(os.path.join(root, "src", "components"))
+        with open(os.path.join(root, "src", "components", "App.jsx"), "w", encoding="utf-8", newline="") as f:
+            f.write(SOURCE)
+        # Tests und alles unter locales/ werden nicht gezählt.
+        with open(os.path.join(root, "src", "components", "App.test.jsx"), "w", encoding="utf-8") as f:
+            f.write("t('test.only')")
+        with open(os.path.join(locales, "helper.js"), "w", encoding="utf-8") as f:
+            f.write("t('locales.only')")
+
+        def run():
+            out = io.StringIO()
+            ciu.ns_map.clear()
+            with mock.patch.object(ciu, "SRC_ROOT", root), \
+                 mock.patch.object(ciu, "LOCALES_DIR", locales), \
+                 mock.patch.object(ciu, "DE_DIR", os.path.join(locales, "de")), \
+                 redirect_stdout(out):
+                ciu.main([])
+            return out
+
+        out = run()
+        self.assertTrue(os.path.exists(os.path.join(locales, ".i18n_hash", ciu.SCAN_CACHE_FILE)))
+        self.assertEqual(run().getvalue(), out.getvalue(), "zweiter Lauf aus dem Scan-Cache")
+        with open(os.path.join(locales, "i18n_usage_report.json"), encoding="utf-8") as f:
+            report = json.load(f)
+
+        self.assertEqual(report["files_scanned"], 1)
+        self.assertEqual(report["total_used_keys"], 8)
+        self.assertEqual(report["unused_keys"], ["menu.close"])
+        self.assertEqual(report["missing_keys"], ["last.line", "tx.bk", "tx.dq", "tx.js", "tx.sq", "x.y"])
+        self.assertEqual(report["dynamic_candidates"], ["dyn.prefix:", "errors:"])
+        self.assertIn(
+            f"   📄 frontend/{os.path.join('src', 'components', 'App.jsx')}\n"
+            "           3  x.y\n"
+            "             const b = t ( `Menu:open` ), c = i18n.t('x.y'), d = sett('no.key');\n"
+            "           5  tx.bk\n",
+            out.getvalue(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Tests fuer i18n_bench.py (synthetischer Baum + End-to-End-Benchmark).
+
+Aufruf: python3 -m unittest test_i18n_bench -v
+"""
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_bench  # noqa: E402
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+
+
+class GeneratorTests(unittest.TestCase):
+    def test_namespace_shape_follows_parameters(self):
+        data = i18n_bench.generate_namespace(
+            random.Random(3), keys=400, depth=3, value_len=30, dotted_share=0.2, original_share=0.1,
+        )
+        flat = usd._flatten_dict(data)
+        originals = [p for p in flat if usd.is_original_key(p)]
+        dotted = [p for p in flat if p.endswith(".fb")]
+        self.assertTrue(all(p.count(".") >= 2 for p in flat), "Tiefe 3 erwartet")
+        self.assertAlmostEqual(len(originals) / 400, 0.1, delta=0.05)
+        self.assertAlmostEqual(len(dotted) / 400, 0.2, delta=0.06)
+        # Flache Punkt-Keys müssen über _get_node_by_path auffindbar bleiben.
+        for p in dotted[:5]:
+            self.assertIsInstance(usd._get_node_by_path(data, p), str)
+
+
+class BenchmarkRunTests(unittest.TestCase):
+    def test_scenarios_report_expected_work(self):
+        report = i18n_bench.run_benchmark(namespaces=2, keys=15, changed_share=0.2, seed=7)
+        by_name = {r["scenario"]: r for r in report["results"]}
+        self.assertEqual(list(by_name), list(i18n_bench.SCENARIOS))
+        per_key = len(usd.TARGET_LANGS)
+        self.assertGreater(by_name["full"]["requests"], 0)
+        self.assertEqual((by_name["noop"]["requests"], by_name["noop"]["files_written"]), (0, 0))
+        self.assertEqual(by_name["incremental"]["requests"], by_name["incremental"]["changed_keys"] * per_key)
+        self.assertGreater(by_name["force-key"]["requests"], 0)
+        self.assertEqual(report["params"]["keys"], 15)
+
+    def test_rate_limit_injection_goes_through_retry_path(self):
+        report = i18n_bench.run_benchmark(namespaces=1, keys=10, rate_limit_share=0.3, seed=2, scenarios=("full",))
+        (full,) = report["results"]
+        self.assertGreater(full["rate_limited"], 0)
+        self.assertEqual(full["retries"], full["rate_limited"])
+        self.assertGreater(full["virtual_sleep_s"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Tests fuer i18n_budget.py (--max-chars/--max-duration, Prioritaets-Durchgaenge, Checkpoint).
+
+Aufruf: python3 -m unittest test_i18n_budget -v
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from i18n_testsupport import MainRunMixin, write_json  # noqa: E402
+from i18n_budget import CHECKPOINT_FILE, QuotaExceeded, WorkScheduler, load_checkpoint  # noqa: E402
+from i18n_status import load_failures  # noqa: E402
+
+
+class WorkSchedulerTests(unittest.TestCase):
+    def test_tiers_one_attempt_per_source_and_deferral_after_stop(self):
+        s = WorkScheduler()
+        s.configure(max_chars=10, unused_keys={"ns.unused"})
+        s.set_namespace("ns")
+        s.begin_pass(0)
+        self.assertTrue(s.admit("en", "used", True, "1234"))
+        s.charge(4)
+        self.assertFalse(s.admit("en", "unused", True, "12"), "spätere Stufe")
+        self.assertFalse(s.admit("en", "used", False, "1234"), "gleicher Quelltext nur einmal")
+        self.assertEqual(s.deferred, {})
+
+        s.begin_pass(2)
+        self.assertTrue(s.admit("en", "unused", True, "12"))
+        s.charge(2)
+        self.assertFalse(s.admit("en", "other", True, "12345"), "Budget erschöpft")
+        self.assertEqual(s.stop_reason, "max-chars")
+        self.assertEqual(s.deferred, {"en": {"ns": {"other"}}})
+        self.assertEqual(s.admitted, [1, 0, 1, 0])
+
+    def test_plural_family_tier_and_deferral_use_member_keys(self):
+        s = WorkScheduler()
+        s.configure(max_chars=3, unused_keys={"ns.half_one", "ns.gone_one", "ns.gone_other"})
+        s.set_namespace("ns")
+        self.assertEqual(s.tier_of("half", True, ["half_one", "half_other"]), 0, "ein genutztes Mitglied genügt")
+        self.assertEqual(s.tier_of("gone", True, ["gone_one", "gone_other"]), 2)
+        s.begin_pass(0)
+        self.assertFalse(s.admit("en", "gone", True, "1 x\nn x", ["gone_one", "gone_other"]), "spätere Stufe")
+        self.assertFalse(s.admit("en", "half", True, "1 x\nn x", ["half_one", "half_other"]), "Budget erschöpft")
+        self.assertEqual(s.deferred, {"en": {"ns": {"half_one", "half_other"}}})
+
+    def test_duration_budget_and_quota_stop_without_budget(self):
+        now = [0.0]
+        s = WorkScheduler()
+        s.configure(max_duration=5, clock=lambda: now[0])
+        s.begin_pass(0)
+        self.assertTrue(s.admit("en", "a", True, "x"))
+        now[0] = 5.0
+        self.assertFalse(s.admit("en", "b", True, "y"))
+        self.assertEqual(s.stop_reason, "max-duration")
+
+        s.configure()
+        self.assertEqual(s.passes(), [None])
+        self.assertTrue(s.admit("fr", "a", False, "x"))
+        s.stop("quota")
+        self.assertFalse(s.admit("fr", "b", False, "y"))
+        self.assertEqual(s.deferred, {"fr": {"": {"b"}}})
+
+
+class MainBudgetTests(MainRunMixin, unittest.TestCase):
+    namespace = "common"
+
+    def setUp(self):
+        super().setUp()
+        self.quota_after = None
+        self.write_de({"u1": "Genutzt 01", "u2": "Genutzt 02", "x1": "Alt 01", "x2": "Alt 02"})
+        write_json(os.path.join(self.base_path, "i18n_usage_report.json"), {"unused_keys": ["common.x1", "common.x2"]})
+
+    def translate(self, text, target_lang):
+        if self.quota_after is not None and len(self.calls) >= self.quota_after:
+            raise QuotaExceeded("DeepL: 456 Quota exceeded")
+        return f"[{target_lang}] {text}"
+
+    def _load(self, *parts):
+        with open(os.path.join(self.base_path, *parts), encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_used_missing_keys_first_and_clean_stop_with_checkpoint(self):
+        # Phase A vor Phase B: en u1+u2 (20) + nl/es/fr je 2 x 15 (90) = 110, der nächste
+        # Key (15) passt nicht mehr. Ungenutzte Keys kommen gar nicht dran; ohne EN-Pivot
+        # tauchen x1/x2 in Phase B noch nicht auf (der Checkpoint trägt sie über "en" nach).
+        out = self.run_main("--max-chars", "115")
+        self.assertEqual(len(self.calls), 8)
+        self.assertTrue(all("Genutzt" in text for _, text in self.calls))
+        self.assertIn("⏸️ Lauf vorzeitig beendet (max-chars): 10 Key(s) zurückgestellt", out)
+        self.assertIn("Zusammenfassung Budget: 110/115 Zeichen", out)
+        self.assertEqual(self._load("fr", "common.json"), {"u1": "[fr] [en] Genutzt 01", "u2": "[fr] [en] Genutzt 02"})
+        self.assertEqual(self._load("it", "common.json"), {})
+        self.assertEqual(set(self._load(".i18n_hash", "en_from_de.json")), {"common.u1", "common.u2"})
+        carried = load_checkpoint(self.hash_dir)
+        self.assertEqual(carried["en"], {"common": {"x1", "x2"}})
+        self.assertEqual(carried["ru"], {"common": {"u1", "u2"}})
+        self.assertEqual(load_failures(self.hash_dir), {}, "zurückgestellt ist nicht gescheitert")
+
+        self.calls = []
+        self.run_main()
+        self.assertEqual(len(self.calls), 4 * 8 - 8)
+        self.assertFalse(os.path.exists(os.path.join(self.hash_dir, CHECKPOINT_FILE)))
+
+    def test_deferred_changes_are_carried_into_scoped_runs(self):
+        self.run_main()
+        self.write_de({"u1": "Genutzt 11", "u2": "Genutzt 02", "x1": "Alt 11", "x2": "Alt 02"})
+        self.calls = []
+        self.run_main("--max-chars", "1")
+        self.assertEqual(self.calls, [])
+        self.assertEqual(load_checkpoint(self.hash_dir), {"en": {"common": {"u1", "x1"}}})
+
+        # Ein auf andere Sprachen beschränkter Lauf lässt den Checkpoint stehen.
+        self.run_main("--lang", "fi")
+        self.assertEqual(load_checkpoint(self.hash_dir), {"en": {"common": {"u1", "x1"}}})
+
+        # Ein --force-key-Lauf für einen anderen Key holt die zurückgestellten
+        # Änderungen trotzdem nach - auch in Phase B.
+        self.calls = []
+        self.run_main("--force-key", "common.u2")
+        self.assertIn(("en", "Genutzt 11"), self.calls)
+        self.assertIn(("en", "Alt 11"), self.calls)
+        self.assertEqual(self._load("ru", "common.json")["x1"], "[ru] [en] Alt 11")
+        self.assertFalse(os.path.exists(os.path.join(self.hash_dir, CHECKPOINT_FILE)))
+
+    def test_quota_exceeded_stops_cleanly_without_budget(self):
+        self.quota_after = 2
+        out = self.run_main()
+        self.assertEqual(len(self.calls), 2)
+        self.assertIn("456 Quota exceeded - weitere Keys werden zurückgestellt", out)
+        self.assertNotIn("Abbruch für Sprache", out)
+        self.assertEqual(json.load(open(os.path.join(self.hash_dir, CHECKPOINT_FILE), encoding="utf-8"))["reason"], "quota")
+        self.assertEqual(set(self._load(".i18n_hash", "en_from_de.json")), {"common.u1", "common.u2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
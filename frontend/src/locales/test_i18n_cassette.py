@@ -0,0 +1,85 @@
+"""
+Tests fuer i18n_cassette.py (--cassette / --cassette-mode).
+
+Aufruf: python3 -m unittest test_i18n_cassette -v
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+from i18n_cassette import CASSETTE, Cassette, CassetteMiss, cassette_key  # noqa: E402
+from i18n_metrics import METRICS  # noqa: E402
+
+
+class CassetteTests(unittest.TestCase):
+    def test_key_normalizes_unicode_and_outer_whitespace_only(self):
+        self.assertEqual(cassette_key("deepl", "fr", "Käse \r\n"), cassette_key("deepl", "FR", "Käse"))
+        self.assertNotEqual(cassette_key("deepl", "fr", "Käse"), cassette_key("openai", "fr", "Käse"))
+        self.assertNotEqual(cassette_key("deepl", "fr", "Käse"), cassette_key("deepl", "nl", "Käse"))
+        self.assertIn(":de:en:", cassette_key("deepl", "en", "Käse"))
+
+    def test_modes_and_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "c.json")
+            c = Cassette()
+            c.configure(path, "record")
+            c.store("deepl", "fr", "Hallo", "Bonjour")
+            self.assertIsNone(c.lookup("deepl", "fr", "Hallo"), "record fragt immer den Provider")
+            self.assertTrue(c.save())
+            self.assertFalse(c.save(), "ohne Aenderung kein erneutes Schreiben")
+
+            c.configure(path, "replay")
+            self.assertEqual(c.lookup("deepl", "fr", " Hallo "), "Bonjour")
+            self.assertIsNone(c.lookup("deepl", "fr", "Neu"))
+            c.configure(path, "strict")
+            with self.assertRaises(CassetteMiss):
+                c.lookup("deepl", "fr", "Neu")
+            self.assertEqual((c.hits, c.misses), (0, 1))
+
+
+class MainCassetteTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(CASSETTE.configure)
+        self.write_de({"a": "Wert A", "g": {"b": "Wert B (Multi-Signature)"}})
+        self.cassette = os.path.join(self.base_path, "cassette.json")
+
+    def _run(self, *extra):
+        return self.run_main("--cassette", self.cassette, *extra)
+
+    def test_replay_reproduces_recorded_run_without_provider_or_key(self):
+        self._run("--full", "--cassette-mode", "record")
+        recorded_calls = len(self.calls)
+        self.assertEqual(recorded_calls, 2 * len(usd.TARGET_LANGS))
+        expected = {lang: self.read_lang(lang) for lang in usd.TARGET_LANGS}
+
+        os.environ.pop("DEEPL_API_KEY")
+        self.calls.clear()
+        out = self._run("--full", "--cassette-mode", "strict")
+        self.assertEqual(self.calls, [])
+        self.assertEqual({lang: self.read_lang(lang) for lang in usd.TARGET_LANGS}, expected)
+        self.assertEqual(sum(s["cache_hits"] for s in METRICS.series.values()), recorded_calls)
+        self.assertEqual(sum(s["requests"] for s in METRICS.series.values()), 0)
+        self.assertIn(f"strict: {recorded_calls} Treffer, 0 Fehlschläge", out)
+
+    def test_strict_miss_aborts_language_and_replay_falls_through(self):
+        self._run("--cassette-mode", "record")
+        self.write_de({"a": "Wert A geändert", "g": {"b": "Wert B (Multi-Signature)"}})
+        self.calls.clear()
+        out = self._run("--cassette-mode", "strict")
+        self.assertEqual(self.calls, [])
+        self.assertIn("❌ Abbruch für Sprache en / Namespace ns: Kassette", out)
+        self.assertEqual(self.read_lang("en")["a"], "[en] Wert A")
+
+        out = self._run()
+        self.assertEqual(len(self.calls), len(usd.TARGET_LANGS), "nur der geänderte Key geht an den Provider")
+        self.assertEqual(self.read_lang("en")["a"], "[en] Wert A geändert")
+        self.assertIn("📼 Kassette gespeichert", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
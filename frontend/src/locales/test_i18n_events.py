@@ -0,0 +1,101 @@
+"""
+Tests fuer i18n_events.py (JSONL-Ereignisse, Live-Fortschritt, --quiet) und deren
+Anbindung an UpdateSprachdateienBasierendAufDE.main().
+
+Aufruf: python3 -m unittest test_i18n_events -v
+"""
+import io
+import json
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_events  # noqa: E402
+from i18n_events import EVENTS, EventLog  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+
+
+class EventLogTests(unittest.TestCase):
+    def test_emit_writes_one_json_object_per_line_with_context(self):
+        stream = io.StringIO()
+        log = EventLog()
+        log.configure(stream=stream)
+        log.set_context(ns="quiz", lang="fr")
+        log.emit("translated", path="l1.q2.d.fb", chars=12)
+        log.set_context(lang=None)
+        log.emit("written", file="x.json", unused=None)
+        first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual({k: first[k] for k in ("event", "ns", "lang", "path", "chars")},
+                         {"event": "translated", "ns": "quiz", "lang": "fr", "path": "l1.q2.d.fb", "chars": 12})
+        self.assertEqual(set(second), {"ts", "event", "ns", "file"})
+        self.assertEqual(log.counts, {"translated": 1, "written": 1})
+
+    def test_quiet_counts_notes_instead_of_printing(self):
+        log = EventLog()
+        log.configure(quiet=True)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            for i in range(3):
+                log.note("skipOriginal", f"Überspringe Übersetzung für Original-Key: k{i}")
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(log.quiet_summary(), "Zusammengefasste Einzelmeldungen (--quiet): skipOriginal: 3")
+
+    def test_eta_uses_time_attributed_to_the_language(self):
+        log = EventLog()
+        log.configure()
+        log.plan("fr", 10)
+        clock = iter([1.0, 3.0, 5.0])
+        with mock.patch.object(i18n_events.time, "perf_counter", lambda: next(clock)):
+            log.mark_idle()
+            log.advance("fr")
+            log.advance("fr")
+        # 2 Keys in 4 s -> 8 verbleibende Keys brauchen 16 s.
+        self.assertEqual(log.eta("fr"), 16.0)
+        self.assertIn("[fr] 2/10 Keys · 0.5 Req/s · ETA fr 00:16", log.progress_line("fr"))
+        self.assertIsNone(log.eta("ru"))
+
+
+class MainEventStreamTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(EVENTS.configure)
+        self.write_de({"a": "Wert A", "b": "Dieser Satz kommt unverändert zurück", "c.original": "Original"})
+        self.events_path = os.path.join(self.base_path, "events.jsonl")
+
+    def translate(self, text, target_lang):
+        return text if text.startswith("Dieser Satz") else f"[{target_lang}] {text}"
+
+    def _run(self, *extra):
+        out = self.run_main("--events", self.events_path, *extra)
+        with open(self.events_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f], out
+
+    def test_events_cover_plan_translation_failures_and_writes(self):
+        events, _ = self._run()
+        by_type: dict = {}
+        for e in events:
+            by_type.setdefault(e["event"], []).append(e)
+        planned = {e["lang"]: e["count"] for e in by_type["planned"]}
+        self.assertEqual(planned["en"], 2, "'.original' gehört nicht zur Arbeitsmenge")
+        self.assertEqual(
+            {(e["lang"], e["path"]) for e in by_type["translated"] if e["lang"] == "en"}, {("en", "a")}
+        )
+        self.assertIn({"lang": "en", "path": "b", "reason": "echo"},
+                      [{k: e[k] for k in ("lang", "path", "reason")} for e in by_type["failed"]])
+        self.assertTrue(all(e["reason"] == "original" for e in by_type["skipped"]))
+        self.assertIn(os.path.join(self.base_path, "en", "ns.json"), {e["file"] for e in by_type["written"]})
+
+    def test_quiet_suppresses_per_key_lines(self):
+        _, loud = self._run()
+        self.assertIn("Überspringe Übersetzung für Original-Key", loud)
+        _, quiet = self._run("--quiet", "--full")
+        self.assertNotIn("Überspringe Übersetzung für Original-Key", quiet)
+        self.assertNotIn("💾 Datei gespeichert", quiet)
+        self.assertIn("Zusammengefasste Einzelmeldungen (--quiet):", quiet)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests fuer i18n_fake_provider.py (lokaler DeepL/OpenAI-Stand-in).
+
+Laufen gegen einen echten Socket auf 127.0.0.1 (Port vom Betriebssystem gewaehlt).
+
+Aufruf: python3 -m unittest test_i18n_fake_provider -v
+"""
+import json
+import os
+import socket
+import sys
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_fake_provider import Behavior, FakeProviderServer, drop_emoji, parse_latency  # noqa: E402
+
+
+def _post(url: str, body: dict, headers: dict, timeout: float = 5.0):
+    req = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"), method="POST")
+    req.add_header("Content-Type", "application/json")
+    for k, v in headers.items():
+        req.add_header(k, v)
+    return urllib.request.urlopen(req, timeout=timeout)
+
+
+class FakeProviderTests(unittest.TestCase):
+    def _server(self, **behavior) -> FakeProviderServer:
+        server = FakeProviderServer(Behavior(**behavior)).start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_deepl_contract_works_with_pipeline_client(self):
+        server = self._server()
+        with mock.patch.object(usd.time, "sleep"):
+            self.assertEqual(usd.translate_text_deepl("Hallo Welt", "fr", "key", api_url=server.deepl_url), "[FR] Hallo Welt")
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            _post(server.deepl_url, {"text": ["x"], "target_lang": "FR"}, {})
+        self.assertEqual(ctx.exception.code, 403)
+
+    def test_rate_limit_burst_sends_retry_after_and_pipeline_retries(self):
+        server = self._server(burst_every=1, burst_length=2, retry_after=3)
+        _post(server.deepl_url, {"text": ["x"], "target_lang": "FR"}, {"Authorization": "DeepL-Auth-Key k"}).close()
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            _post(server.deepl_url, {"text": ["x"], "target_lang": "FR"}, {"Authorization": "DeepL-Auth-Key k"})
+        self.assertEqual((ctx.exception.code, ctx.exception.headers["Retry-After"]), (429, "3"))
+        with mock.patch.object(usd.time, "sleep") as sleep:
+            self.assertEqual(usd.translate_text_deepl("Text", "nl", "key", api_url=server.deepl_url), "[NL] Text")
+        self.assertIn(mock.call(2.0), sleep.call_args_list, "Backoff nach dem zweiten 429 des Bursts erwartet")
+        self.assertEqual(server.behavior.stats["rate_limited"], 2)
+
+    def test_echo_and_dropped_emoji_trigger_pipeline_safeguards(self):
+        server = self._server(echo_share=1.0)
+        with mock.patch.object(usd.time, "sleep"):
+            out = usd.translate_text_deepl("Dieser Satz kommt zurück", "fr", "k", api_url=server.deepl_url)
+        self.assertTrue(usd._looks_like_untranslated_echo("Dieser Satz kommt zurück", out))
+
+        server = self._server(drop_emoji_share=1.0)
+        with mock.patch.object(usd.time, "sleep"):
+            out = usd.translate_text_deepl("★ Favoriten 👍", "fr", "k", api_url=server.deepl_url)
+        self.assertEqual(out, "[FR]  Favoriten")
+        self.assertEqual(drop_emoji("❤️ ok"), " ok")
+        failed: set = set()
+        usd._preserve_special_chars("★ Favoriten 👍", out, "x.y", {}, failed)
+        self.assertEqual(failed, {"x.y"})
+
+    def test_hanging_request_times_out_on_client(self):
+        server = self._server(timeout_share=1.0, hang_s=5)
+        with self.assertRaises((socket.timeout, urllib.error.URLError, TimeoutError)):
+            _post(server.deepl_url, {"text": ["x"], "target_lang": "FR"}, {"Authorization": "DeepL-Auth-Key k"}, timeout=0.3)
+        self.assertEqual(server.behavior.stats["timeouts"], 1)
+
+    def test_chat_completions_endpoint(self):
+        server = self._server()
+        body = {
+            "model": "gpt-4o",
+            "messages": [
+                {"role": "system", "content": "Übersetze den folgenden Text präzise ins fr. Behalte den Kontext bei."},
+                {"role": "user", "content": "Konto"},
+            ],
+        }
+        with _post(f"{server.openai_base_url}/chat/completions", body, {"Authorization": "Bearer sk-test"}) as resp:
+            data = json.loads(resp.read())
+        self.assertEqual(data["choices"][0]["message"]["content"], "[FR] Konto")
+
+    def test_latency_specs(self):
+        import random
+
+        rng = random.Random(1)
+        self.assertEqual(parse_latency("fixed:250")(rng), 0.25)
+        self.assertTrue(0.01 <= parse_latency("uniform:10:20")(rng) <= 0.02)
+        self.assertGreater(parse_latency("lognormal:80:0.5")(rng), 0)
+        with self.assertRaises(ValueError):
+            parse_latency("pareto:1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Tests fuer i18n_json.py (gemeinsame JSON-Schicht der i18n-Skripte).
+
+Kernzusage: egal ob orjson installiert ist oder nicht, die geschriebenen Bytes sind
+identisch zu json.dumps(..., ensure_ascii=False, indent=2) - geprueft gegen den
+kompletten aktuellen Locale-Baum (alle Sprachen + Hash-Manifeste), damit ein
+Backend-Wechsel nie Diffs in den Sprachdateien erzeugt.
+
+Aufruf: python3 -m unittest test_i18n_json -v
+"""
+import glob
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_json  # noqa: E402
+
+LOCALES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _locale_tree_files() -> list[str]:
+    files = glob.glob(os.path.join(LOCALES_DIR, "*", "*.json"))
+    files += glob.glob(os.path.join(LOCALES_DIR, ".i18n_hash", "*.json"))
+    return sorted(files)
+
+
+class BackendParityTests(unittest.TestCase):
+    @unittest.skipIf(i18n_json.orjson is None, "orjson nicht installiert")
+    def test_both_backends_produce_identical_bytes_for_current_locale_tree(self):
+        files = _locale_tree_files()
+        self.assertGreater(len(files), 100, "Locale-Baum nicht gefunden")
+        for path in files:
+            with self.subTest(file=os.path.relpath(path, LOCALES_DIR)):
+                with open(path, "rb") as f:
+                    raw = f.read()
+                data_std = i18n_json.loads(raw, backend="json")
+                data_fast = i18n_json.loads(raw, backend="orjson")
+                self.assertEqual(data_std, data_fast)
+                self.assertEqual(list(data_std), list(data_fast), "Key-Reihenfolge muss erhalten bleiben")
+                self.assertEqual(
+                    i18n_json.dumps(data_fast, backend="orjson"),
+                    i18n_json.dumps(data_std, backend="json"),
+                )
+
+    def test_stdlib_backend_matches_reference_format(self):
+        data = {"b": "Äpfel & Birnen ★ 😀", "a": {"x": [1, None, True]}, "e": {}, "l": []}
+        self.assertEqual(
+            i18n_json.dumps(data, backend="json"),
+            json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"),
+        )
+
+    @unittest.skipIf(i18n_json.orjson is None, "orjson nicht installiert")
+    def test_values_orjson_would_format_differently_fall_back_to_stdlib(self):
+        # orjson schreibt 1e16 statt 1e+16, kann keine >64-Bit-Integer und keine
+        # Nicht-String-Keys - dumps() muss trotzdem exakt die stdlib-Bytes liefern.
+        cases = [
+            {"f": 1e16},
+            {"f": 0.1},
+            {"big": 2 ** 70},
+            {1: "int key"},
+            {"ctrl": "\x00\x1f\x7f\b\f\n\r\t\"\\"},
+        ]
+        for data in cases:
+            with self.subTest(data=repr(data)):
+                self.assertEqual(i18n_json.dumps(data, backend="orjson"), i18n_json.dumps_stdlib(data))
+
+    @unittest.skipIf(i18n_json.orjson is None, "orjson nicht installiert")
+    def test_loads_accepts_what_stdlib_accepts(self):
+        self.assertEqual(i18n_json.loads(b'{"a": NaN}', backend="orjson").keys(), {"a"})
+        self.assertEqual(i18n_json.loads('"\\ud800"', backend="orjson"), "\ud800")
+        with self.assertRaises(json.JSONDecodeError):
+            i18n_json.loads(b"{not json", backend="orjson")
+
+
+class DocumentCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "ns.json")
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"a": "Wert"}, f)
+        self.cache = i18n_json.DocumentCache()
+
+    def test_second_load_is_served_from_memory(self):
+        first = self.cache.load(self.path)
+        with mock.patch.object(i18n_json, "loads", side_effect=AssertionError("nicht erneut parsen")):
+            second = self.cache.load(self.path)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats, {"hits": 1, "misses": 1, "stores": 0})
+
+    def test_external_change_invalidates_entry(self):
+        self.cache.load(self.path)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"a": "Neuer Wert"}, f)
+        self.assertEqual(self.cache.load(self.path), {"a": "Neuer Wert"})
+        self.assertEqual(self.cache.stats["misses"], 2)
+
+    def test_write_updates_cache_without_reparse(self):
+        data = {"a": "Geschrieben"}
+        with mock.patch.object(i18n_json, "DOCUMENTS", self.cache):
+            i18n_json.write_json_if_changed(self.path, data)
+            with mock.patch.object(i18n_json, "loads", side_effect=AssertionError("nicht erneut parsen")):
+                self.assertIs(i18n_json.load_file(self.path), data)
+        self.assertEqual(self.cache.stats, {"hits": 1, "misses": 0, "stores": 1})
+
+    def test_missing_file_raises_and_is_not_cached(self):
+        with self.assertRaises(FileNotFoundError):
+            self.cache.load(self.path + ".missing")
+        self.assertEqual(self.cache.stats["misses"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests fuer i18n_metrics.py (--metrics-json / --metrics-prom).
+
+Aufruf: python3 -m unittest test_i18n_metrics -v
+"""
+import email.message
+import io
+import json
+import os
+import sys
+import unittest
+import urllib.error
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_metrics import METRICS, RunMetrics  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+
+
+class _FakeResponse(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class RunMetricsTests(unittest.TestCase):
+    def test_histogram_is_cumulative_and_prometheus_text_is_well_formed(self):
+        m = RunMetrics()
+        m.request("deepl", "fr", chars=10, seconds=0.07, ok=True)
+        m.request("deepl", "fr", chars=5, seconds=3.0, ok=False)
+        m.retry("deepl", "fr", status=429)
+        (entry,) = m.to_dict()["series"]
+        self.assertEqual(
+            {k: entry[k] for k in ("requests", "chars", "failures", "retries", "rate_limited")},
+            {"requests": 2, "chars": 15, "failures": 1, "retries": 1, "rate_limited": 1},
+        )
+        buckets = entry["latency_seconds"]["buckets"]
+        self.assertEqual((buckets["0.05"], buckets["0.1"], buckets["2.5"], buckets["5.0"], buckets["+Inf"]), (0, 1, 1, 2, 2))
+
+        prom = m.to_prometheus()
+        self.assertIn('i18n_translate_rate_limited_total{provider="deepl",lang="fr"} 1', prom)
+        self.assertIn('i18n_translate_request_duration_seconds_bucket{provider="deepl",lang="fr",le="+Inf"} 2', prom)
+        for line in prom.splitlines():
+            if not line.startswith("#"):
+                self.assertRegex(line, r'^[a-z0-9_]+(\{[^}]*\})? [0-9.e+-]+$')
+
+
+class MainMetricsTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(METRICS.configure)
+        self.write_de({"a": "Wert A", "b": "Wert B"})
+
+    def test_metrics_record_requests_retries_and_bytes_per_language(self):
+        rate_limited_once = set()
+
+        def fake_urlopen(req, timeout=None):
+            body = json.loads(req.data)
+            target = body["target_lang"]
+            if target == "FR" and target not in rate_limited_once:
+                rate_limited_once.add(target)
+                raise urllib.error.HTTPError(req.full_url, 429, "Too Many Requests", email.message.Message(), None)
+            text = body["text"][0]
+            return _FakeResponse(json.dumps({"translations": [{"text": f"[{target}] {text}"}]}).encode("utf-8"))
+
+        json_path = os.path.join(self.base_path, "metrics.json")
+        prom_path = os.path.join(self.base_path, "metrics.prom")
+        # Echtes translate_text_deepl - gezählt wird auf urlopen-Ebene.
+        self.run_main(
+            "--metrics-json", json_path, "--metrics-prom", prom_path,
+            patches=[mock.patch("urllib.request.urlopen", side_effect=fake_urlopen), mock.patch.object(usd.time, "sleep")],
+            fake_provider=False,
+        )
+
+        with open(json_path, encoding="utf-8") as f:
+            series = {e["lang"]: e for e in json.load(f)["series"]}
+        self.assertEqual(set(series), set(usd.TARGET_LANGS))
+        self.assertEqual((series["en"]["requests"], series["en"]["chars"]), (2, len("Wert A") + len("Wert B")))
+        self.assertEqual((series["fr"]["retries"], series["fr"]["rate_limited"]), (1, 1))
+        self.assertEqual(series["nl"]["retries"], 0)
+        en_files = [os.path.join(self.base_path, "en", "ns.json"), os.path.join(self.base_path, ".i18n_hash", "en_from_de.json")]
+        self.assertEqual(series["en"]["bytes_written"], sum(os.path.getsize(p) for p in en_files))
+        with open(prom_path, encoding="utf-8") as f:
+            self.assertIn('i18n_translate_requests_total{provider="deepl",lang="ru"} 2', f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
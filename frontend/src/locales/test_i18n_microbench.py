@@ -0,0 +1,57 @@
+"""
+Tests fuer i18n_microbench.py. Die eigentlichen Zeitmessungen laufen bewusst NICHT im
+Test-Suite (zu laut fuer CI-Gates ohne dedizierte Maschine) - geprueft werden die
+Eingaben, die Baseline-Vollstaendigkeit und die Vergleichslogik.
+
+Aufruf: python3 -m unittest test_i18n_microbench -v
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_microbench as mb  # noqa: E402
+
+
+class MicrobenchTests(unittest.TestCase):
+    def test_every_case_runs_and_produces_work(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            cases = dict(mb.build_cases(workdir))
+            self.assertGreater(len(cases["_flatten_dict"]()), 300)
+            self.assertTrue(all(isinstance(v, str) for v in cases["_get_node_by_path"]()))
+            used, dynamic = cases["check_i18n_usage.extract_keys_from_file"]()
+            self.assertGreater(len(used), 50)
+            self.assertIn("learn:", dynamic)
+
+    def test_committed_baseline_covers_all_cases(self):
+        with open(mb.BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with tempfile.TemporaryDirectory() as workdir:
+            names = [name for name, _ in mb.build_cases(workdir)]
+        self.assertEqual(sorted(baseline["cases"]), sorted(names))
+
+    def test_slowdown_beyond_tolerance_fails_loudly(self):
+        baseline = {"cases": {"a": {"ratio": 1.0, "ns_per_call": 1000.0}, "b": {"ratio": 1.0, "ns_per_call": 1000.0}}}
+        current = {"calibration_ns": 1.0, "cases": {"a": {"ratio": 1.2, "ns_per_call": 1200.0}, "b": {"ratio": 1.5, "ns_per_call": 1500.0}}}
+        regressions, notes = mb.compare(current, baseline, tolerance=0.3)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("REGRESSION b", regressions[0])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(baseline, f)
+            out = io.StringIO()
+            with mock.patch.object(mb, "measure", return_value=current), redirect_stdout(out):
+                rc = mb.main(["--baseline", path])
+        self.assertEqual(rc, 1)
+        self.assertIn("❌ REGRESSION b", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
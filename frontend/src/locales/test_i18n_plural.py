@@ -0,0 +1,95 @@
+"""
+Tests fuer i18n_plural.py (Pluralfamilien als Einheit, CLDR-Formen je Zielsprache).
+
+Aufruf: python3 -m unittest test_i18n_plural -v
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+from i18n_plural import build_unit, expand_families, parse_unit, plural_families  # noqa: E402
+
+
+class PluralUnitTests(unittest.TestCase):
+    def test_families_are_detected_per_level(self):
+        d = {"a_one": "x", "a_other": "y", "b_other": "nur other", "c_one": "z", "c_other": "mehr\nzeilig", "n": {"d_one": "1"}}
+        self.assertEqual(plural_families(d), {"a": {"one": "a_one", "other": "a_other"}})
+        # Auch ein mehrzeiliges _one neben genug einzeiligen Formen: keine Familie.
+        self.assertEqual(plural_families({"m_one": "eins\nzwei", "m_few": "x", "m_other": "y"}), {})
+        self.assertIsNone(build_unit({"one": "1 Ding", "other": "{{count}} Dinge\nzweite Zeile"}, "ru"))
+
+    def test_missing_categories_are_generated_from_other_with_sample_counts(self):
+        sources = {"one": "{{count}} quiz", "other": "{{count}} quizzes (3 rounds)"}
+        unit = build_unit(sources, "ru")
+        self.assertEqual([(c, s) for c, _, s in unit], [("one", None), ("few", "4"), ("many", "5"), ("other", None)])
+        self.assertEqual(unit[1][1], "4 quizzes (3 rounds)")
+        forms = parse_unit(unit, "{{count}} тест\n4 теста (3 раунда)\n5 тестов (3 раундов)\n{{count}} теста (3 раунда)", sources)
+        self.assertEqual(forms["few"], "{{count}} теста (3 раунда)")
+        self.assertEqual(forms["many"], "{{count}} тестов (3 раундов)")
+
+        fr_unit = build_unit(sources, "fr")
+        self.assertEqual([(c, line is None) for c, line, _ in fr_unit], [("one", False), ("many", True), ("other", False)])
+        self.assertEqual(parse_unit(fr_unit, "{{count}} quiz\n{{count}} quiz", sources)["many"], "{{count}} quiz")
+        self.assertIsInstance(parse_unit(unit, "{{count}} тест\n{{count}} теста", sources), str)
+
+    def test_family_is_invalidated_as_a_whole(self):
+        flat = ["g.n_one", "g.n_other", "g.x", "h_one"]
+        self.assertEqual(expand_families({"g.n_one", "g.x"}, flat), {"g.n_one", "g.n_other", "g.x"})
+
+
+class MainPluralTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._write_de("{{count}} Quiz")
+
+    def _write_de(self, one):
+        self.write_de({"stats": {"quiz_one": one, "quiz_other": "{{count}} Quizze"}, "a": "Wert"})
+
+    def translate(self, text, target_lang):
+        return "\n".join(f"[{target_lang}] {line}" for line in text.split("\n"))
+
+    def _read(self, lang):
+        return self.read_lang(lang)["stats"]
+
+    def test_family_is_one_request_and_gets_all_target_forms(self):
+        self.run_main()
+        family_calls = [c for c in self.calls if "Quiz" in c[1]]
+        self.assertEqual(len(family_calls), len(usd.TARGET_LANGS), "eine Anfrage je Familie und Sprache")
+        self.assertEqual(self._read("en"), {"quiz_one": "[en] {{count}} Quiz", "quiz_other": "[en] {{count}} Quizze"})
+        self.assertEqual(self._read("ru"), {
+            "quiz_one": "[ru] [en] {{count}} Quiz",
+            "quiz_other": "[ru] [en] {{count}} Quizze",
+            "quiz_few": "[ru] [en] {{count}} Quizze",
+            "quiz_many": "[ru] [en] {{count}} Quizze",
+        })
+        self.assertIn(("ru", "[en] {{count}} Quiz\n[en] 3 Quizze\n[en] 5 Quizze\n[en] {{count}} Quizze"), self.calls)
+        self.assertEqual(sorted(self._read("hr")), ["quiz_few", "quiz_one", "quiz_other"])
+        self.assertEqual(self._read("fr")["quiz_many"], self._read("fr")["quiz_other"])
+
+        # Nur _one ändert sich → die ganze Familie wird neu übersetzt, _few bleibt beim Prunen.
+        self._write_de("Ein Quiz")
+        self.calls.clear()
+        self.run_main("--prune-extra")
+        self.assertIn(("en", "Ein Quiz\n{{count}} Quizze"), self.calls)
+        self.assertEqual(self._read("ru")["quiz_few"], "[ru] [en] {{count}} Quizze")
+        self.assertEqual(self._read("ru")["quiz_one"], "[ru] [en] Ein Quiz")
+
+    def test_multiline_form_is_translated_member_by_member_and_not_retried(self):
+        self.write_de({"stats": {"quiz_one": "{{count}} Quiz", "quiz_other": "{{count}} Quizze\nzweite Zeile"}})
+        self.run_main()
+        self.assertIn(("en", "{{count}} Quizze\nzweite Zeile"), self.calls)
+        self.assertIn(("en", "{{count}} Quiz"), self.calls)
+        self.assertEqual(self._read("ru"), {
+            "quiz_one": "[ru] [en] {{count}} Quiz",
+            "quiz_other": "[ru] [en] {{count}} Quizze\n[ru] [en] zweite Zeile",
+        })
+        self.calls.clear()
+        self.run_main()
+        self.assertEqual(self.calls, [], "nichts bleibt offen, kein erneuter Versuch")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests fuer i18n_profile.py (--profile / --profile-out).
+
+Aufruf: python3 -m unittest test_i18n_profile -v
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_profile  # noqa: E402
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_profile import PROFILE, PhaseProfiler  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+
+
+class PhaseProfilerTests(unittest.TestCase):
+    def test_disabled_profiler_records_nothing(self):
+        prof = PhaseProfiler()
+        with prof.phase("phase-a", "ns"):
+            pass
+        self.assertEqual(prof.stats, {})
+
+    def test_nested_phase_inherits_namespace_and_is_excluded_from_self_time(self):
+        prof = PhaseProfiler()
+        prof.configure(True)
+        clock = iter([0.0, 1.0, 4.0, 10.0])
+        with mock.patch.object(i18n_profile.time, "perf_counter", lambda: next(clock)):
+            with prof.phase("phase-b:fr", "quiz"):
+                with prof.phase("provider"):
+                    pass
+        outer = prof.stats[("phase-b:fr", "quiz")]
+        inner = prof.stats[("provider", "quiz")]
+        self.assertEqual((outer.wall, outer.self_wall), (10.0, 7.0))
+        self.assertEqual((inner.wall, inner.self_wall, inner.calls), (3.0, 3.0, 1))
+        self.assertEqual(prof.by_phase()["provider"].calls, 1)
+
+
+class MainProfileTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(PROFILE.configure, False)
+        self.write_de({"a": "Wert A", "b": {"c": "Wert C"}})
+
+    def test_profile_reports_phases_per_namespace_and_dumps_cprofile(self):
+        stats_path = os.path.join(self.base_path, "run.pstats")
+        text = self.run_main("--profile-out", stats_path)
+
+        phases = {name for name, _ in PROFILE.stats}
+        expected = {"source-sync", "collision-check", "plan", "phase-a", "save", "manifest", "provider", "parse"}
+        expected |= {f"phase-b:{lang}" for lang in usd.TARGET_LANGS if lang != "en"}
+        self.assertTrue(expected <= phases, sorted(expected - phases))
+        self.assertEqual(PROFILE.stats[("provider", "ns")].calls, 2 * len(usd.TARGET_LANGS))
+        self.assertEqual(PROFILE.stats[("phase-b:fr", "ns")].calls, 1)
+        self.assertIn("⏱️  Profil", text)
+        self.assertIn("Phase × Namespace", text)
+        self.assertTrue(os.path.getsize(stats_path) > 0)
+        self.assertIn("merge_keys_missing_or_changed", text, "cProfile-Auszug fehlt")
+
+
+if __name__ == "__main__":
+    unittest.main()
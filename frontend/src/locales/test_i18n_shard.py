@@ -0,0 +1,180 @@
+"""
+Tests fuer i18n_shard.py (--shard i/N, Teil-Manifeste, merge).
+
+Aufruf: python3 -m unittest test_i18n_shard -v
+"""
+import io
+import json
+import os
+import shutil
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_shard  # noqa: E402
+from i18n_budget import load_checkpoint, write_checkpoint  # noqa: E402
+from i18n_status import load_failures, record_failures  # noqa: E402
+from i18n_shard import assign_units, build_units, merge_partials, owner_namespace, parse_shard_spec  # noqa: E402
+from i18n_testsupport import MainRunMixin, write_json  # noqa: E402
+
+
+class PlanTests(unittest.TestCase):
+    def test_parse_shard_spec(self):
+        self.assertEqual(parse_shard_spec("2/3"), (2, 3))
+        for bad in ("0/3", "4/3", "1", "a/b", "1/0"):
+            with self.assertRaises(ValueError):
+                parse_shard_spec(bad)
+
+    def test_units_are_balanced_by_chars_and_keep_pending_pivots_together(self):
+        job_chars = {("a", "en"): 0, ("a", "fr"): 10, ("b", "fr"): 9, ("b", "ru"): 8, ("c", "en"): 1, ("c", "fr"): 0}
+        units = build_units(job_chars, pivot_pending={"c"})
+        self.assertEqual(units["c"], ([("c", "en"), ("c", "fr")], 1))
+        assignment = assign_units(units, 2)
+        self.assertEqual(assignment, {"a/fr": 1, "b/fr": 2, "b/ru": 2, "c": 1, "a/en": 1})
+        self.assertEqual(assign_units(units, 2), assignment, "deterministisch")
+
+    def test_manifest_keys_belong_to_the_longest_namespace(self):
+        self.assertEqual(owner_namespace("quiz.ui.title", ["quiz", "quiz.ui"]), "quiz.ui")
+        self.assertEqual(owner_namespace("quiz.l1.title", ["quiz", "quiz.ui"]), "quiz")
+        self.assertIsNone(owner_namespace("other.x", ["quiz"]))
+
+
+class MainShardTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(i18n_shard.SHARD.configure, None)
+        self.broken = set()
+
+    def _make_tree(self, name):
+        base_path = os.path.join(self.root, name)
+        for ns, n in (("big", 6), ("mid", 3), ("small", 1), ("tiny", 1)):
+            write_json(os.path.join(base_path, "de", f"{ns}.json"), {f"k{i}": f"Text {ns} {i} " + "x" * (20 * n) for i in range(n)})
+        return base_path
+
+    def translate(self, text, target_lang):
+        if (target_lang.lower(), text.split(" ")[-3]) in self.broken:
+            return None
+        return f"[{target_lang}] {text}"
+
+    def _run(self, base_path, *extra):
+        self.run_main(*extra, base_path=base_path)
+
+    def _manifests(self, base_path):
+        hash_dir = os.path.join(base_path, ".i18n_hash")
+        out = {}
+        for fname in sorted(os.listdir(hash_dir)):
+            if fname.endswith(".json") and "_from_" in fname:
+                with open(os.path.join(hash_dir, fname), encoding="utf-8") as f:
+                    out[fname] = json.load(f)
+        return out
+
+    def test_shards_split_the_work_and_merge_to_the_unsharded_result(self):
+        reference = self._make_tree("reference")
+        self._run(reference)
+        expected_calls = sorted(self.calls)
+
+        sharded = self._make_tree("sharded")
+        per_shard = []
+        for i in (1, 2):
+            self.calls = []
+            self._run(sharded, "--shard", f"{i}/2")
+            per_shard.append(set(self.calls))
+        self.assertFalse(per_shard[0] & per_shard[1], "kein Job doppelt")
+        self.assertEqual(sorted(per_shard[0] | per_shard[1]), expected_calls)
+        self.assertTrue(per_shard[0] and per_shard[1])
+        self.assertEqual(self._manifests(sharded), {}, "Shards schreiben keine kanonischen Manifeste")
+
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(i18n_shard.main(["merge", "--base-path", sharded]), 0)
+        self.assertEqual(self._manifests(sharded), self._manifests(reference))
+        self.assertFalse(os.path.exists(os.path.join(sharded, ".i18n_hash", "shards")))
+
+        # Neue Zielsprache simuliert: fr/ru fehlen komplett, EN ist aktuell → Jobs je Sprache,
+        # kein Shard übersetzt EN.
+        for lang in ("fr", "ru"):
+            shutil.rmtree(os.path.join(sharded, lang))
+        per_shard = []
+        for i in (1, 2):
+            self.calls = []
+            self._run(sharded, "--shard", f"{i}/2")
+            per_shard.append(self.calls)
+        self.assertEqual({lang for calls in per_shard for lang, _ in calls}, {"fr", "ru"})
+        self.assertTrue(per_shard[0] and per_shard[1])
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(i18n_shard.main(["merge", "--base-path", sharded]), 0)
+        for lang in ("fr", "ru"):
+            self.assertEqual(len(os.listdir(os.path.join(sharded, lang))), 4)
+
+    def test_failures_of_sharded_runs_are_merged_into_failed_json(self):
+        base_path = self._make_tree("tree")
+        hash_dir = os.path.join(base_path, ".i18n_hash")
+        record_failures(hash_dir, {("tiny", "fi"): {"k0"}})
+        self.broken = {("fi", "big")}
+        for i in (1, 2):
+            self._run(base_path, "--shard", f"{i}/2")
+        self.assertEqual(load_failures(hash_dir), {"fi": {"tiny": {"k0"}}}, "Shards schreiben failed.json nicht direkt")
+
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(i18n_shard.main(["merge", "--base-path", base_path]), 0)
+        # tiny/fi lief fehlerfrei und wird entfernt, big/fi kommt aus dem Teil-failed.json.
+        self.assertEqual(load_failures(hash_dir), {"fi": {"big": {f"k{i}" for i in range(6)}}})
+
+    def test_checkpoints_of_sharded_runs_are_merged(self):
+        base_path = self._make_tree("tree")
+        hash_dir = os.path.join(base_path, ".i18n_hash")
+        # Eintrag eines Namespaces, den kein Shard bearbeitet - bleibt über alle Läufe stehen.
+        write_checkpoint(hash_dir, {"fr": {"gone": {"k0"}}}, "max-chars", 1)
+        for i in (1, 2):
+            self._run(base_path, "--shard", f"{i}/2", "--max-chars", "1")
+        self.assertEqual(load_checkpoint(hash_dir), {"fr": {"gone": {"k0"}}}, "Shards schreiben checkpoint.json nicht direkt")
+        shard_checkpoints = [load_checkpoint(os.path.join(hash_dir, "shards", f"{i}-of-2")) for i in (1, 2)]
+        own = [{(lang, ns) for lang, by_ns in cp.items() for ns in by_ns} - {("fr", "gone")} for cp in shard_checkpoints]
+        self.assertTrue(own[0] and own[1])
+        self.assertFalse(own[0] & own[1])
+
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(i18n_shard.main(["merge", "--base-path", base_path]), 0)
+        merged = load_checkpoint(hash_dir)
+        self.assertEqual({(lang, ns) for lang, by_ns in merged.items() for ns in by_ns}, own[0] | own[1] | {("fr", "gone")})
+        for cp in shard_checkpoints:
+            for lang, by_ns in cp.items():
+                for ns, keys in by_ns.items():
+                    self.assertEqual(merged[lang][ns], keys)
+
+        # Ohne Budget laufen beide Shards durch - übrig bleibt nur der fremde Eintrag.
+        for i in (1, 2):
+            self._run(base_path, "--shard", f"{i}/2")
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(i18n_shard.main(["merge", "--base-path", base_path]), 0)
+        self.assertEqual(load_checkpoint(hash_dir), {"fr": {"gone": {"k0"}}})
+
+    def test_merge_refuses_missing_shards_and_conflicts(self):
+        base_path = self._make_tree("tree")
+        self._run(base_path, "--shard", "1/2")
+        hash_dir = os.path.join(base_path, ".i18n_hash")
+        report = merge_partials(hash_dir)
+        self.assertEqual(report.errors, ["Shard(s) nicht (vollständig) gelaufen: 2/2"])
+
+        self._run(base_path, "--shard", "2/2")
+        shard_dir = os.path.join(hash_dir, "shards", "1-of-2")
+        fname = next(f for f in sorted(os.listdir(shard_dir)) if f.startswith("en_"))
+        with open(os.path.join(shard_dir, fname), encoding="utf-8") as f:
+            part = json.load(f)
+        part["shard"] = "2/2"
+        key = next(iter(part["entries"]))
+        part["entries"][key] = "0" * 64
+        os.makedirs(os.path.join(hash_dir, "shards", "extra"))
+        with open(os.path.join(hash_dir, "shards", "extra", fname), "w", encoding="utf-8") as f:
+            json.dump(part, f)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(i18n_shard.main(["merge", "--base-path", base_path]), 1)
+        self.assertIn(f"von Shard 1/2 und 2/2 bearbeitet", out.getvalue())
+        self.assertIn(f"{key} hat in Shard 1/2 und 2/2 verschiedene Hashes", out.getvalue())
+        self.assertEqual(self._manifests(base_path), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests fuer i18n_source_sync.py (inkrementeller Quell-Sync data/learn -> DE-Namespaces).
+
+Aufruf: python3 -m unittest test_i18n_source_sync -v
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+import i18n_source_sync  # noqa: E402
+from i18n_source_sync import SourceSpec, extract_lessons, extract_quiz_refs, insert_missing, resolves, sync_sources  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        if isinstance(data, str):
+            f.write(data)
+        else:
+            json.dump(data, f, ensure_ascii=False)
+
+
+class MergeTests(unittest.TestCase):
+    def test_insert_missing_copies_only_the_path_to_new_keys(self):
+        untouched = {"title": "Alt"}
+        doc = {"lesson1": {"title": "Bestehend"}, "other": untouched}
+        merged, added, diffs = insert_missing(doc, {("lesson1", "title"): "Neu", ("lesson1", "goal"): "Ziel", ("lesson2", "title"): "Zwei"})
+        self.assertEqual(added, {"lesson1.goal", "lesson2.title"})
+        self.assertEqual(diffs, ["lesson1.title"])
+        self.assertEqual(merged["lesson1"], {"title": "Bestehend", "goal": "Ziel"})
+        self.assertEqual(doc, {"lesson1": {"title": "Bestehend"}, "other": untouched}, "Original bleibt unverändert")
+        self.assertIs(merged["other"], untouched)
+
+        same, added, _ = insert_missing(merged, {("lesson2", "title"): "Zwei"})
+        self.assertIs(same, merged)
+        self.assertEqual(added, set())
+
+    def test_resolves_follows_i18next_literal_dot_keys(self):
+        doc = {"l1": {"q1": {"a": "Antwort", "a.fb": "Feedback"}}}
+        self.assertTrue(resolves(doc, "l1.q1.a.fb"))
+        self.assertTrue(resolves(doc, "l1.q1"))
+        self.assertFalse(resolves(doc, "l1.q1.b.fb"))
+
+
+class SyncSourcesTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.de_dir = os.path.join(self.root, "locales", "de")
+        self.hash_dir = os.path.join(self.root, "locales", ".i18n_hash")
+        _write(os.path.join(self.de_dir, "learn.json"), {"lesson1": {"title": "Gepflegt"}})
+        _write(os.path.join(self.de_dir, "quiz.json"), {"l1": {"title": "Quiz 1", "q1": {"a": "x", "a.fb": "y"}}})
+        _write(os.path.join(self.root, "data", "learn", "lessons.json"), [{"id": "lesson1", "title": "Original", "goal": "Ziel"}])
+        _write(os.path.join(self.root, "data", "learn", "quiz", "lesson1.json"),
+               {"titleKey": "quiz:l1.title", "questions": [{"questionKey": "quiz:l1.q1.question", "options": [{"feedbackKey": "quiz:l1.q1.a.fb"}]}]})
+        self.calls = []
+
+        def counting(extract):
+            def wrapped(files):
+                self.calls.append(extract.__name__)
+                return extract(files)
+            return wrapped
+
+        lessons, quiz = i18n_source_sync.SOURCES[:2]
+        self.sources = (
+            SourceSpec(lessons.name, lessons.pattern, lessons.namespace, lessons.kind, counting(extract_lessons)),
+            SourceSpec(quiz.name, quiz.pattern, quiz.namespace, quiz.kind, counting(extract_quiz_refs)),
+        )
+
+    def _sync(self):
+        return sync_sources(self.de_dir, self.hash_dir, usd.save_json, self.sources)
+
+    def test_unchanged_sources_are_skipped_and_keep_reporting(self):
+        with redirect_stdout(io.StringIO()):
+            first = self._sync()
+        self.assertEqual(first.added, {"learn": {"lesson1.goal", "lesson1.task", "lesson1.learningOutcome", "lesson1.reward"}})
+        self.assertEqual(first.diffs, {"lessons": ["lesson1.title"]})
+        self.assertEqual(first.dangling, {"quiz": ["l1.q1.question"]})
+        with open(os.path.join(self.de_dir, "learn.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["lesson1"]["title"], "Gepflegt")
+
+        self.calls.clear()
+        second = self._sync()
+        self.assertEqual(self.calls, [], "unveränderte Quellen werden nicht geparst")
+        self.assertEqual(second.skipped, ["lessons", "quiz"])
+        self.assertEqual(second.added, {})
+        self.assertEqual(second.dangling, {"quiz": ["l1.q1.question"]})
+
+        # Der fehlende DE-Text wird nachgetragen → Zieldatei geändert → nur quiz neu geprüft.
+        _write(os.path.join(self.de_dir, "quiz.json"), {"l1": {"title": "Quiz 1", "q1": {"question": "?", "a": "x", "a.fb": "y"}}})
+        third = self._sync()
+        self.assertEqual(self.calls, ["extract_quiz_refs"])
+        self.assertEqual(third.dangling, {})
+
+
+class MainSourceSyncTests(MainRunMixin, unittest.TestCase):
+    def test_synced_keys_are_translated_even_in_a_scoped_force_key_run(self):
+        # data/learn liegt neben dem Locales-Verzeichnis (siehe i18n_source_sync.py).
+        self.base_path = os.path.join(self.root, "locales")
+        self.write_de({"ok": "Fertig"}, ns="common")
+        _write(os.path.join(self.root, "data", "learn", "lessons.json"), [{"id": "lesson1", "title": "Grundlagen"}])
+
+        out = self.run_main("--force-key", "common.ok")
+        self.assertIn("INFO: de/learn.json aus Lern-Daten ergänzt: 5 Key(s)", out)
+        self.assertEqual(self.read_lang("fr", ns="learn")["lesson1"]["title"], "[fr] [en] Grundlagen")
+        with open(os.path.join(self.hash_dir, "source_sync.json"), encoding="utf-8") as f:
+            self.assertIn("lessons", json.load(f)["sources"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Startzeit-Budget fuer die i18n-CLI-Einstiegspunkte.
+
+sync_i18n_hashes.py und check_i18n_usage.py laufen u.a. als Pre-Commit-Hook, das
+Uebersetzungsskript wird von jedem Testmodul importiert. Provider-SDKs (openai),
+urllib/http, subprocess und argparse duerfen deshalb erst geladen werden, wenn ein
+Lauf sie tatsaechlich braucht. Gemessen wird jeweils in einem frischen Interpreter
+(bestes von IMPORT_RUNS), das Budget laesst sich fuer langsame CI-Runner per
+I18N_IMPORT_BUDGET_MS anheben.
+
+Aufruf: python3 -m unittest test_i18n_startup -v
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+LOCALES_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_BUDGET_MS = float(os.getenv("I18N_IMPORT_BUDGET_MS", "250"))
+IMPORT_RUNS = 3
+HEAVY_MODULES = ("openai", "urllib.request", "http.client", "subprocess", "argparse")
+
+_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - t) * 1000
+print(json.dumps({{"ms": elapsed_ms, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _probe_import(module: str) -> tuple[float, set[str]]:
+    best = float("inf")
+    modules: set[str] = set()
+    for _ in range(IMPORT_RUNS):
+        res = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            cwd=LOCALES_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        data = json.loads(res.stdout.strip().splitlines()[-1])
+        best = min(best, data["ms"])
+        modules = set(data["modules"])
+    return best, modules
+
+
+class ImportBudgetTests(unittest.TestCase):
+    ENTRY_POINTS = ("i18n_core", "sync_i18n_hashes", "check_i18n_usage", "UpdateSprachdateienBasierendAufDE")
+
+    def test_entry_points_import_within_budget_and_without_heavy_modules(self):
+        for module in self.ENTRY_POINTS:
+            with self.subTest(module=module):
+                ms, loaded = _probe_import(module)
+                self.assertLess(ms, IMPORT_BUDGET_MS, f"Import von {module} dauerte {ms:.1f} ms")
+                heavy = sorted(m for m in HEAVY_MODULES if m in loaded)
+                self.assertEqual(heavy, [], f"{module} laedt beim Import bereits {heavy}")
+
+    def test_hash_sync_does_not_import_translation_script(self):
+        _, loaded = _probe_import("sync_i18n_hashes")
+        self.assertNotIn("UpdateSprachdateienBasierendAufDE", loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests fuer i18n_status.py (Offline-Status Namespace x Sprache, failed.json).
+
+Aufruf: python3 -m unittest test_i18n_status -v
+"""
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import i18n_status  # noqa: E402
+from i18n_status import compute_status, load_failures, record_failures  # noqa: E402
+from i18n_testsupport import MainRunMixin, write_json  # noqa: E402
+
+
+def _sha(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ComputeStatusTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = tmp.name
+        self.hash_dir = os.path.join(self.base, ".i18n_hash")
+        write_json(os.path.join(self.base, "de", "ns.json"), {"a": "A", "g": {"b": "B neu"}, "n_one": "1 Ding", "n_other": "{{count}} Dinge"})
+        en = {"a": "A", "g": {"b": "B"}, "n_one": "1 thing", "n_other": "{{count}} things"}
+        write_json(os.path.join(self.base, "en", "ns.json"), en)
+        write_json(os.path.join(self.hash_dir, "en_from_de.json"),
+               {"ns.a": _sha("A"), "ns.g.b": _sha("B"), "ns.n_one": _sha("1 Ding"), "ns.n_other": _sha("{{count}} Dinge")})
+        write_json(os.path.join(self.base, "ru", "ns.json"), {"a": "А", "n_one": "1", "n_few": "3", "n_many": "5", "n_other": "x", "old": "alt"})
+        write_json(os.path.join(self.hash_dir, "ru_from_en.json"), {"ns.a": _sha("A"), "ns.n_one": _sha("1 thing"), "ns.n_other": "veraltet"})
+        record_failures(self.hash_dir, {("ns", "ru"): {"n_other", "a"}, ("ns", "fr"): set()})
+
+    def test_matrix_counts_per_namespace_and_language(self):
+        status = compute_status(self.base, lang_globs=["en", "ru"])
+        self.assertEqual(status["langs"], ["en", "ru"])
+        self.assertEqual(status["cells"]["ns"]["en"], {"missing": [], "stale": ["g.b"], "extra": [], "failed": []})
+        # n_few/n_many sind Pluralformen der Quell-Familie, nicht überzählig; "a" ist
+        # inzwischen aktuell und zählt nicht mehr als gescheitert.
+        self.assertEqual(status["cells"]["ns"]["ru"], {"missing": ["g.b"], "stale": ["n_other"], "extra": ["old"], "failed": ["n_other"]})
+        self.assertTrue(status["outdated"])
+        self.assertIn("ns         V1  F1 V1 Ü1 G1", i18n_status.render_matrix(status))
+
+    def test_plural_forms_the_target_needs_count_as_missing(self):
+        write_json(os.path.join(self.base, "ru", "ns.json"), {"a": "А", "g": {"b": "Б"}, "n_one": "1", "n_few": "3", "n_other": "x"})
+        write_json(os.path.join(self.base, "hr", "ns.json"), {"a": "A", "g": {"b": "B"}, "n_one": "1", "n_other": "x"})
+        status = compute_status(self.base, lang_globs=["ru", "hr"])
+        self.assertEqual(status["cells"]["ns"]["ru"]["missing"], ["n_many"])
+        self.assertEqual(status["cells"]["ns"]["hr"]["missing"], ["n_few"])
+
+    def test_cli_json_and_exit_code(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(i18n_status.main(["--base-path", self.base, "--lang", "en", "--json", "-"]), 1)
+        self.assertEqual(json.loads(out.getvalue())["totals"], {"en": {"missing": 0, "stale": 1, "extra": 0, "failed": 0}})
+
+        write_json(os.path.join(self.base, "de", "ns.json"), {"a": "A", "g": {"b": "B"}, "n_one": "1 Ding", "n_other": "{{count}} Dinge"})
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(i18n_status.main(["--base-path", self.base, "--lang", "en"]), 0)
+        self.assertIn("✅ Alle Übersetzungen aktuell.", out.getvalue())
+
+    def test_record_failures_replaces_only_the_given_jobs(self):
+        record_failures(self.hash_dir, {("other", "ru"): {"x"}})
+        self.assertEqual(load_failures(self.hash_dir), {"ru": {"ns": {"a", "n_other"}, "other": {"x"}}})
+        record_failures(self.hash_dir, {("ns", "ru"): set(), ("other", "ru"): set()})
+        self.assertFalse(os.path.exists(os.path.join(self.hash_dir, i18n_status.FAILED_FILE)))
+
+
+class MainFailuresTests(MainRunMixin, unittest.TestCase):
+    def test_translation_run_records_and_clears_failed_keys(self):
+        self.write_de({"ok": "Gut", "bad": "Kaputt"})
+        broken = {"fi"}
+        self.translate = lambda text, target_lang: None if target_lang.lower() in broken and "Kaputt" in text else f"[{target_lang}] {text}"
+
+        self.run_main()
+        status = compute_status(self.base_path)
+        self.assertEqual(status["cells"]["ns"]["fi"]["failed"], ["bad"])
+        # Fallback auf den Quelltext: vorhanden, aber nicht im Manifest.
+        self.assertEqual(status["cells"]["ns"]["fi"]["stale"], ["bad"])
+        self.assertEqual({lang for lang, t in status["totals"].items() if any(t.values())}, {"fi"})
+
+        broken.clear()
+        self.run_main()
+        self.assertFalse(compute_status(self.base_path)["outdated"])
+        self.assertEqual(load_failures(self.hash_dir), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
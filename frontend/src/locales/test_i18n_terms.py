@@ -0,0 +1,91 @@
+"""
+Tests fuer i18n_terms.py (glossar-gesteuerter Begriffsschutz, Aho-Corasick).
+
+Aufruf: python3 -m unittest test_i18n_terms -v
+"""
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+from i18n_terms import TERMS, TermMatcher, load_term_list  # noqa: E402
+from i18n_testsupport import MainRunMixin, write_json  # noqa: E402
+
+
+def _naive_find(terms, text):
+    """Referenz: alle Ganzwort-Treffer je Begriff per Regex, dann links-zuerst/laengster."""
+    hits = []
+    for term in terms:
+        for m in re.finditer(r"(?<!\w)" + re.escape(term) + r"(?!\w)", text):
+            hits.append((m.start(), m.end()))
+    hits.sort(key=lambda h: (h[0], -h[1]))
+    chosen = []
+    for start, end in hits:
+        if not chosen or start >= chosen[-1][1]:
+            chosen.append((start, end))
+    return chosen
+
+
+class TermMatcherTests(unittest.TestCase):
+    def test_matches_whole_words_leftmost_longest(self):
+        m = TermMatcher(["XLM", "Stellar", "Stellar Network", "MEMO_RETURN", "Net"])
+        ph: dict = {"__KEEP_EN_TERM_1__": "Multi-Signature"}
+        masked = m.mask("XLMs im Stellar Network, XLM via MEMO_RETURN-Memo, Stellar.", ph)
+        self.assertEqual(masked, "XLMs im __KEEP_EN_TERM_2__, __KEEP_EN_TERM_3__ via __KEEP_EN_TERM_4__-Memo, __KEEP_EN_TERM_5__.")
+        self.assertEqual(ph["__KEEP_EN_TERM_2__"], "Stellar Network")
+        self.assertEqual(usd.restore_parenthesized_english(masked, ph), "XLMs im Stellar Network, XLM via MEMO_RETURN-Memo, Stellar.")
+
+    def test_agrees_with_per_term_regex_on_random_text(self):
+        rng = random.Random(3)
+        alphabet = "ab c"
+        terms = sorted({"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(30)})
+        m = TermMatcher(terms)
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            self.assertEqual(m.find(text), _naive_find(terms, text), text)
+
+    def test_restore_tolerates_provider_whitespace_and_keeps_unknown_placeholders(self):
+        mapping = {"__KEEP_EN_TERM_1__": "XLM", "__KEEP_EN_TERM_10__": "Stellar"}
+        self.assertEqual(
+            usd.restore_parenthesized_english("__ KEEP_EN_TERM_1__ / __KEEP_EN_TERM_10__ / __KEEP_EN_TERM_2__", mapping),
+            "XLM / Stellar / __KEEP_EN_TERM_2__",
+        )
+
+    def test_term_list_from_config_and_glossary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(load_term_list(tmp), [])
+            for lang, title in (("de", "Konto"), ("en", "Account"), ("fr", "Compte")):
+                os.makedirs(os.path.join(tmp, lang))
+                with open(os.path.join(tmp, lang, "glossary.json"), "w", encoding="utf-8") as f:
+                    json.dump({
+                        "account": {"title": title, "original": "Account"},
+                        "airdrop": {"title": "Airdrop", "original": "Airdrop"},
+                        "bridge": {"title": "Bridge", "original": "Bridge"},
+                    }, f)
+            with open(os.path.join(tmp, "i18n_terms.json"), "w", encoding="utf-8") as f:
+                json.dump({"terms": ["XLM"], "fromGlossary": True, "exclude": ["Bridge"]}, f)
+            self.assertEqual(load_term_list(tmp), ["Airdrop", "XLM"])
+
+
+class MainTermProtectionTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(TERMS.configure, ())
+        self.write_de({"a": "Sende XLM über Stellar (Multi-Signature)", "b": "Kein Begriff"})
+        write_json(os.path.join(self.base_path, "i18n_terms.json"), {"terms": ["XLM", "Stellar"]})
+
+    def test_terms_are_masked_for_provider_and_restored_in_every_language(self):
+        self.run_main()
+        self.assertIn(("en", "Sende __KEEP_EN_TERM_2__ über __KEEP_EN_TERM_3__ (__KEEP_EN_TERM_1__)"), self.calls)
+        self.assertIn(("fr", "[en] Sende __KEEP_EN_TERM_1__ über __KEEP_EN_TERM_2__ (Multi-Signature)"), self.calls)
+        self.assertFalse(any("XLM" in text or "Stellar" in text for _, text in self.calls))
+        self.assertEqual(self.read_lang("fr")["a"], "[fr] [en] Sende XLM über Stellar (Multi-Signature)")
+
+
+if __name__ == "__main__":
+    unittest.main()
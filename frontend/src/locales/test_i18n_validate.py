@@ -0,0 +1,88 @@
+"""
+Tests fuer i18n_validate.py und die Validierungs-Stufe in UpdateSprachdateienBasierendAufDE.
+
+Aufruf: python3 -m unittest test_i18n_validate -v
+"""
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from i18n_testsupport import MainRunMixin  # noqa: E402
+from i18n_validate import VALIDATION, extract_tokens, length_ratio_failure, structural_failure  # noqa: E402
+
+
+class StructuralCheckTests(unittest.TestCase):
+    def test_tokens_are_extracted_in_one_pass_and_normalized(self):
+        tokens = extract_tokens("Hallo {{ name }}, <0>klick</0><1/> $t(common.ok) {{count, number}}")
+        self.assertEqual(sorted(tokens["interpolation"]), ["{{count, number}}", "{{name}}"])
+        self.assertEqual(sorted(tokens["tags"]), ["</0>", "<0>", "<1/>"])
+        self.assertEqual(list(tokens["nesting"]), ["$t(common.ok)"])
+
+    def test_each_structural_break_has_its_own_reason(self):
+        src = extract_tokens("An {{address}}: <0>Details</0> $t(common.ok)")
+        self.assertIsNone(structural_failure(src, "To {{ address }}: <0>details</0> $t(common.ok)"))
+        self.assertEqual(structural_failure(src, "À {{adresse}} : <0>détails</0> $t(common.ok)"),
+                         ("interpolation", "-{{address}} +{{adresse}}"))
+        self.assertEqual(structural_failure(src, "To {{address}}: details</0> $t(common.ok)")[0], "tags")
+        self.assertEqual(structural_failure(src, "To {{address}}: <0>details</0> $t(common.okay)")[0], "nesting")
+        self.assertEqual(structural_failure(src, "To {{address}}: <0>x</0> $t(common.ok) __KEEP_EN_TERM_1__")[0], "keep_placeholder")
+
+    def test_length_ratio_only_for_long_sources(self):
+        self.assertIsNone(length_ratio_failure("Ja", "Yes, absolutely, without any doubt"))
+        self.assertIsNone(length_ratio_failure("Dieser Satz ist lang genug", "This sentence is long enough"))
+        self.assertEqual(length_ratio_failure("Dieser Satz ist lang genug", "OK"), "0.08")
+
+
+class MainValidationTests(MainRunMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write_de({"to": "An {{address}}", "term": "Mehrfachsignatur (Multi-Signature)", "ok": "Fertig"})
+
+    def test_broken_translations_are_rejected_per_check_and_retried(self):
+        def translate(text, target_lang):
+            if target_lang == "fr" and "{{address}}" in text:
+                return text.replace("{{address}}", "{{adresse}}")
+            if target_lang == "en" and "__KEEP_EN_TERM_1__" in text:
+                return "Multi signature"
+            return f"[{target_lang}] {text}"
+
+        self.translate = translate
+        out = self.run_main()
+
+        fr = self.read_lang("fr")
+        self.assertEqual(fr["to"], "[en] An {{address}}", "kaputte Interpolation → Quelltext (EN-Pivot) übernommen")
+        self.assertEqual(fr["ok"], "[fr] [en] Fertig")
+        self.assertEqual(self.read_lang("en")["term"], "Mehrfachsignatur (Multi-Signature)")
+
+        with open(os.path.join(self.hash_dir, "fr_from_en.json"), encoding="utf-8") as f:
+            man_fr = json.load(f)
+        self.assertNotIn("ns.to", man_fr)
+        self.assertIn("ns.ok", man_fr)
+
+        self.assertEqual(VALIDATION.failures["interpolation"], 1)
+        self.assertEqual(VALIDATION.failures["keep_placeholder"], 1)
+        self.assertIn("Validierung 'interpolation' für to fehlgeschlagen (-{{address}} +{{adresse}})", out)
+        self.assertIn("Zusammenfassung Validierung:", out)
+
+    def test_suspicious_length_ratio_is_reported_but_not_retried(self):
+        self.write_de({"long": "Dieser Satz ist lang genug", "ok": "Fertig"})
+        self.translate = lambda text, target_lang: "OK" if text.startswith("Dieser Satz") else f"[{target_lang}] {text}"
+
+        self.run_main()
+        self.assertTrue(self.calls)
+        self.assertEqual(VALIDATION.failures["length_ratio"], 1)
+        self.assertEqual(self.read_lang("en")["long"], "OK")
+        with open(os.path.join(self.hash_dir, "en_from_de.json"), encoding="utf-8") as f:
+            self.assertIn("ns.long", json.load(f))
+        with open(os.path.join(self.hash_dir, "failed.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["failed"], {"en": {"ns": ["long"]}})
+
+        self.calls.clear()
+        self.run_main()
+        self.assertEqual(self.calls, [], "verdächtige Übersetzung hat ihren Manifest-Eintrag")
+
+
+if __name__ == "__main__":
+    unittest.main()
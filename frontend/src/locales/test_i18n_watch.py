@@ -0,0 +1,78 @@
+"""
+Tests fuer i18n_watch.py (--watch: Polling mit Entprellung, inkrementelle Folgelaeufe).
+
+Aufruf: python3 -m unittest test_i18n_watch -v
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import UpdateSprachdateienBasierendAufDE as usd  # noqa: E402
+import i18n_json  # noqa: E402
+import i18n_watch  # noqa: E402
+from i18n_testsupport import MainRunMixin  # noqa: E402
+from i18n_watch import PollWatcher  # noqa: E402
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+class PollWatcherTests(unittest.TestCase):
+    def test_bursts_are_debounced_into_one_change_set(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        a, b = os.path.join(tmp.name, "a.json"), os.path.join(tmp.name, "b.json")
+        _write(a, {"k": 1})
+        now = [0.0]
+        # Schub: a bei t=1, b bei t=2 (neu), a erneut bei t=3 - danach Ruhe.
+        edits = {1.0: lambda: _write(a, {"k": 22}), 2.0: lambda: _write(b, {}), 3.0: lambda: _write(a, {"k": 333})}
+
+        def sleep(seconds):
+            now[0] += seconds
+            if now[0] in edits:
+                edits.pop(now[0])()
+
+        watcher = PollWatcher(lambda: [a, b], interval=1.0, debounce=2.0, clock=lambda: now[0], sleep=sleep)
+        self.assertEqual(watcher.wait(), {a, b})
+        self.assertEqual(now[0], 5.0, "erst nach 2 s Ruhe")
+        self.assertEqual(edits, {})
+
+
+class MainWatchTests(MainRunMixin, unittest.TestCase):
+    def test_changed_namespace_is_translated_incrementally_from_memory(self):
+        edited = os.path.join(self.base_path, "de", "a.json")
+        self.write_de({"x": "Eins", "y": "Zwei"}, ns="a")
+        self.write_de({"z": "Drei"}, ns="b")
+        misses = []
+
+        def fake_wait(watcher):
+            if misses:
+                raise KeyboardInterrupt
+            self.assertEqual(set(watcher._stamps), {edited, os.path.join(self.base_path, "de", "b.json")})
+            self.calls.clear()
+            misses.append(i18n_json.DOCUMENTS.stats["misses"])
+            self.write_de({"x": "Eins", "y": "Zwei neu"}, ns="a")
+            return {edited}
+
+        out = self.run_main("--full", "--watch", patches=[
+            mock.patch.object(i18n_watch.PollWatcher, "wait", autospec=True, side_effect=fake_wait),
+        ])
+
+        self.assertIn(f"🔁 Geändert: {os.path.join('de', 'a.json')} → a", out)
+        self.assertIn("👋 Watch-Modus beendet.", out)
+        # Folgelauf ist inkrementell (kein --full) und nur für Namespace a.
+        self.assertEqual(sorted(self.calls), sorted([("en", "Zwei neu")] + [(lang, "[en] Zwei neu") for lang in usd.TARGET_LANGS if lang != "en"]))
+        # Nur die bearbeitete Datei wird neu geparst, alles andere kommt aus dem Speicher.
+        self.assertEqual(i18n_json.DOCUMENTS.stats["misses"] - misses[0], 1)
+        self.assertEqual(self.read_lang("fr", ns="a"), {"x": "[fr] [en] Eins", "y": "[fr] [en] Zwei neu"})
+
+
+if __name__ == "__main__":
+    unittest.main()